@@ -93,6 +93,7 @@ class ProcessPdfJob < ApplicationJob
     end
 
     questions = processing_result[:questions]
+    images = caption_question_figures(pdf_path, questions)
 
     # 청킹 (10개씩)
     chunks = chunk_questions(questions, 10)
@@ -105,7 +106,7 @@ class ProcessPdfJob < ApplicationJob
         chunks: chunks.length,
         questions: questions,
         markdown: nil,
-        images: [],
+        images: images,
         metadata: processing_result[:metadata] || {},
         processed_at: Time.current,
         parser_version: 'python_algorithm_v2'
@@ -132,7 +133,7 @@ class ProcessPdfJob < ApplicationJob
           study_material: study_material,
           content: q[:content],
           options: q[:options],
-          answer: q[:answer],  # Will be nil (manual entry required)
+          answer: q[:answer],  # From the answer-key table (nil when the exam has no key)
           explanation: q[:explanation],  # Will be nil
           passage: q[:passage],
           question_number: q[:question_number],
@@ -222,6 +223,20 @@ class ProcessPdfJob < ApplicationJob
     questions.each_slice(chunk_size).to_a
   end
 
+  # 파서가 그림을 잘라낸 문제만 캡션 생성 (OpenAI 키가 없으면 캡션 없이 그림 정보만)
+  def caption_question_figures(pdf_path, questions)
+    figure_questions = questions.select { |q| q[:has_image] }
+    return [] if figure_questions.empty?
+    return ImageExtractionService.new(pdf_path).caption_figures(figure_questions) if ENV['OPENAI_API_KEY'].present?
+
+    figure_questions.flat_map do |q|
+      q.dig(:metadata, :figures).map { |figure| figure.merge(question_number: q[:question_number]) }
+    end
+  rescue StandardError => e
+    Rails.logger.warn("Figure captioning failed: #{e.message}")
+    []
+  end
+
   def extract_images_with_captions(pdf_path)
     begin
       image_service = ImageExtractionService.new(pdf_path)
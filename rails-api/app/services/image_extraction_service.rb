@@ -72,6 +72,30 @@ class ImageExtractionService
     end
   end
 
+  # 파이썬 파서가 잘라낸 문제 그림(metadata[:figures])에만 캡션 생성 - 페이지 전체를 래스터화하지 않음
+  # @param questions [Array<Hash>] PythonParserBridge가 변환한 문제 레코드
+  # @return [Array<Hash>] 그림별 문제 번호, 페이지, 경로, 캡션
+  def caption_figures(questions)
+    @extracted_images = questions.flat_map do |q|
+      (q.dig(:metadata, :figures) || []).filter_map do |figure|
+        next unless figure[:path].present? && File.exist?(figure[:path])
+
+        {
+          question_number: q[:question_number],
+          page_number: figure[:page],
+          bbox: figure[:bbox],
+          path: figure[:path],
+          filename: File.basename(figure[:path]),
+          extracted_at: Time.current
+        }
+      end
+    end
+
+    Rails.logger.info("[ImageExtraction] #{@extracted_images.length} figures from parsed questions")
+    generate_captions_for_images
+    @extracted_images
+  end
+
   # 추출된 이미지에 대해 GPT-4o로 캡션 생성
   def generate_captions_for_images
     @extracted_images.each do |image_data|
@@ -6,6 +6,27 @@ class PythonParserBridge
 
   PYTHON_PARSER_PATH = Rails.root.join('lib/python_parsers/exam_pdf_parser_v2.py')
   PYTHON_COMMAND = ENV.fetch('PYTHON_COMMAND', 'python3')
+  # Persistent parser server (lib/python_parsers/parser_server.py --socket ...)
+  # When the socket exists, requests go to warm workers instead of spawning python3
+  PARSER_SERVER_SOCKET = ENV['PYTHON_PARSER_SOCKET']
+  PARSER_SERVER_TIMEOUT = ENV.fetch('PYTHON_PARSER_TIMEOUT', 120).to_i
+  # One-off process output: 'ndjson' (streamed JSON lines) or 'msgpack'
+  # (binary, already Rails-shaped records - see lib/python_parsers/rails_interchange.py)
+  PARSER_OUTPUT_FORMAT = ENV.fetch('PYTHON_PARSER_FORMAT', 'ndjson')
+  MSGPACK_SCHEMA = 'certigraph.exam_questions'
+  MSGPACK_SCHEMA_VERSION = 1
+  # Answer-key table (lib/python_parsers/answer_key.py output); when the file exists the
+  # parser joins the official answers onto every question in one pass
+  ANSWER_KEY_PATH = ENV.fetch('PYTHON_PARSER_ANSWER_KEY',
+                              Rails.root.join('lib/python_parsers/answer_keys/social_worker_1.json').to_s)
+  # Local OCR backend for scanned pages (lib/python_parsers/ocr_fallback.py, e.g. 'tesseract');
+  # only pages with almost no text layer are sent, in a pool of PYTHON_PARSER_OCR_WORKERS processes
+  OCR_BACKEND = ENV['PYTHON_PARSER_OCR'].presence
+  OCR_WORKERS = ENV.fetch('PYTHON_PARSER_OCR_WORKERS', 1).to_i
+  # Cropped figure PNGs (lib/python_parsers/page_figures.py) - written only for questions
+  # that have a figure; paths come back in metadata[:figures]
+  FIGURES_DIR = ENV.fetch('PYTHON_PARSER_FIGURES_DIR', Rails.root.join('tmp/question_figures').to_s)
+  CHOICE_SYMBOLS = ["①", "②", "③", "④", "⑤"].freeze
 
   attr_reader :pdf_path, :result
 
@@ -25,8 +46,9 @@ class PythonParserBridge
   end
 
   # Parse PDF and return structured data
+  # @yield [Hash] each transformed question as it is parsed (optional)
   # @return [Hash] { success: Boolean, questions: Array, metadata: Hash }
-  def parse
+  def parse(&on_question)
     Rails.logger.info("🐍 Python Parser: Starting PDF parsing")
     Rails.logger.info("📄 PDF: #{File.basename(@pdf_path)}")
     Rails.logger.info("📊 File size: #{File.size(@pdf_path)} bytes")
@@ -34,22 +56,29 @@ class PythonParserBridge
     start_time = Time.current
 
     begin
-      # Execute Python parser
-      json_output = execute_python_parser
-
-      # Parse JSON result
-      parsed_data = JSON.parse(json_output, symbolize_names: true)
+      # Execute Python parser (persistent server if available, one-off process otherwise)
+      parsed_data = if self.class.parser_server_available?
+        request_parser_server.tap do |data|
+          transform_questions(data[:questions] || []).each { |q| on_question.call(q) } if on_question
+        end
+      elsif PARSER_OUTPUT_FORMAT == 'msgpack'
+        execute_python_parser_msgpack(&on_question)
+      else
+        execute_python_parser(&on_question)
+      end
 
       elapsed = (Time.current - start_time).round(2)
       Rails.logger.info("✅ Python Parser: Completed in #{elapsed}s")
       Rails.logger.info("📝 Questions extracted: #{parsed_data.dig(:questions)&.size || 0}")
+      log_parser_metrics(parsed_data[:metrics], elapsed)
 
       @result = {
         success: true,
-        questions: transform_questions(parsed_data[:questions] || []),
+        questions: parsed_data[:rails_records] ? parsed_data[:questions] : transform_questions(parsed_data[:questions] || []),
         metadata: {
           exam_info: parsed_data[:exam_info] || {},
           processing_time: elapsed,
+          parser_metrics: parsed_data[:metrics],
           parser_version: 'v2',
           total_questions: parsed_data.dig(:questions)&.size || 0
         }
@@ -85,7 +114,7 @@ class PythonParserBridge
   end
 
   # Check if Python and dependencies are available
-  # @return [Hash] { available: Boolean, python_version: String, pdfplumber: Boolean }
+  # @return [Hash] { available: Boolean, python_version: String, pdfplumber: Boolean, parser_server: Boolean }
   def self.check_dependencies
     python_version = `#{PYTHON_COMMAND} --version 2>&1`.strip
     python_available = $?.success?
@@ -97,62 +126,209 @@ class PythonParserBridge
       available: python_available && pdfplumber_available,
       python_version: python_available ? python_version : 'Not found',
       pdfplumber: pdfplumber_available ? pdfplumber_check : 'Not installed',
-      parser_exists: File.exist?(PYTHON_PARSER_PATH)
+      parser_exists: File.exist?(PYTHON_PARSER_PATH),
+      parser_server: parser_server_available?
     }
   end
 
+  # Check if the persistent parser server socket is up
+  # @return [Boolean]
+  def self.parser_server_available?
+    PARSER_SERVER_SOCKET.present? && File.socket?(PARSER_SERVER_SOCKET)
+  end
+
   private
 
-  def execute_python_parser
+  # Send one JSON-lines request to the persistent parser server
+  # @return [Hash] same structure as ExamPDFParser#to_json
+  def request_parser_server
+    require 'socket'
+    require 'io/wait'
+    require 'json'
+    require 'securerandom'
+
+    request_id = SecureRandom.uuid
+    response_line = nil
+
+    UNIXSocket.open(PARSER_SERVER_SOCKET) do |socket|
+      options = { trace: true, figures_dir: FIGURES_DIR }
+      options[:answer_key] = ANSWER_KEY_PATH if answer_key_available?
+      options.merge!(ocr: OCR_BACKEND, ocr_workers: OCR_WORKERS) if OCR_BACKEND
+      socket.write({ id: request_id, pdf_path: File.expand_path(@pdf_path), options: options }.to_json + "\n")
+      socket.close_write
+
+      deadline = Process.clock_gettime(Process::CLOCK_MONOTONIC) + PARSER_SERVER_TIMEOUT
+      response_line = read_line_before(socket, deadline)
+    end
+
+    if response_line.blank?
+      raise PythonExecutionError, "Parser server returned no output"
+    end
+
+    response = JSON.parse(response_line, symbolize_names: true)
+
+    unless response[:ok]
+      raise PythonExecutionError, "Parser server failed: #{response[:error]}"
+    end
+
+    response[:result]
+  end
+
+  # Read one response line from the parser server; the deadline covers the whole
+  # line, so a server that stalls after the first bytes still times out
+  # @return [String] the line (with its newline), or what arrived before EOF
+  def read_line_before(socket, deadline)
+    buffer = String.new   # binary until the full line is in
+    loop do
+      remaining = deadline - Process.clock_gettime(Process::CLOCK_MONOTONIC)
+      unless remaining.positive? && socket.wait_readable(remaining)
+        raise PythonExecutionError, "Parser server timed out after #{PARSER_SERVER_TIMEOUT}s"
+      end
+
+      chunk = socket.read_nonblock(65_536, exception: false)
+      next if chunk == :wait_readable
+      break if chunk.nil?
+
+      buffer << chunk
+      newline = buffer.index("\n")
+      return buffer[0..newline].force_encoding(Encoding::UTF_8) if newline
+    end
+    buffer.force_encoding(Encoding::UTF_8)
+  end
+
+  # Run the parser in a one-off process and read its NDJSON stream
+  # (exam_info -> one question per line -> end) as questions are produced
+  # @yield [Hash] each question in Rails shape as soon as its line arrives
+  # @return [Hash] same structure as ExamPDFParser#to_json
+  def execute_python_parser(&on_question)
     require 'open3'
     require 'json'
-    require 'tempfile'
 
-    # Create temporary output file for JSON
-    output_file = Tempfile.new(['parser_output', '.json'])
+    python_script = <<~PYTHON
+      import sys
+      sys.path.insert(0, '#{File.dirname(PYTHON_PARSER_PATH)}')
+      from exam_pdf_parser_v2 import ExamPDFParser
 
-    begin
-      # Prepare Python script that outputs JSON to stdout
-      python_script = <<~PYTHON
-        import sys
-        import json
-        sys.path.insert(0, '#{File.dirname(PYTHON_PARSER_PATH)}')
-        from exam_pdf_parser_v2 import ExamPDFParser
-
-        parser = ExamPDFParser('#{@pdf_path}')
-        parser.extract_text()
-        parser.identify_sections()
-        questions = parser.parse_questions()
-
-        # Convert to JSON
-        json_str = parser.to_json()
-        print(json_str)
-      PYTHON
-
-      # Execute Python with script via stdin
-      stdout, stderr, status = Open3.capture3(
-        PYTHON_COMMAND,
-        '-c',
-        python_script,
-        stdin_data: ''
-      )
+      parser = ExamPDFParser('#{@pdf_path}', trace=True#{parser_arguments})
+      parser.write_ndjson(sys.stdout, compact=True)
+    PYTHON
 
-      unless status.success?
-        error_message = stderr.presence || stdout
-        Rails.logger.error("Python stderr: #{stderr}") if stderr.present?
-        Rails.logger.error("Python stdout: #{stdout}") if stdout.present?
-        raise PythonExecutionError, "Python execution failed: #{error_message}"
+    parsed_data = { exam_info: {}, questions: [] }
+    finished = false
+
+    Open3.popen3(PYTHON_COMMAND, '-c', python_script) do |stdin, stdout, stderr, wait_thr|
+      stdin.close
+      stdout.set_encoding(Encoding::UTF_8)
+      stderr_reader = Thread.new { stderr.read }
+
+      stdout.each_line do |line|
+        next if line.blank?
+
+        record = JSON.parse(line, symbolize_names: true)
+        case record[:type]
+        when 'exam_info'
+          parsed_data[:exam_info] = record[:exam_info]
+        when 'question'
+          parsed_data[:questions] << record[:question]
+          on_question&.call(transform_questions([record[:question]]).first)
+        when 'end'
+          parsed_data[:exam_info] = parsed_data[:exam_info].merge(
+            total_questions: record[:total_questions],
+            sections: record[:sections]
+          )
+          parsed_data[:metrics] = record[:metrics]
+          finished = true
+        end
       end
 
-      if stdout.blank?
-        raise PythonExecutionError, "Python parser returned no output"
+      stderr_output = stderr_reader.value
+      status = wait_thr.value
+
+      unless status.success?
+        Rails.logger.error("Python stderr: #{stderr_output}") if stderr_output.present?
+        raise PythonExecutionError, "Python execution failed: #{stderr_output.presence || status}"
       end
+    end
 
-      stdout
-    ensure
-      output_file.close
-      output_file.unlink
+    unless finished
+      raise PythonExecutionError, "Python parser returned no output"
     end
+
+    parsed_data
+  end
+
+  # Run the parser in a one-off process that writes one MessagePack payload
+  # whose questions are already in Rails shape, so no transform pass is needed
+  # @return [Hash] { exam_info:, questions:, metrics:, rails_records: true }
+  def execute_python_parser_msgpack(&on_question)
+    require 'open3'
+    require 'msgpack'
+
+    python_script = <<~PYTHON
+      import sys
+      sys.path.insert(0, '#{File.dirname(PYTHON_PARSER_PATH)}')
+      from exam_pdf_parser_v2 import ExamPDFParser
+      from rails_interchange import write_msgpack
+
+      write_msgpack(ExamPDFParser('#{@pdf_path}', trace=True#{parser_arguments}), sys.stdout.buffer)
+    PYTHON
+
+    stdout, stderr, status = Open3.capture3(PYTHON_COMMAND, '-c', python_script, stdin_data: '', binmode: true)
+
+    unless status.success?
+      Rails.logger.error("Python stderr: #{stderr}") if stderr.present?
+      raise PythonExecutionError, "Python execution failed: #{stderr.presence || status}"
+    end
+
+    if stdout.blank?
+      raise PythonExecutionError, "Python parser returned no output"
+    end
+
+    payload = MessagePack.unpack(stdout, symbolize_keys: true)
+    unless payload[:schema] == MSGPACK_SCHEMA && payload[:version] == MSGPACK_SCHEMA_VERSION
+      raise PythonExecutionError, "Unsupported parser payload: #{payload[:schema]} v#{payload[:version]}"
+    end
+
+    questions = payload[:questions].map do |q|
+      # Option keys are ①-⑤ strings, as transform_questions produces
+      q.merge(options: q[:options].transform_keys(&:to_s))
+    end
+    questions.each { |q| on_question.call(q) } if on_question
+
+    {
+      exam_info: payload[:exam_info] || {},
+      questions: questions,
+      metrics: payload[:metrics],
+      rails_records: true
+    }
+  end
+
+  def answer_key_available?
+    File.exist?(ANSWER_KEY_PATH)
+  end
+
+  # Extra ExamPDFParser keyword arguments: figure directory, answer-key table and OCR backend
+  def parser_arguments
+    arguments = ", figures_dir=#{FIGURES_DIR.inspect}"
+    arguments += ", answer_key=#{ANSWER_KEY_PATH.inspect}" if answer_key_available?
+    arguments += ", ocr=#{OCR_BACKEND.inspect}, ocr_workers=#{OCR_WORKERS}" if OCR_BACKEND
+    arguments
+  end
+
+  # Log per-stage parser timings and publish them for aggregation
+  # Subscribe with ActiveSupport::Notifications.subscribe('parse.python_parser')
+  def log_parser_metrics(metrics, elapsed)
+    return if metrics.blank?
+
+    stages = (metrics[:stages] || {}).map { |name, stage| "#{name}=#{stage[:seconds].round(3)}s" }
+    Rails.logger.info("⏱️ Python Parser stages: #{stages.join(' ')}")
+    Rails.logger.info("🔢 Python Parser counts: #{(metrics[:counts] || {}).map { |k, v| "#{k}=#{v}" }.join(' ')}")
+
+    ActiveSupport::Notifications.instrument('parse.python_parser',
+      pdf: File.basename(@pdf_path),
+      processing_time: elapsed,
+      metrics: metrics
+    )
   end
 
   def transform_questions(python_questions)
@@ -164,7 +340,7 @@ class PythonParserBridge
       if q[:choices].present?
         q[:choices].each do |choice|
           # choice: { number: 1, text: "답안 텍스트" }
-          option_key = ["①", "②", "③", "④", "⑤"][choice[:number] - 1]
+          option_key = CHOICE_SYMBOLS[choice[:number] - 1]
           options_hash[option_key] = choice[:text]
         end
       end
@@ -185,18 +361,21 @@ class PythonParserBridge
         question_number: q[:number],
         content: q[:question],
         options: options_hash,
-        answer: nil,  # Python parser cannot extract answers
+        # Joined from the answer-key table: [3] -> "③", multiple accepted answers -> "①,⑤"
+        answer: q[:answer].present? ? q[:answer].map { |n| CHOICE_SYMBOLS[n - 1] }.join(',') : nil,
         explanation: nil,  # Python parser cannot extract explanations
         passage: passage_text,
         topic: q[:section],
         difficulty: nil,
         has_table: q[:table].present?,
-        has_image: false,  # TODO: Detect images
+        has_image: q[:figures].present?,
         metadata: {
           section: q[:section],
           table: q[:table],
           passage_items: q[:passage]&.size || 0,
-          choices_count: q[:choices]&.size || 0
+          choices_count: q[:choices]&.size || 0,
+          # [{ page:, bbox: [x0, top, x1, bottom], kind: 'image' | 'drawing', path: }] - figure questions only
+          **(q[:figures].present? ? { figures: q[:figures] } : {})
         }
       }
     end
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+정답표(최종정답 PDF) 파서 + 문제 일괄 결합
+
+공단의 최종정답 PDF는 교시/형별 정답 격자가 화면 캡처 이미지로만 들어 있고 텍스트가 없다.
+격자는 회색 번호 칸과 흰 정답 칸이 번갈아 놓인 표이므로, 이미지마다
+  1. 회색 칸의 가로/세로 구간으로 행과 열을 찾고
+  2. 번호 칸의 숫자(위치로 값을 알 수 있음)를 잘라 숫자 견본을 만든 뒤
+  3. 정답 칸의 글자를 가장 가까운 견본으로 읽는다 (쉼표로 나뉜 복수 정답 포함)
+격자 위 "N교시 A형" 줄도 같은 견본으로 교시를 읽고, A/B는 글자 왼쪽 세로획으로 가린다.
+OCR 엔진 없이 NumPy 배열 연산과 Pillow(이미지 디코딩/축소)만 쓴다.
+
+결과는 (회차, 교시, 형별) -> 문제당 1바이트 정답 비트마스크(① = 1, ② = 2, ③ = 4 ...)인
+AnswerKey로 모으고, JSON으로 저장해 파서에 넘기면 to_json/NDJSON/MessagePack 출력의
+문제마다 정답이 한 번에 결합된다.
+
+    python3 answer_key.py ../../../sample-data/*정답*.pdf -o answers.json
+    python3 exam_pdf_parser_v2.py exam.pdf --answers answers.json
+"""
+
+import io
+import re
+import sys
+import json
+import hashlib
+import argparse
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pdfplumber
+from PIL import Image
+
+from exam_pdf_parser_v2 import CHOICE_SYMBOLS
+
+# 회색 번호 칸 밝기 범위와 무채색 판정 (채널 최대-최소 차)
+SHADE_RANGE = (172, 214)
+NEUTRAL = 30
+# 글자로 볼 잉크 농도 (칸 배경 대비 0~1)
+INK_THRESHOLD = 0.3
+# 글자 견본 크기 (가로, 세로)
+GLYPH_SIZE = (8, 12)
+# 견본과의 거리가 이보다 크면 읽지 못한 것으로 본다
+MAX_GLYPH_DISTANCE = 3.0
+# 쉼표 판정 - 칸에서 가장 큰 글자 높이 대비 비율
+COMMA_HEIGHT = 0.6
+
+KeyId = Tuple[int, str, str]   # (회차, 교시, 형별)
+Box = Tuple[int, int, int, int]  # (x0, x1, y0, y1)
+
+# 비트마스크 -> 정답 번호 목록 / 기호 ("①,⑤")
+_CHOICES = [[n + 1 for n in range(len(CHOICE_SYMBOLS)) if mask >> n & 1] or None
+            for mask in range(1 << len(CHOICE_SYMBOLS))]
+_SYMBOLS = [','.join(CHOICE_SYMBOLS[n - 1] for n in choices) if choices else None for choices in _CHOICES]
+
+
+def answer_mask(choices: List[int]) -> int:
+    mask = 0
+    for n in choices:
+        if not 1 <= n <= len(CHOICE_SYMBOLS):
+            raise ValueError(f"정답 번호 범위 밖: {n}")
+        mask |= 1 << (n - 1)
+    return mask
+
+
+def answer_choices(mask: int) -> Optional[List[int]]:
+    return _CHOICES[mask]
+
+
+class AnswerKey:
+    """(회차, 교시, 형별) -> 문제 번호 순서의 정답 비트마스크 (bytes, 0 = 정답 없음)"""
+
+    def __init__(self):
+        self.rows: Dict[KeyId, bytes] = {}
+
+    def add(self, round_no: int, session: str, exam_type: str, answers: List[List[int]]) -> None:
+        self.rows[(int(round_no), session, exam_type)] = bytes(answer_mask(a) for a in answers)
+
+    def row(self, exam_info: Dict) -> Optional[bytes]:
+        """exam_info(round/subject/type)에 해당하는 정답 행 - 없으면 None"""
+        try:
+            return self.rows.get((int(exam_info['round']), exam_info['subject'], exam_info['type']))
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def fingerprint(self) -> str:
+        """캐시 키용 - 정답 내용이 바뀌면 달라짐"""
+        digest = hashlib.sha256()
+        for key in sorted(self.rows):
+            digest.update(repr(key).encode('utf-8') + self.rows[key])
+        return digest.hexdigest()[:16]
+
+    def to_dict(self) -> Dict:
+        """사람이 고칠 수 있는 형식 - 문제마다 공백 구분, 복수 정답은 쉼표 ("1 3 1,5 ...")"""
+        return {'version': 1, 'keys': [
+            {'round': r, 'session': s, 'type': t,
+             'answers': ' '.join(','.join(map(str, _CHOICES[m] or [0])) for m in row)}
+            for (r, s, t), row in sorted(self.rows.items())
+        ]}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'AnswerKey':
+        key = cls()
+        for entry in data.get('keys', []):
+            answers = [[int(n) for n in item.split(',') if n != '0'] for item in entry['answers'].split()]
+            key.add(entry['round'], entry['session'], entry['type'], answers)
+        return key
+
+    def save(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> 'AnswerKey':
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    def update(self, other: 'AnswerKey') -> None:
+        self.rows.update(other.rows)
+
+
+def join_answers(records: List[Dict], row: Optional[bytes], number_field: str = 'number',
+                 field: str = 'answer', symbols: bool = False) -> int:
+    """
+    문제 dict 목록에 정답을 한 번에 결합 - 정답이 붙은 문제 수 반환
+
+    번호 배열로 정답 행을 한 번에 인덱싱하므로 문제마다 조회하지 않는다.
+    symbols=True면 Rails 보기 키 형식("③", 복수 정답은 "①,⑤"), 아니면 번호 목록([3]).
+    """
+    if not records:
+        return 0
+    decode = _SYMBOLS if symbols else _CHOICES
+    if not row:
+        for record in records:
+            record[field] = None
+        return 0
+
+    masks = np.frombuffer(row + b'\0', dtype=np.uint8)   # 마지막 0: 행 밖의 번호
+    numbers = np.fromiter((r[number_field] for r in records), dtype=np.int64, count=len(records))
+    index = np.where((numbers >= 1) & (numbers <= len(row)), numbers - 1, len(row))
+    found = masks[index]
+    for record, mask in zip(records, found.tolist()):
+        record[field] = decode[mask]
+    return int(np.count_nonzero(found))
+
+
+# --- 격자 이미지 읽기 ---
+
+def _runs(mask: np.ndarray, min_len: int = 1) -> List[Tuple[int, int]]:
+    """True가 연속된 구간 [시작, 끝) 목록"""
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.astype(int), [0]))))
+    return [(int(a), int(b)) for a, b in zip(edges[0::2], edges[1::2]) if b - a >= min_len]
+
+
+def _glyph_boxes(ink: np.ndarray) -> List[Box]:
+    """세로로 잉크가 없는 열을 경계로 자른 글자 박스 (왼쪽부터)"""
+    boxes = []
+    for x0, x1 in _runs(ink.any(axis=0)):
+        ys = np.flatnonzero(ink[:, x0:x1].any(axis=1))
+        boxes.append((x0, x1, int(ys[0]), int(ys[-1]) + 1))
+    return boxes
+
+
+def _cell_ink(gray: np.ndarray) -> np.ndarray:
+    """칸 배경(중앙값) 대비 잉크 농도 0~1 - 회색/흰 칸의 글자를 같은 척도로"""
+    background = float(np.median(gray))
+    return np.clip((background - gray) / max(background * 0.8, 1.0), 0, 1)
+
+
+def _glyph_feature(ink: np.ndarray, box: Box) -> np.ndarray:
+    x0, x1, y0, y1 = box
+    crop = Image.fromarray((ink[y0:y1, x0:x1] * 255).astype(np.uint8)).resize(GLYPH_SIZE, Image.BILINEAR)
+    return np.concatenate([np.asarray(crop, dtype=float).ravel() / 255, [(x1 - x0) / (y1 - y0)]])
+
+
+class _Digits:
+    """번호 칸에서 모은 숫자 견본 - 최근접 견본으로 분류"""
+
+    def __init__(self, labels: List[int], features: List[np.ndarray]):
+        self.labels = np.array(labels)
+        self.features = np.array(features)
+
+    def classify(self, ink: np.ndarray, box: Box) -> Tuple[int, float]:
+        distances = ((self.features - _glyph_feature(ink, box)) ** 2).sum(axis=1)
+        best = int(distances.argmin())
+        return int(self.labels[best]), float(distances[best])
+
+
+def read_grid(rgb: np.ndarray) -> Tuple[str, str, List[List[int]]]:
+    """
+    정답 격자 이미지 (h, w, 3) -> (교시, 형별, 문제 번호 순서의 정답 목록)
+
+    Raises:
+        ValueError: 격자가 아니거나 읽지 못한 칸/머리글이 있는 경우
+    """
+    rgb = rgb.astype(int)
+    gray = rgb.mean(axis=2)
+    neutral = (rgb.max(axis=2) - rgb.min(axis=2)) < NEUTRAL
+    shade = neutral & (gray >= SHADE_RANGE[0]) & (gray <= SHADE_RANGE[1])
+
+    column_share = shade.mean(axis=0)
+    columns = _runs(column_share > 0.5 * column_share.max(), 8) if column_share.max() else []
+    in_columns = np.zeros(gray.shape[1], dtype=bool)
+    for x0, x1 in columns:
+        in_columns[x0:x1] = True
+    rows = _runs(shade[:, in_columns].mean(axis=1) > 0.5, 6) if columns else []
+    if len(columns) < 2 or not rows:
+        raise ValueError("정답 격자를 찾지 못했습니다")
+
+    # 세로 괘선 - 마지막 정답 칸의 오른쪽 끝
+    grid = gray[rows[0][0]:rows[-1][1]]
+    lines = np.flatnonzero((grid < 240).mean(axis=0) > 0.8)
+
+    labels, features, cells = [], [], []
+    for r, (y0, y1) in enumerate(rows):
+        for c, (x0, x1) in enumerate(columns):
+            number = r * len(columns) + c + 1
+            ink = _cell_ink(gray[y0 + 2:y1 - 2, x0 + 2:x1 - 2])
+            boxes = _glyph_boxes(ink > INK_THRESHOLD)
+            if len(boxes) != len(str(number)):
+                raise ValueError(f"{number}번 번호 칸을 읽지 못했습니다")
+            for digit, box in zip(str(number), boxes):
+                labels.append(int(digit))
+                features.append(_glyph_feature(ink, box))
+
+            if c + 1 < len(columns):
+                right = columns[c + 1][0]
+            else:
+                after = lines[lines > x1 + 2]
+                right = int(after[0]) if len(after) else gray.shape[1]
+            cells.append((number, gray[y0 + 2:y1 - 2, x1 + 2:right - 2]))
+
+    digits = _Digits(labels, features)
+    answers = [_read_answer(number, cell, digits) for number, cell in cells]
+    session, exam_type = _read_header(gray, neutral, columns, rows[0][0], digits)
+    return session, exam_type, answers
+
+
+def _read_answer(number: int, cell: np.ndarray, digits: _Digits) -> List[int]:
+    ink = _cell_ink(cell)
+    boxes = _glyph_boxes(ink > INK_THRESHOLD)
+    if not boxes:
+        raise ValueError(f"{number}번 정답 칸이 비어 있습니다")
+
+    height = max(y1 - y0 for _, _, y0, y1 in boxes)
+    choices = []
+    for box in boxes:
+        if box[3] - box[2] < COMMA_HEIGHT * height:
+            continue   # 쉼표
+        digit, distance = digits.classify(ink, box)
+        if distance > MAX_GLYPH_DISTANCE or not 1 <= digit <= len(CHOICE_SYMBOLS):
+            raise ValueError(f"{number}번 정답을 읽지 못했습니다")
+        choices.append(digit)
+    return choices
+
+
+def _read_header(gray: np.ndarray, neutral: np.ndarray, columns: List[Tuple[int, int]], top: int,
+                 digits: _Digits) -> Tuple[str, str]:
+    """격자 위 두 번째 줄("N교시 A형", 마지막 줄은 과목명)에서 교시 숫자와 형별"""
+    ink = (gray[:top - 1] < 128) & neutral[:top - 1]
+    ink[:, ink.mean(axis=0) > 0.5] = False          # 창 테두리 같은 세로선
+    ink[:, :max(columns[0][0] - 6, 0)] = False
+    ink[:, columns[-1][1] + 60:] = False
+
+    lines = _runs(ink.any(axis=1), 3)
+    if len(lines) < 2:
+        raise ValueError("교시/형별 머리글을 찾지 못했습니다")
+    y0, y1 = lines[-2]
+    line = ink[y0:y1]
+    boxes = _glyph_boxes(line)
+    if len(boxes) < 3:
+        raise ValueError("교시/형별 머리글을 찾지 못했습니다")
+
+    session, distance = digits.classify(line.astype(float), boxes[0])
+    if distance > MAX_GLYPH_DISTANCE:
+        raise ValueError("교시 번호를 읽지 못했습니다")
+
+    # 형별 글자는 가장 넓은 공백 다음 글자 - B는 왼쪽 세로획이 위아래로 이어짐
+    gaps = [boxes[i + 1][0] - boxes[i][1] for i in range(len(boxes) - 1)]
+    x0, x1, gy0, gy1 = boxes[int(np.argmax(gaps)) + 1]
+    left_stroke = line[gy0:gy1, x0:x0 + 2].any(axis=1).mean()
+    return f"{session}교시", 'B형' if left_stroke > 0.85 else 'A형'
+
+
+def page_images(page) -> Iterator[np.ndarray]:
+    """페이지에 들어 있는 RGB 이미지를 위에서 아래 순서로 (h, w, 3) 배열로"""
+    for image in sorted(page.images, key=lambda im: (im['top'], im['x0'])):
+        stream = image['stream']
+        width, height = (int(v) for v in image['srcsize'])
+        filters = [getattr(name, 'name', name) for name, _ in stream.get_filters()]
+        data = stream.get_data()
+        if 'DCTDecode' in filters:
+            yield np.asarray(Image.open(io.BytesIO(data)).convert('RGB'))
+        elif len(data) == width * height * 3:
+            yield np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3)
+        elif len(data) == width * height:
+            yield np.repeat(np.frombuffer(data, dtype=np.uint8).reshape(height, width, 1), 3, axis=2)
+
+
+def parse_answer_pdf(pdf_path: str, round_no: Optional[int] = None) -> AnswerKey:
+    """
+    최종정답 PDF의 모든 격자 이미지를 읽어 AnswerKey로
+
+    회차는 첫 페이지 제목 -> 파일 이름 순서로 "제N회"를 찾는다 (round_no로 지정 가능).
+    """
+    key = AnswerKey()
+    with pdfplumber.open(pdf_path) as pdf:
+        if round_no is None:
+            title = (pdf.pages[0].extract_text() or '') if pdf.pages else ''
+            match = re.search(r'제\s*(\d+)\s*회', title) or re.search(r'제\s*(\d+)\s*회', Path(pdf_path).name)
+            if not match:
+                raise ValueError(f"회차를 알 수 없습니다: {pdf_path}")
+            round_no = int(match.group(1))
+
+        for page in pdf.pages:
+            for rgb in page_images(page):
+                session, exam_type, answers = read_grid(rgb)
+                key.add(round_no, session, exam_type, answers)
+    return key
+
+
+def main():
+    from batch_parser import collect_inputs
+
+    arg_parser = argparse.ArgumentParser(description='최종정답 PDF -> 정답표 JSON')
+    arg_parser.add_argument('inputs', nargs='+', help='정답 PDF 파일, 디렉터리 또는 glob 패턴')
+    arg_parser.add_argument('-o', '--output', default='answers.json', help='정답표 JSON 경로 (있으면 합침)')
+    arg_parser.add_argument('--round', type=int, default=None, help='회차 (기본: 제목/파일 이름에서)')
+    args = arg_parser.parse_args()
+
+    key = AnswerKey.load(args.output) if Path(args.output).exists() else AnswerKey()
+    for pdf_path in collect_inputs(args.inputs):
+        try:
+            parsed = parse_answer_pdf(str(pdf_path), args.round)
+        except ValueError as e:
+            print(f"  실패: {pdf_path.name} ({e})", file=sys.stderr)
+            continue
+        key.update(parsed)
+        print(f"  {pdf_path.name}: " + ', '.join(f"{r}회 {s} {t}({len(row)}문제)"
+                                                 for (r, s, t), row in sorted(parsed.rows.items())))
+
+    key.save(args.output)
+    print(f"\n정답표 {len(key)}개 -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
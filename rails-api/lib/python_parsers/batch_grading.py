@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+응시 답안 일괄 채점
+
+ExamGradingService(Ruby)는 응시 하나마다 답안 레코드를 돌며 채점하므로 모의고사 응시자
+전체를 채점하면 ORM 왕복이 수천 번 생긴다. 여기서는 답안을 (응시 × 문제) 행렬 하나로 받아
+정답 비트마스크(answer_key.AnswerKey 행, ① = 1, ② = 2 ...)와 한 번에 비교한다.
+
+    정답 여부   (1 << (답 - 1)) & 정답 마스크   - 복수 정답도 그대로
+    과목 점수   정답 행렬 @ (문제 × 과목) 배점 행렬
+    합격 여부   전체 백분율 ≥ 60, 과목(교시)마다 ≥ 40 (CutoffRule로 바꿈)
+    문항 정답률 정답 행렬의 열 평균 (p-value)
+
+답 0은 무응답. 정답 마스크가 0인 문제(정답 없음)는 채점하지 않는다(배점 0, p-value NaN).
+
+    python3 batch_grading.py attempts.json --answers answers.json --round 19 --session 3교시 --type A형
+"""
+
+import sys
+import json
+import argparse
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+NUM_CHOICES = 5
+Section = Tuple[int, int, str]   # (시작 번호, 끝 번호, 이름) - 번호는 1부터, 끝 포함
+
+
+def _round(values: np.ndarray, digits: int) -> np.ndarray:
+    """Ruby Float#round와 같은 사사오입 (np.round는 짝수 쪽으로 맞춤)"""
+    scale = 10.0 ** digits
+    return np.floor(values * scale + 0.5) / scale
+
+
+def _percent(earned: np.ndarray, possible: np.ndarray) -> np.ndarray:
+    """백분율 - 배점이 0이면 0 (문제 없는 시험/과목)"""
+    possible = np.broadcast_to(possible, earned.shape)
+    out = np.zeros(earned.shape)
+    np.divide(earned * 100.0, possible, out=out, where=possible > 0)
+    return out
+
+
+def subject_of(section: str) -> str:
+    """구간 이름의 과목 - "사회복지정책과 제도(사회복지정책론)" -> "사회복지정책과 제도" """
+    return section.split('(', 1)[0].strip() or section
+
+
+@dataclass(frozen=True)
+class CutoffRule:
+    """합격 기준 (백분율) - 사회복지사 1급: 매 과목 4할 이상, 전 과목 총점 6할 이상"""
+    total: float = 60.0
+    subject: float = 40.0
+
+
+@dataclass
+class GradeResult:
+    """일괄 채점 결과 - 행은 응시, 열은 문제/구간/과목"""
+    correct: np.ndarray          # (응시,) 맞힌 문제 수
+    wrong: np.ndarray            # (응시,) 틀린 문제 수
+    unanswered: np.ndarray       # (응시,) 무응답 수
+    points: np.ndarray           # (응시,) 얻은 점수
+    scores: np.ndarray           # (응시,) 백분율 (소수 둘째 자리)
+    sections: List[str]
+    section_correct: np.ndarray  # (응시, 구간)
+    section_scores: np.ndarray   # (응시, 구간) 백분율 (소수 첫째 자리)
+    subjects: List[str]
+    subject_scores: np.ndarray   # (응시, 과목) 백분율 (소수 둘째 자리)
+    passed: np.ndarray           # (응시,) bool
+    p_values: np.ndarray         # (문제,) 문항 정답률, 채점하지 않는 문제는 NaN
+
+    def to_records(self, ids: Optional[Sequence] = None) -> List[Dict]:
+        """응시별 dict 목록 (ExamGradingService 결과와 같은 키)"""
+        ids = list(range(len(self.scores))) if ids is None else list(ids)
+        records = []
+        for i, attempt_id in enumerate(ids):
+            records.append({
+                'id': attempt_id,
+                'correct_count': int(self.correct[i]),
+                'wrong_count': int(self.wrong[i]),
+                'unanswered_count': int(self.unanswered[i]),
+                'score': float(self.scores[i]),
+                'passed': bool(self.passed[i]),
+                'section_stats': {name: {'correct': int(self.section_correct[i, j]),
+                                         'accuracy': float(self.section_scores[i, j])}
+                                  for j, name in enumerate(self.sections)},
+                'subject_scores': {name: float(self.subject_scores[i, j]) for j, name in enumerate(self.subjects)},
+            })
+        return records
+
+    def item_stats(self) -> List[Dict]:
+        """문제별 정답률 (번호는 1부터, 채점하지 않는 문제는 None)"""
+        return [{'number': n + 1, 'p_value': None if np.isnan(p) else round(float(p), 4)}
+                for n, p in enumerate(self.p_values.tolist())]
+
+
+class BatchGrader:
+    """
+    정답 행 하나(또는 여러 교시를 이은 행)에 대한 채점기
+
+    masks: 문제마다 정답 비트마스크 (bytes 또는 정수 배열), sections: 구간 목록
+    (없으면 전체가 한 구간), points: 문제별 배점 (기본 1점).
+    """
+
+    def __init__(self, masks, sections: Optional[Sequence[Section]] = None,
+                 points: Optional[Sequence[float]] = None, num_choices: int = NUM_CHOICES,
+                 cutoff: CutoffRule = CutoffRule()):
+        if isinstance(masks, (bytes, bytearray)):
+            masks = np.frombuffer(bytes(masks), dtype=np.uint8)
+        self.masks = np.asarray(masks, dtype=np.int64)
+        if self.masks.ndim != 1 or np.any((self.masks < 0) | (self.masks >= 1 << num_choices)):
+            raise ValueError(f"정답 마스크는 0 ~ {(1 << num_choices) - 1} 범위의 1차원 배열이어야 합니다")
+        count = len(self.masks)
+        self.num_choices = num_choices
+        self.cutoff = cutoff
+
+        weights = np.ones(count) if points is None else np.asarray(points, dtype=np.float64)
+        if weights.shape != (count,):
+            raise ValueError(f"배점 수({weights.size})가 문제 수({count})와 다릅니다")
+        self.graded = self.masks > 0
+        self.weights = np.where(self.graded, weights, 0.0)
+
+        sections = list(sections) if sections else [(1, count, '전체')]
+        self.sections = [name for _, _, name in sections]
+        self.subjects = list(dict.fromkeys(subject_of(name) for name in self.sections))
+
+        # (문제 × 구간) 소속 행렬, (구간 × 과목) 소속 행렬 - 과목 점수는 행렬곱 한 번
+        self.membership = np.zeros((count, len(sections)))
+        for j, (start, end, name) in enumerate(sections):
+            if not 1 <= start <= end <= count:
+                raise ValueError(f"구간 {name}({start}~{end})이 문제 범위(1~{count})를 벗어납니다")
+            self.membership[start - 1:end, j] = 1.0
+        self.section_subject = np.zeros((len(sections), len(self.subjects)))
+        for j, name in enumerate(self.sections):
+            self.section_subject[j, self.subjects.index(subject_of(name))] = 1.0
+
+        self.section_points = self.weights @ self.membership
+        self.subject_points = self.section_points @ self.section_subject
+        self.max_points = float(self.weights.sum())
+
+    @classmethod
+    def from_answer_key(cls, answer_key, exam_infos: Sequence[Dict], registry=None, **kwargs) -> 'BatchGrader':
+        """
+        AnswerKey에서 교시 여러 개를 이은 채점기 (모의고사 전 교시를 한 행렬로)
+        exam_info마다 round/subject/type, 구간은 exam_info['profile'] 또는 교시가 같은 프로필에서.
+        """
+        from exam_profiles import get_registry
+
+        registry = registry or get_registry()
+        rows, sections = [], []
+        for info in exam_infos:
+            row = answer_key.row(info)
+            if row is None:
+                raise ValueError(f"정답표에 없는 시험: {info.get('round')}회 {info.get('subject')} {info.get('type')}")
+            profile = registry.by_id.get(info.get('profile')) or next(
+                (p for p in registry.profiles if p.subject == info.get('subject')), None)
+            offset = sum(len(r) for r in rows)
+            part = profile.sections if profile else [(1, len(row), info.get('subject') or '전체')]
+            sections.extend((offset + start, offset + min(end, len(row)), name)
+                            for start, end, name in part if start <= len(row))
+            rows.append(row)
+        return cls(b''.join(rows), sections, **kwargs)
+
+    def check_answers(self, answers) -> np.ndarray:
+        """답안 행렬 검증 - (응시 × 문제) 정수, 0(무응답) ~ num_choices"""
+        answers = np.asarray(answers)
+        if answers.ndim == 1:
+            answers = answers[np.newaxis, :]
+        if answers.ndim != 2 or answers.shape[1] != len(self.masks):
+            raise ValueError(f"답안 행렬 형태 {answers.shape}: 문제 수는 {len(self.masks)}이어야 합니다")
+        if answers.size and not np.issubdtype(answers.dtype, np.integer):
+            raise ValueError(f"답안은 정수여야 합니다 ({answers.dtype})")
+        invalid = (answers < 0) | (answers > self.num_choices)
+        if np.any(invalid):
+            attempt, question = np.argwhere(invalid)[0]
+            raise ValueError(f"답 범위 밖: 응시 {attempt} {question + 1}번 = {answers[attempt, question]} "
+                             f"(0 ~ {self.num_choices})")
+        return answers.astype(np.int64, copy=False)
+
+    def grade(self, answers) -> GradeResult:
+        """(응시 × 문제) 답안 행렬을 한 번에 채점"""
+        answers = self.check_answers(answers)
+        answered = answers > 0
+        chosen = np.where(answered, np.left_shift(1, np.maximum(answers - 1, 0)), 0)
+        hit = (chosen & self.masks) != 0                          # (응시, 문제)
+
+        graded_answered = answered & self.graded
+        correct = np.count_nonzero(hit, axis=1)
+        unanswered = np.count_nonzero(~answered & self.graded, axis=1)
+        wrong = np.count_nonzero(graded_answered, axis=1) - correct
+
+        earned = hit @ self.weights
+        section_earned = (hit * self.weights) @ self.membership
+        subject_earned = section_earned @ self.section_subject
+        total_percent = _percent(earned, self.max_points)
+        subject_percent = _percent(subject_earned, self.subject_points)
+        passed = (total_percent >= self.cutoff.total) & np.all(subject_percent >= self.cutoff.subject, axis=1)
+
+        p_values = np.full(len(self.masks), np.nan)
+        if len(answers):
+            p_values[self.graded] = hit[:, self.graded].mean(axis=0)
+
+        return GradeResult(
+            correct=correct, wrong=wrong, unanswered=unanswered, points=earned,
+            scores=_round(total_percent, 2),
+            sections=self.sections,
+            section_correct=np.rint(hit.astype(np.float64) @ self.membership).astype(np.int64),
+            section_scores=_round(_percent(section_earned, self.section_points), 1),
+            subjects=self.subjects,
+            subject_scores=_round(subject_percent, 2),
+            passed=passed, p_values=p_values,
+        )
+
+
+def read_attempts(path: str) -> Tuple[List, np.ndarray]:
+    """{"응시 id": [답, ...]} 또는 [[답, ...], ...] JSON - null은 무응답(0)"""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        ids, rows = list(data), list(data.values())
+    else:
+        ids, rows = list(range(len(data))), data
+    return ids, np.array([[a or 0 for a in row] for row in rows], dtype=np.int64).reshape(len(rows), -1)
+
+
+def main():
+    from answer_key import AnswerKey
+
+    arg_parser = argparse.ArgumentParser(description='응시 답안 일괄 채점')
+    arg_parser.add_argument('attempts', help='답안 JSON ({"응시 id": [답, ...]}, 0/null = 무응답)')
+    arg_parser.add_argument('--answers', required=True, help='정답표 JSON (answer_key.py 출력)')
+    arg_parser.add_argument('--round', type=int, required=True, help='회차')
+    arg_parser.add_argument('--session', nargs='+', required=True, help='교시 (여러 개면 이어서 채점)')
+    arg_parser.add_argument('--type', default='A형', help='형별')
+    arg_parser.add_argument('--total-cutoff', type=float, default=CutoffRule.total, help='전체 합격 백분율')
+    arg_parser.add_argument('--subject-cutoff', type=float, default=CutoffRule.subject, help='과목 과락 백분율')
+    args = arg_parser.parse_args()
+
+    infos = [{'round': args.round, 'subject': s, 'type': args.type} for s in args.session]
+    try:
+        grader = BatchGrader.from_answer_key(AnswerKey.load(args.answers), infos,
+                                             cutoff=CutoffRule(args.total_cutoff, args.subject_cutoff))
+        ids, answers = read_attempts(args.attempts)
+        result = grader.grade(answers)
+    except ValueError as e:
+        print(f"채점 실패: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    json.dump({'attempts': result.to_records(ids), 'items': result.item_stats()},
+              sys.stdout, ensure_ascii=False, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
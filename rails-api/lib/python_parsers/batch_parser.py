@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+시험 문제지 PDF 일괄 파싱
+
+디렉터리/glob으로 모은 PDF(와 HWP/HWPX)를 워커 풀로 나눠 파싱하고, 파일마다
+JSON/MD/CSV 세트를 출력 디렉터리에 저장한다. 파일별 처리 시간, 문제 수,
+실패 내역은 manifest.json에 기록되며 --resume 시 해시와 파서 설정이 같은 완료 파일은 건너뛴다.
+
+실행:
+    python3 exam_pdf_parser_v2.py sample-data/ -o out/ --workers 4
+    python3 exam_pdf_parser_v2.py "sample-data/제19회*.pdf" -o out/ --resume
+"""
+
+import os
+import glob
+import json
+import hashlib
+import time
+from pathlib import Path
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Optional, Dict, Tuple
+
+from exam_pdf_parser_v2 import ExamPDFParser, PARSER_VERSION, DOCUMENT_SUFFIXES
+from parse_cache import file_sha256
+
+
+MANIFEST_NAME = 'manifest.json'
+
+
+def collect_inputs(patterns: List[str], suffixes: Tuple[str, ...] = ('.pdf',)) -> List[Path]:
+    """파일 / 디렉터리 / glob 패턴을 suffixes 확장자(기본 PDF) 경로 목록으로 (중복 제거, 순서 유지)"""
+    paths = []
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            paths.extend(sorted(p for p in path.iterdir() if p.suffix.lower() in suffixes))
+        elif path.is_file():
+            paths.append(path)
+        else:
+            paths.extend(Path(p) for p in sorted(glob.glob(pattern, recursive=True)))
+
+    return list(dict.fromkeys(p.resolve() for p in paths if p.suffix.lower() in suffixes))
+
+
+def _output_stems(pdf_paths: List[Path]) -> Dict[Path, str]:
+    """출력 파일 이름 - 이름(확장자 제외)이 같은 문서가 여럿이면 전체 경로 해시를 붙임 (foo.pdf / foo.hwp 포함)"""
+    counts = Counter(p.stem for p in pdf_paths)
+    stems = {}
+    for p in pdf_paths:
+        if counts[p.stem] > 1:
+            suffix = hashlib.sha1(str(p).encode('utf-8')).hexdigest()[:8]
+            stems[p] = f"{p.stem}-{suffix}"
+        else:
+            stems[p] = p.stem
+    return stems
+
+
+def process_file(pdf_path: str, output_dir: str, stem: str, file_hash: str,
+                 options: Optional[Dict] = None) -> Dict:
+    """PDF 하나를 파싱해 JSON/MD/CSV를 저장하고 처리 기록을 반환 - 워커 프로세스에서 실행"""
+    record = {
+        'file': pdf_path,
+        'sha256': file_hash,
+        'parser_version': PARSER_VERSION,
+        'config': None,
+        'status': 'ok',
+        'questions': 0,
+        'timings': {},
+        'outputs': {},
+        'error': None
+    }
+    started = time.perf_counter()
+
+    try:
+        parser = ExamPDFParser(pdf_path, **(options or {}))
+        parser.file_hash = file_hash
+        record['config'] = parser.config_fingerprint()
+
+        t = time.perf_counter()
+        parser.extract_text()
+        record['timings']['extract'] = round(time.perf_counter() - t, 3)
+
+        t = time.perf_counter()
+        parser.identify_sections()
+        parser.parse_questions()
+        record['timings']['parse'] = round(time.perf_counter() - t, 3)
+        record['questions'] = len(parser.questions)
+
+        t = time.perf_counter()
+        base = Path(output_dir) / stem
+        outputs = {
+            'json': f"{base}.json",
+            'markdown': f"{base}.md",
+            'csv': f"{base}.csv"
+        }
+        parser.to_json(outputs['json'])
+        parser.to_markdown(outputs['markdown'])
+        parser.to_csv(outputs['csv'])
+        record['timings']['export'] = round(time.perf_counter() - t, 3)
+        record['outputs'] = outputs
+
+    except Exception as e:
+        record['status'] = 'failed'
+        record['error'] = f"{type(e).__name__}: {e}"
+
+    record['timings']['total'] = round(time.perf_counter() - started, 3)
+    return record
+
+
+def load_manifest(output_dir: str) -> Dict:
+    """기존 manifest (없으면 빈 manifest)"""
+    path = Path(output_dir) / MANIFEST_NAME
+    if path.exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {'files': {}}
+
+
+def save_manifest(output_dir: str, manifest: Dict) -> None:
+    """manifest 저장 (임시 파일에 쓴 뒤 교체 - 중단되어도 깨지지 않음)"""
+    path = Path(output_dir) / MANIFEST_NAME
+    tmp_path = path.with_suffix('.json.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _config_fingerprint(pdf_path: Path, options: Optional[Dict]) -> Optional[Dict]:
+    """파일에 적용될 파서 설정 - 옵션이 잘못되었으면 None (워커에서 실패로 기록됨)"""
+    try:
+        return ExamPDFParser(str(pdf_path), **(options or {})).config_fingerprint()
+    except (ValueError, OSError):
+        return None
+
+
+def _is_done(record: Optional[Dict], file_hash: str, config: Optional[Dict]) -> bool:
+    """같은 해시/파서 버전/설정으로 처리를 마쳤고 결과 파일이 남아 있는지"""
+    return (
+        record is not None
+        and record.get('status') == 'ok'
+        and record.get('sha256') == file_hash
+        and record.get('parser_version') == PARSER_VERSION
+        and config is not None and record.get('config') == config
+        and all(os.path.exists(p) for p in record.get('outputs', {}).values())
+    )
+
+
+def run_batch(inputs: List[str], output_dir: str, workers: Optional[int] = None,
+              resume: bool = False, options: Optional[Dict] = None,
+              progress=print) -> Dict:
+    """
+    PDF 일괄 파싱
+
+    Returns:
+        manifest dict ({'files': {경로: 처리 기록}, 'summary': {...}})
+    """
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    pdf_paths = collect_inputs(inputs, DOCUMENT_SUFFIXES)
+    stems = _output_stems(pdf_paths)
+
+    manifest = load_manifest(output_dir) if resume else {'files': {}}
+    manifest['parser_version'] = PARSER_VERSION
+    started = time.perf_counter()
+
+    pending = []
+    skipped = 0
+    for pdf_path in pdf_paths:
+        file_hash = file_sha256(str(pdf_path))
+        if resume and _is_done(manifest['files'].get(str(pdf_path)), file_hash,
+                               _config_fingerprint(pdf_path, options)):
+            skipped += 1
+            continue
+        pending.append((pdf_path, file_hash))
+
+    progress(f"대상 {len(pdf_paths)}개 / 처리 {len(pending)}개 / 건너뜀 {skipped}개")
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = [
+            executor.submit(process_file, str(pdf_path), output_dir, stems[pdf_path], file_hash, options)
+            for pdf_path, file_hash in pending
+        ]
+        for future in as_completed(futures):
+            record = future.result()
+            manifest['files'][record['file']] = record
+            save_manifest(output_dir, manifest)
+
+            name = os.path.basename(record['file'])
+            if record['status'] == 'ok':
+                progress(f"  ✓ {name}: {record['questions']}문제 ({record['timings']['total']:.2f}s)")
+            else:
+                progress(f"  ✗ {name}: {record['error']}")
+
+    records = [manifest['files'][str(p)] for p in pdf_paths if str(p) in manifest['files']]
+    manifest['summary'] = {
+        'total': len(pdf_paths),
+        'processed': len(pending),
+        'skipped': skipped,
+        'ok': sum(1 for r in records if r['status'] == 'ok'),
+        'failed': sum(1 for r in records if r['status'] == 'failed'),
+        'questions': sum(r['questions'] for r in records),
+        'elapsed': round(time.perf_counter() - started, 3)
+    }
+    save_manifest(output_dir, manifest)
+    return manifest
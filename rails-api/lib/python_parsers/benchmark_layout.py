@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+페이지 텍스트 추출 방식(text / columns) 비교 벤치마크
+
+PDF마다 두 가지로 측정한다.
+  1단: 원본 페이지 - columns가 extract_text()와 같은 결과를 내는지, 추가 시간은 얼마인지
+  2단: 원본의 두 페이지를 pypdf로 한 장에 나란히 붙인 페이지 - 정답(왼쪽 페이지 텍스트 +
+       오른쪽 페이지 텍스트)과의 유사도(difflib)와 정확히 일치한 페이지 수
+
+시간은 방식마다 PDF를 새로 열어 잰다 (pdfplumber가 페이지 글자를 캐시하므로).
+
+실행:
+    python3 benchmark_layout.py ../../../sample-data/
+    python3 benchmark_layout.py exam.pdf --json result.json
+"""
+
+import sys
+import json
+import time
+import argparse
+import tempfile
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Dict, List
+
+import pdfplumber
+
+from page_layout import extract_columns
+from batch_parser import collect_inputs
+
+METHODS = {
+    'text': lambda page: page.extract_text() or '',
+    'columns': lambda page: extract_columns(page)[0] or '',
+}
+
+
+def make_two_column(pdf_path: str, output_path: str) -> int:
+    """두 페이지씩 가로로 붙인 2단 PDF 생성 - 만든 페이지 수 반환"""
+    from pypdf import PdfReader, PdfWriter, PageObject, Transformation
+
+    reader = PdfReader(pdf_path)
+    writer = PdfWriter()
+    for i in range(0, len(reader.pages) - 1, 2):
+        left, right = reader.pages[i], reader.pages[i + 1]
+        width, height = float(left.mediabox.width), float(left.mediabox.height)
+        page = PageObject.create_blank_page(width=width * 2, height=height)
+        page.merge_transformed_page(left, Transformation())
+        page.merge_transformed_page(right, Transformation().translate(width, 0))
+        writer.add_page(page)
+
+    with open(output_path, 'wb') as f:
+        writer.write(f)
+    return len(writer.pages)
+
+
+def run_method(pdf_path: str, method: str) -> Dict:
+    """한 방식으로 모든 페이지 추출 - (페이지별 텍스트, 소요 시간)"""
+    extract = METHODS[method]
+    start = time.perf_counter()
+    with pdfplumber.open(pdf_path) as pdf:
+        texts = [extract(page) for page in pdf.pages]
+    return {'texts': texts, 'seconds': time.perf_counter() - start}
+
+
+def score(texts: List[str], truth: List[str]) -> Dict:
+    ratios = [SequenceMatcher(None, text, expected, autojunk=False).ratio()
+              for text, expected in zip(texts, truth)]
+    return {
+        'similarity': round(sum(ratios) / len(ratios), 4) if ratios else 1.0,
+        'exact_pages': sum(1 for text, expected in zip(texts, truth) if text == expected)
+    }
+
+
+def benchmark_file(pdf_path: str, workdir: str) -> Dict:
+    """PDF 하나의 1단/2단 측정"""
+    single = {method: run_method(pdf_path, method) for method in METHODS}
+    truth = single['text']['texts']
+
+    two_column_path = str(Path(workdir) / f"{Path(pdf_path).stem}-2col.pdf")
+    pages = make_two_column(pdf_path, two_column_path)
+    merged_truth = [f"{truth[2 * i]}\n{truth[2 * i + 1]}" for i in range(pages)]
+    double = {method: run_method(two_column_path, method) for method in METHODS}
+
+    result = {'file': pdf_path, 'pages': len(truth), 'two_column_pages': pages}
+    for method in METHODS:
+        result[method] = {
+            'single_seconds': round(single[method]['seconds'], 4),
+            'single': score(single[method]['texts'], truth),
+            'double_seconds': round(double[method]['seconds'], 4),
+            'double': score(double[method]['texts'], merged_truth)
+        }
+    return result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='페이지 텍스트 추출 방식(text/columns) 비교 벤치마크')
+    arg_parser.add_argument('inputs', nargs='+', help='PDF 파일, 디렉터리 또는 glob 패턴')
+    arg_parser.add_argument('--json', dest='json_path', help='결과를 JSON으로 저장')
+    args = arg_parser.parse_args()
+
+    pdf_paths = collect_inputs(args.inputs)
+    if not pdf_paths:
+        print("대상 PDF가 없습니다", file=sys.stderr)
+        sys.exit(1)
+
+    results = []
+    print(f"{'파일':<36} {'방식':<8} {'1단 시간':>8} {'1단 일치':>8} {'2단 시간':>8} {'2단 유사도':>9} {'2단 일치':>8}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for pdf_path in pdf_paths:
+            r = benchmark_file(str(pdf_path), workdir)
+            if not r['two_column_pages']:
+                continue
+            results.append(r)
+            for method in METHODS:
+                m = r[method]
+                print(f"{pdf_path.name[:36]:<36} {method:<8} {m['single_seconds']:>7.2f}s "
+                      f"{m['single']['exact_pages']:>4}/{r['pages']:<3} {m['double_seconds']:>7.2f}s "
+                      f"{m['double']['similarity']:>9.3f} {m['double']['exact_pages']:>4}/{r['two_column_pages']:<3}")
+
+    for method in METHODS:
+        single = sum(r[method]['single_seconds'] for r in results)
+        double = sum(r[method]['double_seconds'] for r in results)
+        exact = sum(r[method]['double']['exact_pages'] for r in results)
+        total = sum(r['two_column_pages'] for r in results)
+        print(f"\n{method}: 1단 {single:.2f}s / 2단 {double:.2f}s, 2단 정확히 일치 {exact}/{total}페이지")
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump({'files': results}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+테이블 추출 방식(eager / lazy) 비교 벤치마크
+
+PDF마다 두 방식으로 전체 파싱(extract_text + parse_questions)을 반복 실행해
+소요 시간, extract_tables()를 호출한 페이지 수, 결과 일치 여부를 출력한다.
+
+실행:
+    python3 benchmark_table_strategy.py ../../../sample-data/
+    python3 benchmark_table_strategy.py exam.pdf --repeat 5 --json result.json
+"""
+
+import sys
+import json
+import time
+import argparse
+from typing import Dict
+
+from exam_pdf_parser_v2 import ExamPDFParser
+from batch_parser import collect_inputs
+
+
+def run_strategy(pdf_path: str, strategy: str, repeat: int) -> Dict:
+    """한 방식으로 repeat번 파싱해 최소 소요 시간과 결과를 기록"""
+    best = None
+    for _ in range(repeat):
+        parser = ExamPDFParser(pdf_path, table_strategy=strategy)
+        start = time.perf_counter()
+        parser.extract_text()
+        parser.identify_sections()
+        parser.parse_questions()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    if strategy == 'eager':
+        table_pages = parser._page_count()
+    else:
+        table_pages = len(parser._tables_loaded)
+
+    return {
+        'seconds': round(best, 4),
+        'table_pages': table_pages,
+        'questions': len(parser.questions),
+        'result': parser.to_dict()
+    }
+
+
+def benchmark_file(pdf_path: str, repeat: int) -> Dict:
+    """PDF 하나에 대해 eager / lazy 비교"""
+    eager = run_strategy(pdf_path, 'eager', repeat)
+    lazy = run_strategy(pdf_path, 'lazy', repeat)
+
+    return {
+        'file': pdf_path,
+        'questions': eager['questions'],
+        'eager_seconds': eager['seconds'],
+        'lazy_seconds': lazy['seconds'],
+        'eager_table_pages': eager['table_pages'],
+        'lazy_table_pages': lazy['table_pages'],
+        'speedup': round(eager['seconds'] / lazy['seconds'], 2) if lazy['seconds'] else None,
+        'identical': eager['result'] == lazy['result']
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='테이블 추출 방식(eager/lazy) 비교 벤치마크')
+    arg_parser.add_argument('inputs', nargs='+', help='PDF 파일, 디렉터리 또는 glob 패턴')
+    arg_parser.add_argument('--repeat', type=int, default=3, help='방식별 반복 횟수 (최소값 사용)')
+    arg_parser.add_argument('--json', dest='json_path', help='결과를 JSON으로 저장')
+    args = arg_parser.parse_args()
+
+    pdf_paths = collect_inputs(args.inputs)
+    if not pdf_paths:
+        print("대상 PDF가 없습니다", file=sys.stderr)
+        sys.exit(1)
+
+    results = []
+    print(f"{'파일':<40} {'문제':>4} {'eager':>8} {'lazy':>8} {'배율':>6} {'테이블 페이지':>12}  일치")
+    for pdf_path in pdf_paths:
+        r = benchmark_file(str(pdf_path), args.repeat)
+        results.append(r)
+        print(f"{pdf_path.name[:40]:<40} {r['questions']:>4} {r['eager_seconds']:>7.2f}s {r['lazy_seconds']:>7.2f}s "
+              f"{r['speedup'] or 0:>5.2f}x {r['eager_table_pages']:>5} -> {r['lazy_table_pages']:<4}  "
+              f"{'예' if r['identical'] else '아니오'}")
+
+    eager_total = sum(r['eager_seconds'] for r in results)
+    lazy_total = sum(r['lazy_seconds'] for r in results)
+    print(f"\n합계: eager {eager_total:.2f}s / lazy {lazy_total:.2f}s "
+          f"({eager_total / lazy_total if lazy_total else 0:.2f}x)")
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump({'files': results, 'eager_seconds': round(eager_total, 4),
+                       'lazy_seconds': round(lazy_total, 4)}, f, ensure_ascii=False, indent=2)
+
+    if not all(r['identical'] for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
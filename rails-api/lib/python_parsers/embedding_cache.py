@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+문제 임베딩 캐시
+
+재파싱할 때마다 바뀌지 않은 문제까지 OpenAI로 다시 임베딩하던 것을, (모델과 차원, 텍스트 SHA-256)을
+키로 SQLite 파일 하나에 float16 벡터로 저장해 두고 캐시에 없는 텍스트만 백엔드에 큰 배치로
+보낸다. 같은 회차를 다시 넣으면 임베딩 호출이 거의 없다. 백엔드는 이름/'module:Class'로
+고르며, 'local'은 네트워크 없이 결정적인 벡터를 만든다 (오프라인 테스트/개발용).
+
+    embedder = Embedder(backend='openai')
+    chunks, vectors = embedder.embed_questions(parser.parse_questions())   # text_chunker 청크별 벡터
+    embedder.stats        # {'texts': 75, 'hits': 75, 'misses': 0, 'calls': 0}
+
+CLI:
+    python3 embedding_cache.py embed sample-data/*.pdf --backend local [--index tmp/vector_index]
+    python3 embedding_cache.py stats
+"""
+
+import os
+import sys
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+import argparse
+import importlib
+import unicodedata
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_CACHE_PATH = os.environ.get(
+    'EMBEDDING_CACHE_PATH', str(Path.home() / '.cache' / 'exam_parser' / 'embeddings.sqlite3')
+)
+
+MODEL = 'text-embedding-3-small'   # EmbeddingService::MODEL
+DIMENSIONS = 1536
+BATCH_SIZE = 256                   # 백엔드 요청당 텍스트 수 (512토큰 청크 기준 OpenAI 요청 한도 안)
+LOOKUP_SIZE = 500                  # SQLite IN (...) 한 번에 찾는 키 수
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    text_hash TEXT NOT NULL,
+    dim INTEGER NOT NULL,
+    vector BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (model, text_hash)
+) WITHOUT ROWID;
+"""
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class EmbeddingBackend:
+    """임베딩 백엔드 - embed(텍스트 목록) -> (n, dim) 배열. cache_model이 캐시 키의 일부"""
+
+    model = ''
+    dim = DIMENSIONS
+
+    @property
+    def cache_model(self) -> str:
+        """캐시 키의 모델 부분 - 같은 모델도 차원이 다르면 다른 벡터이므로 차원을 붙임"""
+        return f"{self.model}:{self.dim}"
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        raise NotImplementedError
+
+
+class LocalBackend(EmbeddingBackend):
+    """결정적 로컬 벡터 - 글자 n-gram을 crc32로 dim칸에 부호를 붙여 더한 뒤 정규화 (네트워크 없음)"""
+
+    def __init__(self, dim: int = DIMENSIONS, ngram: int = 3):
+        self.dim = dim
+        self.ngram = ngram
+        self.model = f"local-hash-{ngram}gram-{dim}"
+
+    @property
+    def cache_model(self) -> str:
+        return self.model           # 이름에 차원이 들어 있음
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            text = ' '.join(unicodedata.normalize('NFKC', text).split())
+            grams = {text[i:i + self.ngram] for i in range(max(len(text) - self.ngram + 1, 1))} if text else ()
+            hashes = np.fromiter((zlib.crc32(gram.encode('utf-8')) for gram in grams), dtype=np.uint64)
+            signs = np.where(hashes & np.uint64(1 << 31), -1.0, 1.0).astype(np.float32)
+            np.add.at(vectors[row], (hashes % np.uint64(self.dim)).astype(np.int64), signs)
+            norm = np.linalg.norm(vectors[row])
+            if norm:
+                vectors[row] /= norm
+        return vectors
+
+
+class OpenAIBackend(EmbeddingBackend):
+    """OpenAI embeddings API (OPENAI_API_KEY) - 표준 라이브러리 HTTP로 배치 요청"""
+
+    URL = 'https://api.openai.com/v1/embeddings'
+
+    def __init__(self, model: str = MODEL, dim: int = DIMENSIONS, api_key: Optional[str] = None, timeout: int = 120):
+        self.model = model
+        self.dim = dim
+        self.api_key = api_key or os.environ.get('OPENAI_API_KEY')
+        self.timeout = timeout
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        import urllib.error
+        import urllib.request
+
+        if not self.api_key:
+            raise RuntimeError("OPENAI_API_KEY가 설정되지 않았습니다")
+        payload = {'model': self.model, 'input': texts, 'dimensions': self.dim}   # text-embedding-3: 차원 축소
+        request = urllib.request.Request(
+            self.URL, data=json.dumps(payload).encode('utf-8'),
+            headers={'Authorization': f"Bearer {self.api_key}", 'Content-Type': 'application/json'})
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                data = json.load(response)['data']
+        except urllib.error.HTTPError as e:
+            raise RuntimeError(f"OpenAI 임베딩 실패 ({e.code}): {e.read().decode('utf-8', 'replace')}") from None
+        return np.array([item['embedding'] for item in sorted(data, key=lambda item: item['index'])],
+                        dtype=np.float32)
+
+
+BACKENDS: Dict[str, Callable[[], EmbeddingBackend]] = {'local': LocalBackend, 'openai': OpenAIBackend}
+
+
+def register_backend(name: str, factory: Callable[[], EmbeddingBackend]) -> None:
+    BACKENDS[name] = factory
+
+
+def get_backend(spec) -> EmbeddingBackend:
+    """등록된 이름, 'module:Class' 경로 또는 EmbeddingBackend 인스턴스로 백엔드 생성"""
+    if isinstance(spec, EmbeddingBackend):
+        return spec
+    if spec in BACKENDS:
+        return BACKENDS[spec]()
+    if ':' in spec:
+        module, _, attr = spec.partition(':')
+        return getattr(importlib.import_module(module), attr)()
+    raise ValueError(f"지원하지 않는 임베딩 백엔드: {spec}")
+
+
+class EmbeddingCache:
+    """(모델:차원, 텍스트 해시) -> float16 벡터 (SQLite, 여러 워커 프로세스에서 동시 사용 가능)"""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path), timeout=30)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def get_many(self, model: str, hashes: Sequence[str]) -> Dict[str, np.ndarray]:
+        """캐시에 있는 것만 {해시: float16 벡터}"""
+        found = {}
+        for start in range(0, len(hashes), LOOKUP_SIZE):
+            batch = list(hashes[start:start + LOOKUP_SIZE])
+            rows = self.conn.execute(
+                f"SELECT text_hash, vector FROM embeddings WHERE model = ? AND text_hash IN "
+                f"({', '.join('?' * len(batch))})", [model] + batch
+            )
+            found.update((key, np.frombuffer(vector, dtype=np.float16)) for key, vector in rows)
+        return found
+
+    def put_many(self, model: str, items: Iterable[Tuple[str, np.ndarray]]) -> None:
+        """한 트랜잭션으로 저장 (기존 항목은 교체)"""
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?, ?)',
+                [(model, key, len(vector), np.asarray(vector, dtype=np.float16).tobytes(), now)
+                 for key, vector in items]
+            )
+
+    def purge(self, model: Optional[str] = None) -> int:
+        """모델의 항목(없으면 전부)을 지움 - 지운 수"""
+        with self.conn:
+            if model is None:
+                return self.conn.execute('DELETE FROM embeddings').rowcount
+            return self.conn.execute('DELETE FROM embeddings WHERE model = ?', (model,)).rowcount
+
+    def stats(self) -> Dict:
+        models = {model: {'entries': count, 'dim': dim} for model, count, dim in self.conn.execute(
+            'SELECT model, COUNT(*), MAX(dim) FROM embeddings GROUP BY model')}
+        size = sum(p.stat().st_size for p in self.path.parent.glob(self.path.name + '*'))
+        return {'path': str(self.path), 'models': models, 'bytes': size}
+
+
+class Embedder:
+    """
+    캐시 우선 임베딩 - 같은 텍스트는 한 번만, 캐시에 없는 텍스트만 batch_size씩 백엔드로
+
+    반환 벡터는 캐시 적중/미스와 관계없이 float16으로 저장된 값 (float32 배열)이다.
+    cache=None이면 캐시 없이 매번 백엔드를 부른다.
+    """
+
+    def __init__(self, backend='local', cache=DEFAULT_CACHE_PATH, batch_size: int = BATCH_SIZE):
+        self.backend = get_backend(backend)
+        self.cache = EmbeddingCache(cache) if isinstance(cache, (str, Path)) else cache
+        self.batch_size = batch_size
+        self.stats = {'texts': 0, 'hits': 0, 'misses': 0, 'calls': 0}
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """텍스트 순서대로 (n, dim) float32"""
+        model = self.backend.cache_model
+        hashes = [text_hash(text) for text in texts]
+        unique = {key: text for key, text in zip(hashes, texts)}
+        found = self.cache.get_many(model, list(unique)) if self.cache else {}
+        missing = [key for key in unique if key not in found]
+
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start:start + self.batch_size]
+            vectors = np.asarray(self.backend.embed([unique[key] for key in batch]), dtype=np.float32)
+            if vectors.shape != (len(batch), self.backend.dim):
+                raise RuntimeError(f"백엔드 응답 크기가 다릅니다: {vectors.shape} != {(len(batch), self.backend.dim)}")
+            stored = vectors.astype(np.float16)
+            if self.cache:
+                self.cache.put_many(model, zip(batch, stored))
+            found.update(zip(batch, stored))
+            self.stats['calls'] += 1
+
+        self.stats['texts'] += len(texts)
+        self.stats['hits'] += len(unique) - len(missing)
+        self.stats['misses'] += len(missing)
+        if not hashes:
+            return np.zeros((0, self.backend.dim), dtype=np.float32)
+        return np.stack([found[key] for key in hashes]).astype(np.float32)
+
+    def embed_questions(self, questions, max_tokens: Optional[int] = None, overlap: Optional[int] = None,
+                        tokenizer: str = 'estimate'):
+        """문제 청크와 청크별 벡터 (chunks[i] <-> vectors[i], chunk.source = 문제 번호)"""
+        from text_chunker import MAX_TOKENS, OVERLAP, chunk_questions
+
+        chunks = chunk_questions(questions, MAX_TOKENS if max_tokens is None else max_tokens,
+                                 OVERLAP if overlap is None else overlap, tokenizer)
+        return chunks, self.embed([chunk.text for chunk in chunks])
+
+    def close(self) -> None:
+        if self.cache:
+            self.cache.close()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='문제 임베딩 캐시')
+    arg_parser.add_argument('--cache', default=DEFAULT_CACHE_PATH, help='캐시 파일 경로')
+    sub = arg_parser.add_subparsers(dest='command', required=True)
+
+    embed = sub.add_parser('embed', help='문제지를 파싱해 청크를 임베딩 (캐시에 없는 것만 호출)')
+    embed.add_argument('inputs', nargs='+', help='PDF/HWP/HWPX 문제지')
+    embed.add_argument('--backend', default='local', help="'local', 'openai' 또는 'module:Class'")
+    embed.add_argument('--index', default=None, help='벡터를 추가할 vector_index 디렉터리')
+
+    sub.add_parser('stats', help='캐시 정보')
+    args = arg_parser.parse_args()
+
+    if args.command == 'stats':
+        print(json.dumps(EmbeddingCache(args.cache).stats(), ensure_ascii=False, indent=2))
+        return
+
+    from exam_pdf_parser_v2 import ExamPDFParser
+
+    embedder = Embedder(args.backend, args.cache)
+    index = None
+    if args.index:
+        from vector_index import VectorIndex
+        index = VectorIndex(args.index, dim=embedder.backend.dim)
+    for path in args.inputs:
+        parser = ExamPDFParser(path)
+        before = dict(embedder.stats)
+        chunks, vectors = embedder.embed_questions(parser.parse_questions())
+        if index is not None and len(chunks):
+            info = parser.exam_info()
+            index.add([f"{info['round']}-{info['subject']}-{info['type']}-{chunk.source}-{chunk.index}"
+                       for chunk in chunks], vectors)
+        print(f"{Path(path).name}: 청크 {len(chunks)}개, 캐시 적중 {embedder.stats['hits'] - before['hits']}, "
+              f"호출 {embedder.stats['calls'] - before['calls']}회")
+    embedder.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,14 +5,59 @@
 """
 
 import re
+import sys
 import json
+import time
+from bisect import bisect_right
+from itertools import chain
+from contextlib import nullcontext
 import pdfplumber
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, asdict, field
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple, Iterator, TextIO
 from pathlib import Path
 
+from parse_tracer import ParseTracer
+from exam_profiles import ExamProfile, get_registry
+from hwp_reader import HWP_SUFFIXES, is_hwp
+from page_figures import FigureWriter
+from page_engine import extract_page
 
-@dataclass
+
+# 파싱 규칙/출력 구조가 바뀌면 올린다 (parse_cache 캐시 키에 포함)
+PARSER_VERSION = '2.3.0'
+
+
+class Patterns:
+    """정규식 레지스트리 - 모듈 로드 시 한 번만 컴파일 (머리글/과목 패턴은 시험 프로필에 있음)"""
+    QUESTION_START = re.compile(r'(?:^|\n)(\d{1,2})\.\s+')
+    TABLE_INDICATORS = [
+        re.compile(r'대상자.*사회복지.*주체.*권리수준'),
+    ]
+    BLANK_MARKERS = [
+        re.compile(r'\(\s*ㄱ\s*\)'),
+        re.compile(r'\(\s*ㄴ\s*\)'),
+        re.compile(r'\(\s*ㄷ\s*\)'),
+    ]
+    # 문제 블록 토크나이저가 한 번에 훑는 구분 문자: ? ○ ①~⑤ ㄱ~ㅎ
+    BLOCK_TOKEN = re.compile(r'[?○①②③④⑤ㄱ-ㅎ]')
+
+
+CHOICE_SYMBOLS = '①②③④⑤'
+
+# 입력으로 받는 문서 형식 - HWP/HWPX는 hwp_reader가 구역을 페이지처럼 읽음
+DOCUMENT_SUFFIXES = ('.pdf',) + HWP_SUFFIXES
+
+CSV_HEADER = [
+    '문제번호', '과목', '질문',
+    '지문_○1', '지문_○2', '지문_○3',
+    '지문_ㄱ', '지문_ㄴ', '지문_ㄷ', '지문_ㄹ', '지문_ㅁ',
+    '보기①', '보기②', '보기③', '보기④', '보기⑤',
+    '테이블'
+]
+
+
+@dataclass(slots=True)
 class Table:
     """테이블"""
     headers: List[str]
@@ -31,21 +76,33 @@ class Table:
         return '\n'.join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
+class Figure:
+    """그림/도표 영역 (path: 잘라낸 PNG를 저장했으면 그 경로)"""
+    page: int                                  # 페이지 번호 (1부터)
+    bbox: Tuple[float, float, float, float]    # (x0, top, x1, bottom) pt
+    kind: str                                  # image: 삽입 이미지, drawing: 벡터 그림
+    path: Optional[str] = None
+
+    def to_dict(self):
+        return {'page': self.page, 'bbox': list(self.bbox), 'kind': self.kind, 'path': self.path}
+
+
+@dataclass(slots=True)
 class Choice:
     """보기 (①②③④⑤)"""
     number: int
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PassageItem:
     """지문 항목"""
     marker: str  # ○, ㄱ, ㄴ, ㄷ 등
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Question:
     """문제 - 명확히 분리된 구조"""
     number: int                          # 문제 번호
@@ -54,6 +111,315 @@ class Question:
     passage: List[PassageItem]           # 지문 (○ 항목들, ㄱ.ㄴ.ㄷ. 등)
     choices: List[Choice]                # 보기 (①②③④⑤)
     table: Optional[Table] = None        # 표 (있는 경우)
+    figures: List[Figure] = field(default_factory=list)  # 그림 (있는 경우)
+
+
+def _clean_text(text: str) -> str:
+    """연속 공백을 한 칸으로 (re.sub(r'\\s+', ' ', text).strip()과 동일)"""
+    return ' '.join(text.split())
+
+
+def _is_hangul(ch: str) -> bool:
+    return '가' <= ch <= '힣'
+
+
+# 항목 종류별 규칙 - 내용에 올 수 없는 문자 집합 (마커 자신도 여기에 포함됨)
+#   ○ 항목:  ○\s*([^○①-⑤]+?)(?=○|[①-⑤]|$)
+#   ㄱ. 항목: ([ㄱ-ㅎ])\.\s*([^ㄱ-ㅎ①-⑤]+?)(?=[ㄱ-ㅎ]\.|[①-⑤]|$)
+#   보기:    ([①-⑤])\s*([^①-⑤]+?)(?=[①-⑤]|$)
+_JAMO_CHARS = frozenset(chr(c) for c in range(ord('ㄱ'), ord('ㅎ') + 1))
+_CIRCLE_EXCLUDED = frozenset('○' + CHOICE_SYMBOLS)
+_JAMO_EXCLUDED = _JAMO_CHARS | frozenset(CHOICE_SYMBOLS)
+_CHOICE_EXCLUDED = frozenset(CHOICE_SYMBOLS)
+
+
+def _is_jamo_mark(text: str, pos: int, ch: str) -> bool:
+    return ch in _JAMO_CHARS and text[pos + 1:pos + 2] == '.'
+
+
+def _match_items(excluded: frozenset, text: str, tokens: List[Tuple[int, str]]):
+    """
+    토큰 위치만으로 항목 정규식의 findall + sub 결과를 재현
+
+    마커는 항상 금지 문자이므로 금지 문자 토큰만 순서대로 보면 되고,
+    각 마커의 내용은 다음 금지 문자(또는 텍스트 끝)에서 끝난다.
+
+    Returns:
+        (항목 리스트 [(마커, 내용)], 항목을 제거한 텍스트, 제거 후 좌표로 옮긴 토큰)
+    """
+    jamo = excluded is _JAMO_EXCLUDED
+    mark_len = 2 if jamo else 1
+    length = len(text)
+    ends_with_newline = length > 0 and text[-1] == '\n'
+
+    stops = [(pos, ch) for pos, ch in tokens if ch in excluded]
+    items = []
+    removed = []
+    next_start = 0
+
+    for k, (pos, ch) in enumerate(stops):
+        if pos < next_start:
+            continue
+        if jamo:
+            if not _is_jamo_mark(text, pos, ch):
+                continue
+        elif excluded is _CIRCLE_EXCLUDED and ch != '○':
+            continue
+
+        if k + 1 < len(stops):
+            stop, stop_ch = stops[k + 1]
+            # ㄱ. 항목 내용은 마침표 없는 자음(ㄴ 등)에서는 멈출 수 없음
+            if jamo and stop_ch in _JAMO_CHARS and not _is_jamo_mark(text, stop, stop_ch):
+                continue
+        else:
+            stop = length
+
+        content_start = pos + mark_len
+        word_start = content_start
+        while word_start < stop and text[word_start].isspace():
+            word_start += 1
+
+        if word_start < stop:
+            end = length - 1 if stop == length and ends_with_newline else stop
+            items.append((ch, text[word_start:end]))
+        elif word_start > content_start:
+            # 마커 뒤가 공백뿐이면 공백 한 글자가 내용 (정리하면 빈 문자열)
+            end = word_start
+            items.append((ch, text[word_start - 1:end]))
+        else:
+            continue
+
+        removed.append((pos, end))
+        next_start = end
+
+    if not removed:
+        return items, text, tokens
+
+    pieces = []
+    prev = 0
+    for start, end in removed:
+        pieces.append(text[prev:start])
+        prev = end
+    pieces.append(text[prev:])
+
+    kept_tokens = []
+    k = 0
+    shift = 0
+    for pos, ch in tokens:
+        while k < len(removed) and removed[k][1] <= pos:
+            shift += removed[k][1] - removed[k][0]
+            k += 1
+        if k < len(removed) and removed[k][0] <= pos:
+            continue
+        kept_tokens.append((pos - shift, ch))
+
+    return items, ''.join(pieces), kept_tokens
+
+
+def _split_question(text: str, tokens: List[Tuple[int, str]]) -> Tuple[str, int]:
+    r"""
+    질문문과 나머지 시작 위치 결정 - 다음 정규식을 순서대로 적용한 것과 동일:
+        ^(.+?것은\s*\?)  ->  ^(.+?[가-힣]+은\s*\?)  ->  ^(.+?[가-힣]+를\s*\?)  ->  ^(.+?\?\s*)
+    """
+    ends_with_geot = ends_with_eun = ends_with_reul = first_mark = None
+
+    for pos, ch in tokens:
+        if ch != '?' or pos < 1:
+            continue
+        if first_mark is None:
+            first_mark = pos
+
+        last = pos - 1
+        while last >= 0 and text[last].isspace():
+            last -= 1
+        if last < 2 or not _is_hangul(text[last - 1]):
+            continue
+
+        if text[last] == '은':
+            if ends_with_geot is None and text[last - 1] == '것':
+                ends_with_geot = pos
+                break
+            if ends_with_eun is None:
+                ends_with_eun = pos
+        elif text[last] == '를' and ends_with_reul is None:
+            ends_with_reul = pos
+
+    for pos in (ends_with_geot, ends_with_eun, ends_with_reul):
+        if pos is not None:
+            return _clean_text(text[:pos + 1]), pos + 1
+
+    if first_mark is not None:
+        end = first_mark + 1
+        while end < len(text) and text[end].isspace():
+            end += 1
+        return _clean_text(text[:end]), end
+
+    # ? 가 없는 경우, 첫 번째 ○ 또는 ㄱ. 이전까지를 질문으로, 없으면 첫 번째 보기 이전까지
+    for pos, ch in tokens:
+        if ch == '○' or _is_jamo_mark(text, pos, ch):
+            return _clean_text(text[:pos]), pos
+    for pos, ch in tokens:
+        if ch in CHOICE_SYMBOLS:
+            return _clean_text(text[:pos]), pos
+
+    return "", 0
+
+
+def _tokenize_block(text: str) -> Tuple[str, List[PassageItem], List[Choice], str]:
+    """
+    문제 블록을 한 번만 훑어 질문문 / 지문 항목(○, ㄱ.) / 보기 구간으로 분리
+
+    구분 문자 위치를 한 번 수집한 뒤 ○ 항목 -> ㄱ. 항목 -> 보기 순으로
+    토큰 위치만 따라가므로, 같은 텍스트를 정규식으로 여러 번 다시 훑지 않는다.
+
+    Returns:
+        (질문문, 지문 리스트, 보기 리스트, 보기까지 제거하기 전의 나머지 텍스트)
+    """
+    tokens = [(m.start(), m.group()) for m in Patterns.BLOCK_TOKEN.finditer(text)]
+
+    question, offset = _split_question(text, tokens)
+    remaining = text[offset:]
+    tokens = [(pos - offset, ch) for pos, ch in tokens if pos >= offset]
+
+    passage_items = []
+
+    circle_items, remaining, tokens = _match_items(_CIRCLE_EXCLUDED, remaining, tokens)
+    for _, content in circle_items:
+        cleaned = _clean_text(content)
+        if cleaned:
+            passage_items.append(PassageItem(marker='○', text=cleaned))
+
+    jamo_items, remaining, tokens = _match_items(_JAMO_EXCLUDED, remaining, tokens)
+    for label, content in jamo_items:
+        cleaned = _clean_text(content)
+        if cleaned:
+            passage_items.append(PassageItem(marker=label, text=cleaned))
+
+    choice_items, _, _ = _match_items(_CHOICE_EXCLUDED, remaining, tokens)
+    choices = [
+        Choice(number=CHOICE_SYMBOLS.index(symbol) + 1, text=_clean_text(content))
+        for symbol, content in choice_items
+    ]
+
+    return question, passage_items, choices, remaining
+
+
+class TableIndex:
+    """
+    문서 테이블 색인 - 페이지별 목록 + 헤더 셀 역색인 (문서당 한 번 구축)
+
+    헤더 셀은 공백을 제거해 앞 두 글자로 색인하므로, 질문 텍스트를 한 번
+    훑는 것만으로 헤더가 포함된 테이블을 찾는다 (테이블 수와 무관).
+    """
+
+    def __init__(self):
+        self.by_page: Dict[int, List[Tuple[int, List]]] = {}   # 페이지 -> [(테이블 id, 데이터)]
+        self.by_prefix: Dict[str, List[Tuple[str, int, int]]] = {}  # 헤더 앞 두 글자 -> [(헤더, 테이블 id, 열)]
+        self.tables: Dict[int, Tuple[int, List]] = {}          # 테이블 id -> (페이지, 데이터)
+
+    @classmethod
+    def from_page_tables(cls, page_tables: Dict[int, List]) -> 'TableIndex':
+        index = cls()
+        for page_num in sorted(page_tables):
+            index.add_page(page_num, page_tables[page_num])
+        return index
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return ''.join(text.split())
+
+    def add_page(self, page_num: int, tables: List) -> None:
+        """페이지의 테이블 등록 (헤더 행이 있고 2행 이상인 것만)"""
+        entries = []
+        for table_data in tables:
+            if not table_data or len(table_data) < 2 or not table_data[0]:
+                continue
+
+            table_id = len(self.tables)
+            self.tables[table_id] = (page_num, table_data)
+            entries.append((table_id, table_data))
+
+            for col, cell in enumerate(table_data[0]):
+                header = self._normalize(cell) if cell else ''
+                if header:
+                    self.by_prefix.setdefault(header[:2], []).append((header, table_id, col))
+
+        if entries:
+            self.by_page[page_num] = entries
+
+    def remove_pages_before(self, page_num: int) -> None:
+        """page_num 이전 페이지의 테이블 제거 (스트리밍 파싱용)"""
+        stale = {tid for tid, (num, _) in self.tables.items() if num < page_num}
+        if not stale:
+            return
+        for tid in stale:
+            del self.tables[tid]
+        for num in [num for num in self.by_page if num < page_num]:
+            del self.by_page[num]
+        for prefix in list(self.by_prefix):
+            kept = [entry for entry in self.by_prefix[prefix] if entry[1] not in stale]
+            if kept:
+                self.by_prefix[prefix] = kept
+            else:
+                del self.by_prefix[prefix]
+
+    def _header_matches(self, q_norm: str) -> Dict[int, int]:
+        """질문에 포함된 헤더 셀 수 (테이블 id별)"""
+        found = set()
+        prefixes = self.by_prefix
+        for pos in range(len(q_norm)):
+            for key in (q_norm[pos:pos + 2], q_norm[pos]):
+                for header, table_id, col in prefixes.get(key, ()):
+                    if len(header) == len(key) or q_norm.startswith(header, pos):
+                        found.add((table_id, col))
+
+        counts: Dict[int, int] = {}
+        for table_id, _ in found:
+            counts[table_id] = counts.get(table_id, 0) + 1
+        return counts
+
+    def find(self, q_text: str, pages: range) -> Optional[List]:
+        """
+        헤더 셀 2개 이상이 질문에 포함된 테이블 - 문제 블록이 걸친 페이지에서만 찾는다
+        (스트리밍 파싱이 지난 페이지를 지워도 결과가 같도록)
+        """
+        if not self.tables:
+            return None
+
+        matches = self._header_matches(self._normalize(q_text))
+        candidates = [tid for tid, count in matches.items() if count >= 2]
+        if not candidates:
+            return None
+
+        local = [tid for tid in candidates if self.tables[tid][0] in pages]
+        return self.tables[min(local)][1] if local else None
+
+
+def _extract_page_range(pdf_path: str, start: int = 0, end: Optional[int] = None,
+                        with_tables: bool = True, layout: str = 'text',
+                        figures: Optional[Dict[int, List]] = None) -> List[Tuple[int, Optional[str], List, Dict]]:
+    """
+    페이지 구간 [start, end)의 (페이지 번호, 텍스트, 테이블, 소요 시간) 추출 - 워커 프로세스에서도 실행
+    figures를 주면 같은 순회에서 찾은 그림을 {페이지 번호: [그림]}으로 채움
+    페이지마다 레이아웃을 한 번 읽고 끝나면 캐시를 비운다 (page_engine)
+    """
+    results = []
+    with pdfplumber.open(pdf_path) as pdf:
+        if end is None:
+            end = len(pdf.pages)
+        for page_num in range(start, end):
+            extracted = extract_page(pdf.pages[page_num], with_tables, layout, with_figures=figures is not None)
+            results.append((page_num, extracted.text, extracted.tables, extracted.timings))
+            if extracted.figures:
+                figures[page_num] = extracted.figures
+    return results
+
+
+def _extract_page_range_with_figures(pdf_path: str, start: int, end: int, with_tables: bool = True,
+                                     layout: str = 'text') -> Tuple[List, Dict[int, List]]:
+    """워커 프로세스용 - 페이지 구간의 추출 결과와 그림"""
+    figures = {}
+    return _extract_page_range(pdf_path, start, end, with_tables, layout, figures), figures
 
 
 class ExamPDFParser:
@@ -61,45 +427,254 @@ class ExamPDFParser:
 
     CIRCLE_NUMBERS = {'①': 1, '②': 2, '③': 3, '④': 4, '⑤': 5}
 
-    def __init__(self, pdf_path: str):
+    TABLE_STRATEGIES = ('eager', 'lazy')
+    LAYOUTS = ('text', 'columns')
+
+    def __init__(self, pdf_path: str, workers: int = 1, table_strategy: str = 'eager',
+                 trace: bool = False, tracer: Optional[ParseTracer] = None,
+                 profile: Optional[str] = None, page_store=None, layout: str = 'text',
+                 answer_key=None, ocr=None, ocr_workers: int = 1,
+                 figures_dir: Optional[str] = None, figure_workers: int = 1):
+        if table_strategy not in self.TABLE_STRATEGIES:
+            raise ValueError(f"지원하지 않는 테이블 추출 방식: {table_strategy}")
+        if layout not in self.LAYOUTS:
+            raise ValueError(f"지원하지 않는 페이지 레이아웃: {layout}")
+
+        registry = get_registry()
+        if isinstance(profile, ExamProfile):
+            self.profile = profile
+        else:
+            self.profile = registry.get(profile) if profile else None  # None이면 첫 페이지로 자동 선택
+        self.profile_option = self.profile.id if self.profile else 'auto'
+        self.profile_fingerprint = registry.fingerprint
+        self.header_fields = {}         # 첫 페이지 머리글의 연도/회차/교시/형별
+        self._profile_detected = False
+
         self.pdf_path = pdf_path
+        self.workers = workers          # 1이면 순차 추출, 2 이상이면 페이지 구간을 프로세스 풀로 분산
+        self.table_strategy = table_strategy  # eager: 모든 페이지, lazy: 테이블 문제가 걸친 페이지만
+        self.layout = layout            # text: page.extract_text(), columns: 2단 페이지를 단 순서대로
+        self.tracer = tracer or (ParseTracer() if trace else None)  # 계측 (None이면 기록하지 않음)
         self.raw_text = ""
         self.sections = []
         self.questions = []
         self.page_tables = {}
+        self.page_figures = {}          # {페이지 번호: [그림]} - find_figures 결과 (PDF/저장소)
+        self.page_offsets = []          # raw_text 안에서 각 페이지가 시작되는 위치 [(offset, page_num)]
+        self.table_index = None
+        self._tables_loaded = set()     # lazy 모드에서 테이블 추출을 마친 페이지
+        self._open_pdf = None           # iter_questions가 열어 둔 PDF (lazy 테이블 추출에 재사용)
+        self.page_store = page_store    # PageStore 또는 경로 - 있으면 페이지 추출 결과를 저장/재사용
+        self.file_hash = None           # 저장소 키 (없으면 처음 쓸 때 계산)
+        if isinstance(answer_key, (str, Path)):
+            from answer_key import AnswerKey
+            answer_key = AnswerKey.load(str(answer_key))
+        self.answer_key = answer_key    # AnswerKey - 있으면 출력의 문제마다 정답(answer)을 결합
+        self.ocr = ocr                  # OCR 백엔드 (ocr_fallback) - 있으면 글자가 적은 PDF 페이지만 OCR
+        self.ocr_workers = ocr_workers  # OCR 풀의 동시 실행 수 (workers와 별개)
+        self.figures_dir = figures_dir  # 있으면 그림이 있는 문제만 잘라낸 PNG를 저장
+        self.figure_workers = figure_workers  # PNG 저장 풀의 동시 실행 수
+        self._figure_writer = None
+
+    @classmethod
+    def from_page_store(cls, file_hash: str, page_store, source: str = '', **options) -> 'ExamPDFParser':
+        """저장소에 있는 문서를 PDF 없이 파싱하는 파서"""
+        parser = cls(source or file_hash, page_store=page_store, **options)
+        parser.file_hash = file_hash
+        return parser
+
+    def config_fingerprint(self) -> Dict:
+        """출력에 영향을 주는 설정 (캐시 키용 - workers 같은 성능 옵션은 제외)"""
+        fingerprint = {'parser_version': PARSER_VERSION, 'table_strategy': self.table_strategy,
+                       'layout': self.layout, 'profile': self.profile_option, 'profiles': self.profile_fingerprint}
+        if self.answer_key is not None:
+            fingerprint['answers'] = self.answer_key.fingerprint
+        if self._ocr_enabled():
+            from ocr_fallback import backend_name
+            fingerprint['ocr'] = backend_name(self.ocr)
+        if self.figures_dir is not None:
+            fingerprint['figures_dir'] = str(self.figures_dir)
+        return fingerprint
+
+    def _stage(self, name: str):
+        """계측 단계 - tracer가 없으면 아무것도 하지 않는 context"""
+        return self.tracer.stage(name) if self.tracer else nullcontext()
+
+    def _count(self, name: str, n: int = 1) -> None:
+        if self.tracer:
+            self.tracer.count(name, n)
+
+    def _trace_page(self, page_num: int, text: Optional[str], timings: Dict) -> None:
+        if self.tracer:
+            self.tracer.page(page_num, chars=len(text or ''), **timings)
+
+    def _detect_profile(self, text: str) -> ExamProfile:
+        """첫 페이지 텍스트로 시험 프로필 선택 (지정했으면 그대로) 및 머리글 값 기록 - 문서당 1회"""
+        if not self._profile_detected:
+            with self._stage('detect_profile'):
+                if self.profile is None:
+                    registry = get_registry()
+                    self.profile = registry.detect(text) or registry.default
+                self.header_fields = self.profile.header_fields(text)
+            self._profile_detected = True
+        return self.profile
+
+    def _store(self):
+        if isinstance(self.page_store, (str, Path)):
+            from page_store import PageStore
+            self.page_store = PageStore(str(self.page_store))
+        return self.page_store
+
+    def _document_hash(self) -> str:
+        """문서 SHA-256 (저장소/캐시 키, 그림 파일 이름) - 없으면 처음 쓸 때 계산"""
+        if self.file_hash is None:
+            from parse_cache import file_sha256
+            self.file_hash = file_sha256(self.pdf_path)
+        return self.file_hash
+
+    def _stored_pages(self) -> Iterator[Tuple[int, Optional[str], List, Dict]]:
+        """저장소의 페이지를 순서대로 - 저장되어 있지 않으면 PDF에서 한 번 추출해 저장"""
+        store = self._store()
+        self._document_hash()
+
+        if store.has(self.file_hash):
+            self._count('page_store_hits')
+        else:
+            self._count('page_store_misses')
+            store.ensure(self.pdf_path, self.file_hash, on_page=self._trace_page)
+
+        for page_num, text, tables, _ in store.iter_pages(self.file_hash, layout=self.layout, figures=self.page_figures):
+            self._tables_loaded.add(page_num)   # 저장된 페이지는 테이블까지 있음
+            yield page_num, text, tables, {}
+
+    def _hwp_pages(self) -> Iterator[Tuple[int, Optional[str], List, Dict]]:
+        """HWP/HWPX 구역을 페이지처럼 - 테이블도 함께 읽으므로 lazy 추출 대상이 아님"""
+        from hwp_reader import iter_hwp_pages
+
+        for page_num, text, tables, timings in iter_hwp_pages(self.pdf_path):
+            self._tables_loaded.add(page_num)
+            yield page_num, text, tables, timings
+
+    def _ocr_enabled(self) -> bool:
+        """OCR을 실제로 적용하는지 - HWP/HWPX나 PDF 없이 저장소만 쓰는 경우는 렌더링할 페이지가 없어 무시"""
+        return self.ocr is not None and not is_hwp(self.pdf_path) and Path(self.pdf_path).is_file()
+
+    def _route_ocr(self, pages) -> Iterator[Tuple[int, Optional[str], List, Dict]]:
+        """OCR 백엔드가 있으면 글자가 적은 페이지를 OCR 결과로 바꿔 페이지 순서대로"""
+        if not self._ocr_enabled():
+            return iter(pages)
+        from ocr_fallback import OcrRouter
+        return OcrRouter(self.ocr, workers=self.ocr_workers).route(self.pdf_path, pages, count=self._count)
 
     def extract_text(self) -> str:
-        """PDF에서 텍스트 및 테이블 추출"""
+        """PDF(또는 HWP/HWPX)에서 텍스트 및 테이블 추출"""
+        with self._stage('extract_text'):
+            return self._extract_text()
+
+    def _extract_text(self) -> str:
+        self.page_offsets = []
+        self.page_figures = {}
+        self.table_index = None
+        self._tables_loaded = set()
+
+        with_tables = self.table_strategy == 'eager'
+        if self.page_store is not None:
+            pages = self._route_ocr(self._stored_pages())   # 저장소에는 OCR 전 추출 결과가 있음
+        elif is_hwp(self.pdf_path):
+            pages = self._hwp_pages()
+        elif self.workers > 1:
+            pages = self._route_ocr(self._extract_pages_parallel(with_tables))
+        else:
+            pages = self._route_ocr(_extract_page_range(self.pdf_path, with_tables=with_tables, layout=self.layout,
+                                                        figures=self.page_figures))
+
         full_text = []
+        offset = 0
 
-        with pdfplumber.open(self.pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages):
-                tables = page.extract_tables()
-                if tables:
-                    self.page_tables[page_num] = tables
-
-                text = page.extract_text()
-                if text:
-                    text = re.sub(
-                        r'2025년도 제23회 사회복지사 1급 3교시 A형 \( 18 - \d+ \)',
-                        '', text
-                    )
-                    full_text.append(text.strip())
+        # 페이지 순서대로 병합 - 순차 추출과 동일한 결과
+        for page_num, text, tables, timings in pages:
+            self._trace_page(page_num, text, timings)
+            if tables:
+                self.page_tables[page_num] = tables
+
+            if text:
+                cleaned = self._clean_page_text(text)
+                self.page_offsets.append((offset, page_num))
+                full_text.append(cleaned)
+                offset += len(cleaned) + 1
 
         self.raw_text = '\n'.join(full_text)
         return self.raw_text
 
+    def _clean_page_text(self, text: str) -> str:
+        """페이지 머리글 제거"""
+        return self._detect_profile(text).page_header.sub('', text).strip()
+
+    def _page_count(self) -> int:
+        """PDF 페이지 수"""
+        with pdfplumber.open(self.pdf_path) as pdf:
+            return len(pdf.pages)
+
+    def _extract_pages_parallel(self, with_tables: bool = True) -> List[Tuple[int, Optional[str], List, Dict]]:
+        """페이지 구간을 워커별로 나눠 추출 (각 워커가 PDF를 독립적으로 open)"""
+        page_count = self._page_count()
+        if page_count == 0:
+            return []
+        workers = min(self.workers, page_count)
+        chunk_size = -(-page_count // workers)  # ceil
+        ranges = [(start, min(start + chunk_size, page_count))
+                  for start in range(0, page_count, chunk_size)]
+
+        pages = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_extract_page_range_with_figures, self.pdf_path, start, end,
+                                       with_tables, self.layout)
+                       for start, end in ranges]
+            for future in futures:
+                chunk, figures = future.result()
+                pages.extend(chunk)
+                self.page_figures.update(figures)
+        return pages
+
+    def _load_tables(self, pages) -> None:
+        """lazy 모드 - 아직 테이블을 추출하지 않은 페이지만 추출해 page_tables/색인에 반영 (페이지별 1회)"""
+        missing = sorted(p for p in pages if p not in self._tables_loaded)
+        if not missing:
+            return
+
+        def extract(pdf):
+            for page_num in missing:
+                if page_num < len(pdf.pages):
+                    start = time.perf_counter()
+                    page = pdf.pages[page_num]
+                    tables = page.extract_tables()
+                    page.close()    # 레이아웃 캐시를 들고 있지 않도록
+                    if self.tracer:
+                        self.tracer.page(page_num, tables=time.perf_counter() - start)
+                    if tables:
+                        self.page_tables[page_num] = tables
+                        if self.table_index is not None:
+                            self.table_index.add_page(page_num, tables)
+                self._tables_loaded.add(page_num)
+
+        with self._stage('extract_tables'):
+            if self._open_pdf is not None:
+                extract(self._open_pdf)
+            else:
+                with pdfplumber.open(self.pdf_path) as pdf:
+                    extract(pdf)
+
     def identify_sections(self) -> List[str]:
         """과목 식별"""
-        pattern = r'사회복지정책과 제도\([^)]+\)'
-        matches = re.findall(pattern, self.raw_text)
-        self.sections = list(dict.fromkeys(matches))
+        with self._stage('identify_sections'):
+            matches = self._detect_profile(self.raw_text).section_pattern.findall(self.raw_text)
+            self.sections = list(dict.fromkeys(matches))
+        self._count('section_matches', len(matches))
         return self.sections
 
     def _clean_text(self, text: str) -> str:
         """텍스트 정리"""
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        return _clean_text(text)
 
     def _extract_question_and_passage(self, text: str) -> tuple[str, List[PassageItem], str]:
         """
@@ -108,120 +683,130 @@ class ExamPDFParser:
         Returns:
             (질문문, 지문 리스트, 나머지 텍스트)
         """
-        question = ""
-        passage_items = []
-        remaining = text
-
-        # 1. 질문문 추출 (? 로 끝나는 부분)
-        # "다음에서 설명하고 있는 정책결정모형은?" 같은 패턴
-        question_patterns = [
-            r'^(.+?것은\s*\?)',           # ~것은?
-            r'^(.+?[가-힣]+은\s*\?)',      # ~은?
-            r'^(.+?[가-힣]+를\s*\?)',      # ~를?
-            r'^(.+?\?\s*)',               # 일반 ?
-        ]
-
-        for pattern in question_patterns:
-            match = re.match(pattern, text, re.DOTALL)
-            if match:
-                question = self._clean_text(match.group(1))
-                remaining = text[match.end():]
-                break
-
-        if not question:
-            # ? 가 없는 경우, 첫 번째 ○ 또는 ㄱ. 이전까지를 질문으로
-            first_marker = re.search(r'(○|[ㄱ-ㅎ]\.)', remaining)
-            if first_marker:
-                question = self._clean_text(remaining[:first_marker.start()])
-                remaining = remaining[first_marker.start():]
-            else:
-                # 첫 번째 보기 이전까지를 질문으로
-                first_choice = re.search(r'[①②③④⑤]', remaining)
-                if first_choice:
-                    question = self._clean_text(remaining[:first_choice.start()])
-                    remaining = remaining[first_choice.start():]
-
-        # 2. 지문 추출 (○ 항목들)
-        # ○ 로 시작하는 항목들 추출
-        circle_pattern = r'○\s*([^○①②③④⑤]+?)(?=○|[①②③④⑤]|$)'
-        circle_matches = re.findall(circle_pattern, remaining, re.DOTALL)
-
-        for content in circle_matches:
-            cleaned = self._clean_text(content)
-            if cleaned:
-                passage_items.append(PassageItem(marker='○', text=cleaned))
-
-        # ○ 항목들 제거
-        if circle_matches:
-            remaining = re.sub(circle_pattern, '', remaining, flags=re.DOTALL)
-
-        # 3. 지문 추출 (ㄱ. ㄴ. ㄷ. 항목들)
-        jamo_pattern = r'([ㄱ-ㅎ])\.\s*([^ㄱ-ㅎ①②③④⑤]+?)(?=[ㄱ-ㅎ]\.|[①②③④⑤]|$)'
-        jamo_matches = re.findall(jamo_pattern, remaining, re.DOTALL)
-
-        for label, content in jamo_matches:
-            cleaned = self._clean_text(content)
-            if cleaned:
-                passage_items.append(PassageItem(marker=label, text=cleaned))
-
-        # ㄱ.ㄴ.ㄷ. 항목들 제거
-        if jamo_matches:
-            remaining = re.sub(jamo_pattern, '', remaining, flags=re.DOTALL)
-
+        question, passage_items, _, remaining = _tokenize_block(text)
         return question, passage_items, remaining
 
     def _extract_choices(self, text: str) -> List[Choice]:
         """보기(①②③④⑤) 추출"""
-        choices = []
-
-        pattern = r'([①②③④⑤])\s*([^①②③④⑤]+?)(?=[①②③④⑤]|$)'
-        matches = re.findall(pattern, text, re.DOTALL)
-
-        for symbol, content in matches:
-            number = self.CIRCLE_NUMBERS.get(symbol, 0)
-            if number > 0:
-                choices.append(Choice(
-                    number=number,
-                    text=self._clean_text(content)
-                ))
-
-        return choices
-
-    def _find_table_for_question(self, q_num: int, q_text: str) -> Optional[Table]:
-        """문제에 해당하는 테이블 찾기"""
-        table_keywords = {
-            4: ['대상자', '사회복지', '주체', '권리수준'],
-        }
-
-        for page_num, tables in self.page_tables.items():
-            for table_data in tables:
-                if not table_data or len(table_data) < 2:
-                    continue
-
-                table_str = str(table_data)
-
-                if q_num in table_keywords:
-                    keywords = table_keywords[q_num]
-                    if all(kw in table_str for kw in keywords[:3]):
-                        headers = [c if c else '' for c in table_data[0]]
-                        rows = [[c if c else '' for c in row] for row in table_data[1:]]
-                        return Table(headers=headers, rows=rows)
-
-                if table_data[0]:
-                    header_match = sum(1 for h in table_data[0] if h and h in q_text)
-                    if header_match >= 2:
-                        headers = [c if c else '' for c in table_data[0]]
-                        rows = [[c if c else '' for c in row] for row in table_data[1:]]
-                        return Table(headers=headers, rows=rows)
+        tokens = [(m.start(), m.group()) for m in Patterns.BLOCK_TOKEN.finditer(text)]
+        choice_items, _, _ = _match_items(_CHOICE_EXCLUDED, text, tokens)
+        return [
+            Choice(number=self.CIRCLE_NUMBERS[symbol], text=_clean_text(content))
+            for symbol, content in choice_items
+        ]
 
-        return None
+    def _find_table_for_question(self, q_num: int, q_text: str, pages: range = range(0)) -> Optional[Table]:
+        """문제에 해당하는 테이블 찾기 (문제 블록이 걸친 페이지 우선)"""
+        if self.table_strategy == 'lazy':
+            self._load_tables(pages)
+
+        with self._stage('table_lookup'):
+            if self.table_index is None:
+                self.table_index = TableIndex.from_page_tables(self.page_tables)
+            table_data = self.table_index.find(q_text, pages)
+
+        if table_data is None:
+            return None
+
+        headers = [c if c else '' for c in table_data[0]]
+        rows = [[c if c else '' for c in row] for row in table_data[1:]]
+        return Table(headers=headers, rows=rows)
+
+    def _pages_for_span(self, start: int, end: int, page_offsets: List[Tuple[int, int]]) -> range:
+        """텍스트 구간 [start, end)가 걸친 페이지 범위"""
+        if not page_offsets:
+            return range(0)
+        offsets = [offset for offset, _ in page_offsets]
+        first = page_offsets[max(bisect_right(offsets, start) - 1, 0)][1]
+        last = page_offsets[max(bisect_right(offsets, max(end - 1, start)) - 1, 0)][1]
+        return range(first, last + 1)
+
+    def _figures_for_question(self, q_num: int, pages: range) -> List[Figure]:
+        """
+        블록이 걸친 페이지의 그림 중 이 문제 번호 아래에 있는 것, 그리고 블록이 이어지는
+        페이지에서 첫 문제 번호보다 위에 있는 것 - figures_dir가 있으면 PNG 저장을 풀에 맡김
+        """
+        figures = []
+        for page_num in pages:
+            for i, found in enumerate(self.page_figures.get(page_num, ())):
+                if found['anchor'] == q_num or (found['anchor'] is None and page_num > pages.start):
+                    figure = Figure(page=page_num + 1, bbox=found['bbox'], kind=found['kind'])
+                    if self.figures_dir is not None:
+                        if self._figure_writer is None:
+                            self._figure_writer = FigureWriter(self.figures_dir, workers=self.figure_workers)
+                        # 그림 디렉터리는 문서끼리 공유하므로 이름이 같은 다른 문서와 겹치지 않게 해시를 붙임
+                        name = (f"{Path(self.pdf_path).stem}-{self._document_hash()[:8]}"
+                                f"_q{q_num:02d}_p{page_num + 1}_{i + 1}.png")
+                        figure.path = self._figure_writer.submit(self.pdf_path, page_num, found['bbox'], name)
+                    figures.append(figure)
+        return figures
+
+    def _close_figures(self) -> None:
+        """풀에 맡긴 그림 PNG가 모두 저장될 때까지 기다림"""
+        if self._figure_writer is not None:
+            with self._stage('write_figures'):
+                self._count('figures_written', self._figure_writer.close())
+            self._figure_writer = None
 
     def _has_table_indicators(self, text: str) -> bool:
         """테이블 포함 여부 확인"""
-        indicators = [
-            r'대상자.*사회복지.*주체.*권리수준',
-        ]
-        return any(re.search(p, text) for p in indicators)
+        return any(p.search(text) for p in Patterns.TABLE_INDICATORS)
+
+    def _section_for(self, q_num: int) -> str:
+        """문제 번호로 과목 결정"""
+        return self._detect_profile(self.raw_text).section_for(q_num)
+
+    def _build_question(self, q_num: int, q_text: str, pages: range = range(0)) -> Question:
+        """문제 블록 하나를 Question으로 구조화 (pages: 블록이 걸친 페이지)"""
+        profile = self._detect_profile(self.raw_text)
+        current_section = profile.section_for(q_num)
+
+        # 섹션 제목 / 안내 문구 제거
+        for section in self.sections:
+            q_text = q_text.replace(section, '')
+        if profile.instruction_text:
+            q_text = q_text.replace(profile.instruction_text, '')
+
+        # 테이블 확인
+        table = None
+        if self._has_table_indicators(q_text):
+            self._count('table_indicator_matches')
+            table = self._find_table_for_question(q_num, q_text, pages)
+
+        figures = self._figures_for_question(q_num, pages)
+
+        # 질문, 지문, 보기 분리 (블록을 한 번만 훑음)
+        question_text, passage_items, choices, _ = _tokenize_block(q_text)
+        if self.tracer:
+            self.tracer.count('questions')
+            self.tracer.count('passage_items', len(passage_items))
+            self.tracer.count('choices', len(choices))
+            self.tracer.count('tables', 1 if table else 0)
+            self.tracer.count('figures', len(figures))
+
+        # 테이블이 있고 질문에 테이블 내용이 섞여있으면 정리
+        if table and question_text:
+            # 테이블 셀 내용이 질문에 포함되어 있으면 제거
+            for row in table.rows:
+                for cell in row:
+                    if cell and len(cell) > 3:
+                        cell_clean = cell.replace('\n', ' ')
+                        question_text = question_text.replace(cell_clean, '')
+
+            # 빈칸 표시 정리
+            for pattern in Patterns.BLANK_MARKERS:
+                question_text = pattern.sub('', question_text)
+            question_text = _clean_text(question_text)
+
+        return Question(
+            number=q_num,
+            section=current_section,
+            question=question_text,
+            passage=passage_items,
+            choices=choices,
+            table=table,
+            figures=figures
+        )
 
     def parse_questions(self) -> List[Question]:
         """전체 텍스트에서 문제 파싱"""
@@ -231,103 +816,195 @@ class ExamPDFParser:
         if not self.sections:
             self.identify_sections()
 
-        section_boundaries = {
-            (1, 25): '사회복지정책과 제도(사회복지정책론)',
-            (26, 50): '사회복지정책과 제도(사회복지행정론)',
-            (51, 75): '사회복지정책과 제도(사회복지법제론)'
-        }
-
-        def get_section(q_num):
-            for (start, end), section in section_boundaries.items():
-                if start <= q_num <= end:
-                    return section
-            return "Unknown"
-
-        # 문제 번호로 분리
-        question_pattern = r'(?:^|\n)(\d{1,2})\.\s+'
-        matches = list(re.finditer(question_pattern, self.raw_text))
-
-        for i, match in enumerate(matches):
-            q_num = int(match.group(1))
-            start_pos = match.end()
-            end_pos = matches[i + 1].start() if i + 1 < len(matches) else len(self.raw_text)
-
-            q_text = self.raw_text[start_pos:end_pos]
-            current_section = get_section(q_num)
-
-            # 섹션 제목 제거
-            for section in self.sections:
-                q_text = q_text.replace(section, '')
-            q_text = re.sub(r'각 문제에서 요구하는 가장 적합한 답 1개만을 고르시오\.', '', q_text)
-
-            # 테이블 확인
-            table = None
-            if self._has_table_indicators(q_text):
-                table = self._find_table_for_question(q_num, q_text)
-
-            # 질문, 지문, 나머지 분리
-            question_text, passage_items, remaining = self._extract_question_and_passage(q_text)
-
-            # 보기 추출
-            choices = self._extract_choices(remaining)
-
-            # 테이블이 있고 질문에 테이블 내용이 섞여있으면 정리
-            if table and question_text:
-                # 테이블 셀 내용이 질문에 포함되어 있으면 제거
-                for row in table.rows:
-                    for cell in row:
-                        if cell and len(cell) > 3:
-                            cell_clean = cell.replace('\n', ' ')
-                            question_text = question_text.replace(cell_clean, '')
-
-                # 빈칸 표시 정리
-                question_text = re.sub(r'\(\s*ㄱ\s*\)', '', question_text)
-                question_text = re.sub(r'\(\s*ㄴ\s*\)', '', question_text)
-                question_text = re.sub(r'\(\s*ㄷ\s*\)', '', question_text)
-                question_text = self._clean_text(question_text)
-
-            question = Question(
-                number=q_num,
-                section=current_section,
-                question=question_text,
-                passage=passage_items,
-                choices=choices,
-                table=table
-            )
-
-            self.questions.append(question)
+        with self._stage('parse_questions'):
+            # 문제 번호로 분리
+            with self._stage('split_blocks'):
+                matches = list(Patterns.QUESTION_START.finditer(self.raw_text))
+                blocks = []
+                for i, match in enumerate(matches):
+                    start_pos = match.end()
+                    end_pos = matches[i + 1].start() if i + 1 < len(matches) else len(self.raw_text)
+                    pages = self._pages_for_span(start_pos, end_pos, self.page_offsets)
+                    blocks.append((int(match.group(1)), self.raw_text[start_pos:end_pos], pages))
+            self._count('question_start_matches', len(matches))
+
+            # lazy 모드: 테이블 표시가 있는 문제가 걸친 페이지만 PDF를 한 번 열어 추출
+            if self.table_strategy == 'lazy':
+                self._load_tables({page for _, q_text, pages in blocks
+                                   if self._has_table_indicators(q_text) for page in pages})
+
+            with self._stage('build_questions'):
+                for q_num, q_text, pages in blocks:
+                    self.questions.append(self._build_question(q_num, q_text, pages))
+        self._close_figures()
 
         return self.questions
 
-    def to_json(self, output_path: str = None) -> str:
-        """JSON 형식으로 변환"""
+    def iter_questions(self) -> Iterator[Question]:
+        """
+        페이지를 하나씩 읽으며 문제 블록이 닫히는 즉시 Question을 yield
+
+        다음 문제 번호가 나타나야 블록이 닫히므로 페이지 경계를 넘는 문제도
+        parse_questions()와 같은 결과가 된다. 열린 블록의 텍스트와 그 블록이
+        걸친 페이지의 테이블만 유지하고 self.raw_text / self.questions에는
+        쌓지 않아, 문제집이 길어져도 메모리 사용량이 늘지 않는다.
+        figures_dir가 있으면 그림 PNG는 순회가 끝날 때 모두 저장되어 있다.
+        """
+        try:
+            if self.page_store is not None:
+                yield from self._iter_page_questions(self._route_ocr(self._stored_pages()))
+            elif is_hwp(self.pdf_path):
+                yield from self._iter_page_questions(self._hwp_pages())
+            else:
+                with pdfplumber.open(self.pdf_path) as pdf:
+                    self._open_pdf = pdf
+                    try:
+                        yield from self._iter_page_questions(self._route_ocr(self._read_pages(pdf)))
+                    finally:
+                        self._open_pdf = None
+        finally:
+            self._close_figures()
+
+    def _read_pages(self, pdf) -> Iterator[Tuple[int, Optional[str], List, Dict]]:
+        """열린 PDF의 페이지를 순서대로 추출"""
+        with_tables = self.table_strategy == 'eager'
+        for page_num, page in enumerate(pdf.pages):
+            with self._stage('extract_text'):
+                extracted = extract_page(page, with_tables, self.layout)
+            if extracted.figures:
+                self.page_figures[page_num] = extracted.figures
+            yield page_num, extracted.text, extracted.tables, extracted.timings
+
+    def _iter_page_questions(self, pages) -> Iterator[Question]:
+        """iter_questions 본체 - (페이지 번호, 텍스트, 테이블, 소요 시간)을 순서대로 훑음"""
+        buffer = None            # 열린 블록부터 현재 페이지까지의 텍스트
+        buffer_page = 0          # buffer가 시작되는 페이지
+        page_offsets = []        # buffer 안에서 각 페이지가 시작되는 위치 [(offset, page_num)]
+        self.table_index = TableIndex()
+
+        for page_num, text, tables, timings in pages:
+            self._trace_page(page_num, text, timings)
+            if tables:
+                self.page_tables[page_num] = tables
+                self.table_index.add_page(page_num, tables)
+            if not text:
+                continue
+
+            text = self._clean_page_text(text)
+            if buffer is None:
+                buffer = text
+                page_offsets = [(0, page_num)]
+            else:
+                page_offsets.append((len(buffer) + 1, page_num))
+                buffer = buffer + '\n' + text
+
+            for section in self.profile.section_pattern.findall(buffer):
+                if section not in self.sections:
+                    self.sections.append(section)
+
+            matches = list(Patterns.QUESTION_START.finditer(buffer))
+            if not matches:
+                continue
+
+            # 마지막 블록은 다음 문제 번호가 나올 때까지 열려 있음
+            for match, next_match in zip(matches, matches[1:]):
+                pages = self._pages_for_span(match.end(), next_match.start(), page_offsets)
+                with self._stage('build_questions'):
+                    question = self._build_question(int(match.group(1)), buffer[match.end():next_match.start()], pages)
+                yield question
+
+            # 열린 블록 앞부분은 버리고, 그 블록이 시작된 페이지 이전의 테이블도 정리
+            open_start = matches[-1].start()
+            buffer_page = max(num for offset, num in page_offsets if offset <= open_start)
+            buffer = buffer[open_start:]
+            page_offsets = [(max(offset - open_start, 0), num)
+                            for offset, num in page_offsets if num >= buffer_page]
+            for num in [num for num in self.page_tables if num < buffer_page]:
+                del self.page_tables[num]
+            for num in [num for num in self.page_figures if num < buffer_page]:
+                del self.page_figures[num]
+            self.table_index.remove_pages_before(buffer_page)
+
+        if buffer is not None:
+            matches = list(Patterns.QUESTION_START.finditer(buffer))
+            for i, match in enumerate(matches):
+                end_pos = matches[i + 1].start() if i + 1 < len(matches) else len(buffer)
+                pages = self._pages_for_span(match.end(), end_pos, page_offsets)
+                with self._stage('build_questions'):
+                    question = self._build_question(int(match.group(1)), buffer[match.end():end_pos], pages)
+                yield question
+
+    def to_dict(self) -> Dict:
+        """to_json()이 직렬화하는 구조를 dict로 반환 (계측을 켜면 metrics 블록 포함)"""
+        if not self.questions:
+            self.parse_questions()
+
+        with self._stage('to_dict'):
+            data = self._questions_dict()
+
+        if self.tracer:
+            data['metrics'] = self.tracer.to_dict()
+        return data
+
+    def exam_info(self) -> Dict:
+        """출력의 exam_info 블록"""
+        info = self._detect_profile('').exam_info(self.header_fields)
+        info['total_questions'] = len(self.questions)
+        info['sections'] = self.sections
+        return info
+
+    def to_question_bank(self):
+        """파싱 결과를 열 기반 QuestionBank로 (문제 객체 대신 공유 문자열 버퍼에 보관)"""
+        from question_bank import QuestionBank
+
         if not self.questions:
             self.parse_questions()
+        return QuestionBank.from_questions(self.questions, self.exam_info())
 
+    def _questions_dict(self) -> Dict:
         data = {
-            'exam_info': {
-                'year': 2025,
-                'round': 23,
-                'subject': '3교시',
-                'type': 'A형',
-                'total_questions': len(self.questions),
-                'sections': self.sections
-            },
+            'exam_info': self.exam_info(),
             'questions': []
         }
 
         for q in self.questions:
-            q_dict = {
-                'number': q.number,
-                'section': q.section,
-                'question': q.question,
-                'passage': [{'marker': p.marker, 'text': p.text} for p in q.passage],
-                'choices': [{'number': c.number, 'text': c.text} for c in q.choices],
-                'table': q.table.to_dict() if q.table else None
-            }
-            data['questions'].append(q_dict)
-
-        json_str = json.dumps(data, ensure_ascii=False, indent=2)
+            data['questions'].append(self._question_dict(q))
+
+        if self.answer_key is not None:
+            from answer_key import join_answers
+            with self._stage('join_answers'):
+                joined = join_answers(data['questions'], self.answer_key.row(data['exam_info']))
+            self._count('answers_joined', joined)
+        return data
+
+    @staticmethod
+    def _question_dict(q: Question) -> Dict:
+        return {
+            'number': q.number,
+            'section': q.section,
+            'question': q.question,
+            'passage': [{'marker': p.marker, 'text': p.text} for p in q.passage],
+            'choices': [{'number': c.number, 'text': c.text} for c in q.choices],
+            'table': q.table.to_dict() if q.table else None,
+            **({'figures': [f.to_dict() for f in q.figures]} if q.figures else {})
+        }
+
+    def to_json(self, output_path: str = None, compact: bool = False) -> str:
+        """JSON 형식으로 변환 (compact=True면 들여쓰기/공백 없이)"""
+        data = self.to_dict()
+        metrics = data.pop('metrics', None)
+        dump_options = {'separators': (',', ':')} if compact else {'indent': 2}
+
+        with self._stage('json_dumps'):
+            json_str = json.dumps(data, ensure_ascii=False, **dump_options)
+
+        if metrics is not None:
+            # 직렬화 시간까지 담기 위해 metrics는 마지막에 붙임 (전체를 json.dumps한 것과 같은 형식)
+            metrics_str = json.dumps(self.tracer.to_dict(), ensure_ascii=False, **dump_options)
+            if compact:
+                json_str = json_str[:-1] + ',"metrics":' + metrics_str + '}'
+            else:
+                json_str = json_str[:-2] + ',\n  "metrics": ' + metrics_str.replace('\n', '\n  ') + '\n}'
 
         if output_path:
             with open(output_path, 'w', encoding='utf-8') as f:
@@ -335,12 +1012,60 @@ class ExamPDFParser:
 
         return json_str
 
+    def write_ndjson(self, fp: TextIO, compact: bool = False) -> int:
+        """
+        NDJSON 스트리밍 출력 - 한 줄에 레코드 하나, 줄마다 flush
+
+            {"type": "exam_info", "exam_info": {...}}      (total_questions/sections 제외)
+            {"type": "question", "question": {...}}        (문제마다, to_json의 항목과 같은 구조)
+            {"type": "end", "total_questions": N, "sections": [...], "metrics": {...}}
+
+        아직 파싱하지 않았으면 iter_questions()로 페이지를 읽는 대로 문제를 내보내므로
+        전체 텍스트/문제 목록/JSON 문자열을 메모리에 쌓지 않는다.
+
+        Returns:
+            기록한 문제 수
+        """
+        separators = (',', ':') if compact else (', ', ': ')
+
+        def write(record):
+            fp.write(json.dumps(record, ensure_ascii=False, separators=separators) + '\n')
+            fp.flush()
+
+        questions = iter(self.questions if self.questions else self.iter_questions())
+        # 첫 문제를 만들며 첫 페이지를 읽어야 시험 프로필/머리글 값이 정해짐
+        first = next(questions, None)
+
+        header = {k: v for k, v in self.exam_info().items() if k not in ('total_questions', 'sections')}
+        write({'type': 'exam_info', 'exam_info': header})
+
+        if self.answer_key is not None:
+            from answer_key import join_answers
+            row = self.answer_key.row(header)
+
+        total = 0
+        if first is not None:
+            questions = chain([first], questions)
+        for q in questions:
+            record = self._question_dict(q)
+            if self.answer_key is not None:
+                join_answers([record], row)
+            with self._stage('json_dumps'):
+                write({'type': 'question', 'question': record})
+            total += 1
+
+        end = {'type': 'end', 'total_questions': total, 'sections': self.sections}
+        if self.tracer:
+            end['metrics'] = self.tracer.to_dict()
+        write(end)
+        return total
+
     def to_markdown(self, output_path: str = None) -> str:
         """마크다운 형식으로 변환"""
         if not self.questions:
             self.parse_questions()
 
-        lines = ["# 2025년도 제23회 사회복지사 1급 3교시 A형\n"]
+        lines = [f"# {self._detect_profile('').title(self.header_fields)}\n"]
         current_section = ""
 
         for q in self.questions:
@@ -356,6 +1081,11 @@ class ExamPDFParser:
                 lines.append(q.table.to_markdown())
                 lines.append("")
 
+            # 그림 (잘라낸 PNG가 있는 경우)
+            for figure in q.figures:
+                if figure.path:
+                    lines.append(f"![{q.number}번 그림]({figure.path})\n")
+
             # 지문 (있는 경우)
             if q.passage:
                 for p in q.passage:
@@ -391,13 +1121,7 @@ class ExamPDFParser:
         output = StringIO()
         writer = csv.writer(output)
 
-        writer.writerow([
-            '문제번호', '과목', '질문',
-            '지문_○1', '지문_○2', '지문_○3',
-            '지문_ㄱ', '지문_ㄴ', '지문_ㄷ', '지문_ㄹ', '지문_ㅁ',
-            '보기①', '보기②', '보기③', '보기④', '보기⑤',
-            '테이블'
-        ])
+        writer.writerow(CSV_HEADER)
 
         for q in self.questions:
             # 지문을 마커별로 분류
@@ -437,13 +1161,75 @@ class ExamPDFParser:
 
 
 def main():
-    import sys
-
-    pdf_path = sys.argv[1] if len(sys.argv) > 1 else "/home/claude/exam.pdf"
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description='사회복지사 1급 시험 문제지 PDF 파서 v2')
+    arg_parser.add_argument('inputs', nargs='+', help='PDF/HWP/HWPX 파일, 디렉터리 또는 glob 패턴')
+    arg_parser.add_argument('-o', '--output-dir', default='.', help='JSON/MD/CSV 저장 디렉터리')
+    arg_parser.add_argument('--workers', type=int, default=None,
+                            help='동시에 처리할 파일 수 (일괄 모드, 기본: CPU 수)')
+    arg_parser.add_argument('--resume', action='store_true',
+                            help='해시가 같고 이미 처리된 파일은 건너뜀 (일괄 모드)')
+    arg_parser.add_argument('--tables', choices=ExamPDFParser.TABLE_STRATEGIES, default='eager',
+                            help='테이블 추출 방식 (lazy: 테이블 문제가 걸친 페이지만 추출)')
+    arg_parser.add_argument('--layout', choices=ExamPDFParser.LAYOUTS, default='text',
+                            help='페이지 텍스트 추출 방식 (columns: 2단 편집을 단 순서대로 읽음)')
+    arg_parser.add_argument('--profile', default=None,
+                            help='시험 프로필 id (기본: 첫 페이지로 자동 선택, profiles/ 참고)')
+    arg_parser.add_argument('--page-store', default=None,
+                            help='페이지 추출 결과 저장소 경로 (있으면 재사용, 없으면 추출 후 저장)')
+    arg_parser.add_argument('--answers', default=None,
+                            help='정답표 JSON (answer_key.py로 생성) - 문제마다 정답(answer)을 결합')
+    arg_parser.add_argument('--ocr', default=None,
+                            help="글자가 거의 없는 스캔 페이지만 OCR할 백엔드 ('tesseract' 또는 'module:Class')")
+    arg_parser.add_argument('--ocr-workers', type=int, default=1,
+                            help='OCR 동시 실행 수 (텍스트 추출과 별도 프로세스 풀)')
+    arg_parser.add_argument('--figures', action='store_true',
+                            help='그림이 있는 문제만 그림 영역을 PNG로 잘라 <output-dir>/figures에 저장')
+    arg_parser.add_argument('--figure-workers', type=int, default=1,
+                            help='그림 PNG 저장 동시 실행 수')
+    arg_parser.add_argument('--trace', action='store_true',
+                            help='단계/페이지별 소요 시간을 JSON의 metrics 블록에 기록')
+    arg_parser.add_argument('--ndjson', action='store_true',
+                            help='문제를 파싱하는 대로 NDJSON으로 stdout에 출력 (단일 파일)')
+    arg_parser.add_argument('--compact', action='store_true',
+                            help='JSON/NDJSON을 공백 없이 출력')
+    arg_parser.add_argument('--msgpack', action='store_true',
+                            help='Rails 레코드 형태의 MessagePack을 stdout에 출력 (단일 파일)')
+    args = arg_parser.parse_args()
+    options = {'table_strategy': args.tables, 'layout': args.layout, 'trace': args.trace, 'profile': args.profile,
+               'page_store': args.page_store, 'answer_key': args.answers, 'ocr': args.ocr,
+               'ocr_workers': args.ocr_workers, 'figure_workers': args.figure_workers,
+               'figures_dir': str(Path(args.output_dir) / 'figures') if args.figures else None}
+
+    if args.ndjson or args.msgpack:
+        if len(args.inputs) > 1 or not Path(args.inputs[0]).is_file():
+            arg_parser.error('--ndjson/--msgpack은 문서 파일 하나에만 사용할 수 있습니다')
+
+        parser = ExamPDFParser(args.inputs[0], **options)
+        if args.msgpack:
+            from rails_interchange import write_msgpack
+            write_msgpack(parser, sys.stdout.buffer)
+        else:
+            parser.write_ndjson(sys.stdout, compact=args.compact)
+        return
+
+    if len(args.inputs) > 1 or not Path(args.inputs[0]).is_file():
+        from batch_parser import run_batch
+
+        manifest = run_batch(args.inputs, args.output_dir, workers=args.workers, resume=args.resume,
+                             options=options)
+        summary = manifest['summary']
+        print(f"\n완료: 성공 {summary['ok']} / 실패 {summary['failed']} / 건너뜀 {summary['skipped']}, "
+              f"문제 {summary['questions']}개 ({summary['elapsed']:.1f}s)")
+        print(f"manifest: {Path(args.output_dir) / 'manifest.json'}")
+        return
+
+    pdf_path = args.inputs[0]
 
     print(f"PDF 파일 파싱 중: {pdf_path}")
 
-    parser = ExamPDFParser(pdf_path)
+    parser = ExamPDFParser(pdf_path, **options)
 
     print("\n1. 텍스트 추출 중...")
     parser.extract_text()
@@ -456,17 +1242,19 @@ def main():
     questions = parser.parse_questions()
     print(f"   파싱된 문제 수: {len(questions)}")
 
-    output_dir = Path("/home/claude")
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stem = Path(pdf_path).stem
 
-    json_path = output_dir / "exam_v2.json"
-    parser.to_json(str(json_path))
+    json_path = output_dir / f"{stem}.json"
+    parser.to_json(str(json_path), compact=args.compact)
     print(f"\n4. JSON 저장: {json_path}")
 
-    md_path = output_dir / "exam_v2.md"
+    md_path = output_dir / f"{stem}.md"
     parser.to_markdown(str(md_path))
     print(f"5. Markdown 저장: {md_path}")
 
-    csv_path = output_dir / "exam_v2.csv"
+    csv_path = output_dir / f"{stem}.csv"
     parser.to_csv(str(csv_path))
     print(f"6. CSV 저장: {csv_path}")
 
@@ -475,7 +1263,7 @@ def main():
     print("파싱 결과 샘플")
     print("="*70)
 
-    for q in [questions[0], questions[3], questions[5], questions[9]]:  # 1, 4, 6, 10번
+    for q in [questions[i] for i in (0, 3, 5, 9) if i < len(questions)]:  # 1, 4, 6, 10번
         print(f"\n[문제 {q.number}]")
         print(f"  질문: {q.question}")
         if q.table:
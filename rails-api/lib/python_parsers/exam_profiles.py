@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+시험 프로필 - 자격시험/교시별 페이지 머리글, 과목 구간, 안내 문구, 제목
+
+profiles/ 아래의 JSON(또는 PyYAML이 있으면 YAML) 파일로 선언하고, 문제지 첫 페이지의
+텍스트를 각 프로필의 detect 정규식에 맞춰 자동으로 고른다. 파일은 한 번만 읽어
+정규식을 컴파일한 ProfileRegistry로 캐시하므로 (파일이 바뀌면 다시 읽음), 파서 서버
+한 프로세스가 회차/교시가 다른 문제지를 코드 수정 없이 처리한다.
+
+파일 형식 (최상위 키는 profiles의 각 항목에 기본값으로 적용):
+    {
+      "certification": "사회복지사 1급",
+      "page_header": "(?P<year>\\d{4})년도 제(?P<round>\\d+)회 ... \\( \\d+ - \\d+ \\)",
+      "instruction_text": "각 문제에서 요구하는 가장 적합한 답 1개만을 고르시오.",
+      "title": "{year}년도 제{round}회 {certification} {subject} {type}",
+      "profiles": [
+        {"id": "social-worker-1-s3", "subject": "3교시",
+         "detect": "사회복지사\\s*1급\\s*3교시|사회복지정책과 제도\\(",
+         "section_pattern": "사회복지정책과 제도\\([^)]+\\)",
+         "sections": [{"start": 1, "end": 25, "name": "..."}, ...]}
+      ]
+    }
+
+page_header의 이름 있는 그룹(year, round, subject, type)은 exam_info와 제목에 쓰인다.
+EXAM_PROFILE_PATH (os.pathsep 구분)로 프로필 디렉터리를 추가할 수 있다.
+"""
+
+import os
+import re
+import json
+import hashlib
+from bisect import bisect_right
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+PROFILE_DIR = Path(__file__).resolve().parent / 'profiles'
+
+# 첫 페이지로 프로필을 고르지 못했을 때 쓰는 프로필 (기존 3교시 동작)
+DEFAULT_PROFILE_ID = os.environ.get('EXAM_PROFILE_DEFAULT', 'social-worker-1-s3')
+
+PROFILE_SUFFIXES = ('.json', '.yaml', '.yml')
+
+
+def _yaml():
+    try:
+        import yaml
+    except ImportError as e:
+        raise ImportError("YAML 프로필에는 PyYAML 패키지가 필요합니다 (pip install pyyaml)") from e
+    return yaml
+
+
+class ExamProfile:
+    """컴파일된 시험 프로필 하나"""
+
+    __slots__ = ('id', 'certification', 'subject', 'detect', 'page_header', 'section_pattern',
+                 'instruction_text', 'title_template', 'sections', '_starts', 'spec')
+
+    def __init__(self, spec: Dict):
+        for key in ('id', 'detect', 'page_header', 'section_pattern', 'sections'):
+            if key not in spec:
+                raise ValueError(f"시험 프로필에 {key}가 없습니다: {spec.get('id', '?')}")
+
+        self.spec = spec
+        self.id = spec['id']
+        self.certification = spec.get('certification', '')
+        self.subject = spec.get('subject')
+        self.detect = re.compile(spec['detect'])
+        self.page_header = re.compile(spec['page_header'])
+        self.section_pattern = re.compile(spec['section_pattern'])
+        self.instruction_text = spec.get('instruction_text', '')
+        self.title_template = spec.get('title', '{certification} {subject}')
+
+        # 과목 구간 (시작 번호 순) - 번호로 bisect
+        self.sections = sorted((s['start'], s['end'], s['name']) for s in spec['sections'])
+        self._starts = [start for start, _, _ in self.sections]
+
+    def section_for(self, q_num: int) -> str:
+        """문제 번호로 과목 결정"""
+        i = bisect_right(self._starts, q_num) - 1
+        if i >= 0 and q_num <= self.sections[i][1]:
+            return self.sections[i][2]
+        return "Unknown"
+
+    def header_fields(self, text: str) -> Dict:
+        """첫 번째 페이지 머리글의 이름 있는 그룹 (숫자는 int로)"""
+        match = self.page_header.search(text or '')
+        if not match:
+            return {}
+        return {k: int(v) if v.isdigit() else v
+                for k, v in match.groupdict().items() if v is not None}
+
+    def exam_info(self, fields: Dict) -> Dict:
+        """exam_info 블록의 시험 식별 부분 (머리글에 없는 값은 None)"""
+        return {
+            'year': fields.get('year'),
+            'round': fields.get('round'),
+            'subject': fields.get('subject', self.subject),
+            'type': fields.get('type'),
+            'certification': self.certification,
+            'profile': self.id
+        }
+
+    def title(self, fields: Dict) -> str:
+        """마크다운 제목 - 머리글 값이 모자라면 자격명과 교시만"""
+        values = {k: v for k, v in self.exam_info(fields).items() if v is not None}
+        try:
+            return self.title_template.format_map(values)
+        except KeyError:
+            return ' '.join(v for v in (self.certification, self.subject) if v)
+
+
+class ProfileRegistry:
+    """프로필 목록 + 첫 페이지 자동 선택"""
+
+    def __init__(self, profiles: List[ExamProfile], default_id: str = DEFAULT_PROFILE_ID):
+        self.profiles = list(profiles)
+        self.by_id = {}
+        for profile in self.profiles:
+            if profile.id in self.by_id:
+                raise ValueError(f"시험 프로필 id가 중복됩니다: {profile.id}")
+            self.by_id[profile.id] = profile
+        if default_id not in self.by_id:
+            raise ValueError(f"기본 시험 프로필이 없습니다: {default_id} (EXAM_PROFILE_DEFAULT 또는 프로필 파일 확인)")
+        self.default = self.by_id[default_id]
+
+        specs = json.dumps([p.spec for p in self.profiles], sort_keys=True, ensure_ascii=False)
+        self.fingerprint = hashlib.sha256(specs.encode('utf-8')).hexdigest()[:16]
+
+    def get(self, profile_id: str) -> ExamProfile:
+        try:
+            return self.by_id[profile_id]
+        except KeyError:
+            raise ValueError(f"알 수 없는 시험 프로필: {profile_id} (사용 가능: {', '.join(self.by_id)})") from None
+
+    def detect(self, text: str) -> Optional[ExamProfile]:
+        """첫 페이지 텍스트에 detect가 맞는 첫 프로필 (선언 순서)"""
+        for profile in self.profiles:
+            if profile.detect.search(text or ''):
+                return profile
+        return None
+
+
+def read_profile_file(path: Path) -> List[Dict]:
+    """프로필 파일 하나를 읽어 최상위 기본값을 합친 spec 목록으로"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = _yaml().safe_load(f) if path.suffix in ('.yaml', '.yml') else json.load(f)
+
+    entries = data.pop('profiles', None)
+    if entries is None:
+        return [data]
+    return [{**data, **entry} for entry in entries]
+
+
+def _profile_files(dirs: Tuple[str, ...]) -> Tuple[Tuple[str, int], ...]:
+    """디렉터리의 프로필 파일과 수정 시각 (캐시 키)"""
+    files = []
+    for directory in dirs:
+        path = Path(directory)
+        if path.is_dir():
+            for file in sorted(path.iterdir()):
+                if file.suffix in PROFILE_SUFFIXES:
+                    files.append((str(file), file.stat().st_mtime_ns))
+    return tuple(files)
+
+
+@lru_cache(maxsize=8)
+def _load_registry(files: Tuple[Tuple[str, int], ...], default_id: str) -> ProfileRegistry:
+    profiles = [ExamProfile(spec) for file, _ in files for spec in read_profile_file(Path(file))]
+    return ProfileRegistry(profiles, default_id)
+
+
+def profile_dirs() -> Tuple[str, ...]:
+    extra = os.environ.get('EXAM_PROFILE_PATH', '')
+    return (str(PROFILE_DIR),) + tuple(d for d in extra.split(os.pathsep) if d)
+
+
+def get_registry(dirs: Optional[Tuple[str, ...]] = None) -> ProfileRegistry:
+    """프로필 레지스트리 - 파일이 그대로면 컴파일된 것을 재사용"""
+    return _load_registry(_profile_files(tuple(dirs or profile_dirs())), DEFAULT_PROFILE_ID)
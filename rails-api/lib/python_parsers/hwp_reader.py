@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+HWP(한글 5.x) / HWPX 문제지 텍스트 추출
+
+PDF 페이지에서 얻는 것과 같은 (페이지 번호, 텍스트, 테이블, 소요 시간)을 본문 구역(Section)마다
+하나씩 만들어, ExamPDFParser가 PDF 대신 그대로 raw_text / page_tables로 쓴다.
+한글 문서에는 렌더링된 쪽이 없으므로 구역 하나를 한 페이지로 본다.
+
+    HWP  - OLE 복합 파일의 BodyText/SectionN 스트림을 조금씩 zlib 해제하며 레코드 단위로 읽는다
+    HWPX - zip 안의 Contents/sectionN.xml을 iterparse로 최상위 문단 단위로 읽고 버린다
+
+문제지는 문제 번호/보기 기호와 본문을 1행 배치용 표로 나란히 놓으므로, 표는 행마다 칸의
+텍스트를 이어 한 줄로 만든다 ("1." + "질문" -> "1. 질문"). 2행 2열 이상이고 배치용이 아닌
+표만 page_tables에 pdfplumber extract_tables()와 같은 행 목록으로 담는다.
+
+    python3 hwp_reader.py exam.hwp          # 추출한 텍스트 출력
+"""
+
+import re
+import sys
+import time
+import zlib
+import struct
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from xml.etree import ElementTree
+
+HWP_SUFFIXES = ('.hwp', '.hwpx')
+
+# 압축 스트림을 한 번에 읽는 크기
+CHUNK_SIZE = 64 * 1024
+
+# HWP 레코드 태그 (HWPTAG_BEGIN = 0x10)
+TAG_PARA_HEADER = 0x42
+TAG_PARA_TEXT = 0x43
+TAG_CTRL_HEADER = 0x47
+TAG_LIST_HEADER = 0x48
+TAG_TABLE = 0x4D
+
+# 문단 텍스트 안의 제어 문자 - 8 글자(16바이트)를 차지하는 것과 한 글자인 것
+_WIDE_CONTROLS = frozenset({1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 12, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23})
+_CONTROL_TEXT = {9: ' ', 10: '\n', 18: '1', 30: ' ', 31: ' '}  # 18: 자동 번호(쪽 번호)는 1로
+
+# 배치용 표의 첫 칸 (문제 번호, 보기 기호)
+LAYOUT_CELL = re.compile(r'^\s*(?:\d{1,2}\.|[①②③④⑤])\s*$')
+
+PageRecord = Tuple[int, Optional[str], List, Dict]
+
+
+def is_hwp(path) -> bool:
+    return Path(str(path)).suffix.lower() in HWP_SUFFIXES
+
+
+class _Block:
+    """문단/표를 렌더링한 결과 - 텍스트 줄과 데이터 표"""
+
+    __slots__ = ('lines', 'tables')
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.tables: List[List[List[Optional[str]]]] = []
+
+    def add(self, other: '_Block') -> None:
+        self.lines.extend(other.lines)
+        self.tables.extend(other.tables)
+
+    @property
+    def text(self) -> str:
+        return '\n'.join(line for line in self.lines if line.strip())
+
+
+def _render_table(n_rows: int, n_cols: int, cells: List[Tuple[int, int, _Block]]) -> _Block:
+    """칸 (행, 열, 내용) -> 행마다 한 줄 + 데이터 표면 테이블 (합쳐진 칸 자리는 None)"""
+    grid: List[List[Optional[str]]] = [[None] * n_cols for _ in range(n_rows)]
+    block = _Block()
+    for row, col, cell in cells:
+        block.tables.extend(cell.tables)    # 칸 안에 중첩된 표
+        if row < n_rows and col < n_cols:
+            grid[row][col] = cell.text
+
+    for row in grid:
+        line = ' '.join(text for text in row if text)
+        if line:
+            block.lines.append(line)
+
+    first = next((text for row in grid for text in row if text), '')
+    if n_rows >= 2 and n_cols >= 2 and not LAYOUT_CELL.match(first):
+        block.tables.append(grid)
+    return block
+
+
+# --- HWP 5.x ---
+
+def _iter_records(stream, compressed: bool) -> Iterator[Tuple[int, int, bytes]]:
+    """구역 스트림을 CHUNK_SIZE씩 해제하며 (태그, 수준, 내용) 레코드를 순서대로"""
+    decompressor = zlib.decompressobj(-15) if compressed else None
+    buffer = bytearray()
+    pos = 0
+    while True:
+        chunk = stream.read(CHUNK_SIZE)
+        if decompressor:
+            buffer += decompressor.decompress(chunk) if chunk else decompressor.flush()
+        else:
+            buffer += chunk
+        del buffer[:pos]
+        pos = 0
+
+        while pos + 4 <= len(buffer):
+            header, = struct.unpack_from('<I', buffer, pos)
+            size, start = header >> 20, pos + 4
+            if size == 0xFFF:
+                if start + 4 > len(buffer):
+                    break
+                size, = struct.unpack_from('<I', buffer, start)
+                start += 4
+            if start + size > len(buffer):
+                break
+            yield header & 0x3FF, (header >> 10) & 0x3FF, bytes(buffer[start:start + size])
+            pos = start + size
+
+        if not chunk:
+            return
+
+
+def _para_text(data: bytes) -> str:
+    """PARA_TEXT(UTF-16LE) - 제어 문자는 빼거나 공백/줄바꿈으로"""
+    chars = struct.unpack(f'<{len(data) // 2}H', data[:len(data) // 2 * 2])
+    out = []
+    i = 0
+    while i < len(chars):
+        code = chars[i]
+        if code >= 32:
+            out.append(chr(code))
+            i += 1
+            continue
+        out.append(_CONTROL_TEXT.get(code, ''))
+        i += 8 if code in _WIDE_CONTROLS else 1
+    return ''.join(out).replace('\r', '')
+
+
+class _RecordReader:
+    """레코드 반복자 + 한 개 미리 보기 - 수준(level)으로 문단/컨트롤 트리를 재구성"""
+
+    def __init__(self, records: Iterator[Tuple[int, int, bytes]]):
+        self.records = records
+        self.peeked = None
+
+    def peek(self):
+        if self.peeked is None:
+            self.peeked = next(self.records, None)
+        return self.peeked
+
+    def next(self):
+        record = self.peek()
+        self.peeked = None
+        return record
+
+    def paragraph(self, level: int) -> _Block:
+        """PARA_HEADER(level)와 그 아래 레코드 -> 문단 텍스트 + 문단에 들어 있는 표/글상자"""
+        self.next()
+        text = ''
+        inner = _Block()
+        while (record := self.peek()) is not None and record[1] > level:
+            tag = record[0]
+            if tag == TAG_PARA_TEXT and record[1] == level + 1:
+                text = _para_text(self.next()[2])
+            elif tag == TAG_CTRL_HEADER and record[1] == level + 1:
+                inner.add(self.control(level + 1))
+            else:
+                self.next()
+
+        block = _Block()
+        block.lines.append(text.strip('\n'))
+        block.add(inner)
+        return block
+
+    def control(self, level: int) -> _Block:
+        """CTRL_HEADER(level) - 표는 칸별로, 머리말/꼬리말/글상자 등은 안의 문단을 차례로"""
+        ctrl_id = self.next()[2][:4][::-1]
+        table = None
+        cells: List[Tuple[int, int, _Block]] = []
+        block = _Block()
+        current = block
+
+        while (record := self.peek()) is not None and record[1] > level:
+            tag, record_level, data = record
+            if tag == TAG_TABLE and ctrl_id == b'tbl ':
+                table = struct.unpack_from('<HH', data, 4)
+                self.next()
+            elif tag == TAG_LIST_HEADER and table is not None and len(data) >= 12:
+                col, row = struct.unpack_from('<HH', data, 8)
+                current = _Block()
+                cells.append((row, col, current))
+                self.next()
+            elif tag == TAG_PARA_HEADER:
+                current.add(self.paragraph(record_level))
+            else:
+                self.next()
+
+        if table is not None:
+            return _render_table(table[0], table[1], cells)
+        return block
+
+
+def _hwp_sections(path: str) -> Iterator[_Block]:
+    import olefile
+
+    with olefile.OleFileIO(path) as ole:
+        header = ole.openstream('FileHeader').read()
+        if not header.startswith(b'HWP Document File'):
+            raise ValueError(f"HWP 문서가 아닙니다: {path}")
+        flags, = struct.unpack_from('<I', header, 36)
+        if flags & 0x02:
+            raise ValueError(f"암호가 걸린 HWP 문서는 읽을 수 없습니다: {path}")
+        if flags & 0x04:
+            raise ValueError(f"배포용 HWP 문서는 읽을 수 없습니다: {path}")
+
+        sections = sorted((int(entry[1][len('Section'):]), '/'.join(entry))
+                          for entry in ole.listdir()
+                          if len(entry) == 2 and entry[0] == 'BodyText' and entry[1].startswith('Section'))
+        for _, name in sections:
+            reader = _RecordReader(_iter_records(ole.openstream(name), bool(flags & 0x01)))
+            section = _Block()
+            while (record := reader.peek()) is not None:
+                if record[0] == TAG_PARA_HEADER:
+                    section.add(reader.paragraph(record[1]))
+                else:
+                    reader.next()
+            yield section
+
+
+# --- HWPX ---
+
+_HP = '{http://www.hancom.co.kr/hwpml/2011/paragraph}'
+_HWPX_INLINE = {f'{_HP}lineBreak': '\n', f'{_HP}tab': ' '}
+
+
+def _sub_lists(node) -> Iterator:
+    """node 아래의 <hp:subList> (찾은 subList 안으로는 내려가지 않음 - 중첩은 문단이 처리)"""
+    for child in node:
+        if child.tag == f'{_HP}subList':
+            yield child
+        else:
+            yield from _sub_lists(child)
+
+
+def _hwpx_paragraph(p) -> _Block:
+    """<hp:p> -> 문단 텍스트 + 안의 표/머리말/글상자"""
+    text = []
+    inner = _Block()
+    for run in p.findall(f'{_HP}run'):
+        for node in run:
+            if node.tag == f'{_HP}t':
+                text.append(node.text or '')
+                for child in node:
+                    text.append(_HWPX_INLINE.get(child.tag, ''))
+                    text.append(child.tail or '')
+            elif node.tag == f'{_HP}tbl':
+                inner.add(_hwpx_table(node))
+            else:
+                if node.tag == f'{_HP}ctrl' and node.find(f'{_HP}autoNum') is not None:
+                    text.append('1')
+                # 머리말/꼬리말/각주, 글상자 같은 그리기 개체
+                for sub_list in _sub_lists(node):
+                    for child in sub_list.findall(f'{_HP}p'):
+                        inner.add(_hwpx_paragraph(child))
+
+    block = _Block()
+    block.lines.append(''.join(text).strip('\n'))
+    block.add(inner)
+    return block
+
+
+def _hwpx_table(tbl) -> _Block:
+    cells = []
+    for tr in tbl.findall(f'{_HP}tr'):
+        for tc in tr.findall(f'{_HP}tc'):
+            address = tc.find(f'{_HP}cellAddr')
+            row = int(address.get('rowAddr', 0)) if address is not None else 0
+            col = int(address.get('colAddr', 0)) if address is not None else 0
+            content = _Block()
+            for sub_list in _sub_lists(tc):
+                for p in sub_list.findall(f'{_HP}p'):
+                    content.add(_hwpx_paragraph(p))
+            cells.append((row, col, content))
+    return _render_table(int(tbl.get('rowCnt', 0)), int(tbl.get('colCnt', 0)), cells)
+
+
+def _hwpx_sections(path: str) -> Iterator[_Block]:
+    with zipfile.ZipFile(path) as archive:
+        names = sorted(
+            (int(m.group(1)), name) for name in archive.namelist()
+            if (m := re.fullmatch(r'Contents/section(\d+)\.xml', name))
+        )
+        for _, name in names:
+            section = _Block()
+            depth = 0
+            with archive.open(name) as fp:
+                for event, element in ElementTree.iterparse(fp, events=('start', 'end')):
+                    if event == 'start':
+                        depth += 1
+                        continue
+                    depth -= 1
+                    if depth == 1 and element.tag == f'{_HP}p':   # 구역 바로 아래 문단
+                        section.add(_hwpx_paragraph(element))
+                        element.clear()
+            yield section
+
+
+def iter_hwp_pages(path: str) -> Iterator[PageRecord]:
+    """구역마다 (페이지 번호, 텍스트, 테이블, 소요 시간) - ExamPDFParser의 페이지 기록과 같은 형식"""
+    sections = _hwpx_sections(path) if Path(path).suffix.lower() == '.hwpx' else _hwp_sections(path)
+    page_num = 0
+    start = time.perf_counter()
+    for section in sections:
+        yield page_num, section.text or None, section.tables, {'text': time.perf_counter() - start}
+        page_num += 1
+        start = time.perf_counter()
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("사용법: python3 hwp_reader.py <파일.hwp|파일.hwpx>", file=sys.stderr)
+        sys.exit(1)
+    for page_num, text, tables, _ in iter_hwp_pages(sys.argv[1]):
+        print(f"=== 구역 {page_num} (표 {len(tables)}개) ===")
+        print(text or '')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+스캔 페이지 OCR 대체 경로
+
+page.extract_text()가 비었거나 글자가 거의 없는 페이지만 골라 로컬 OCR 백엔드로 보낸다.
+OCR은 텍스트 추출과 별도의 프로세스 풀(자체 동시 실행 수)에서 돌고, 결과는 페이지 순서대로
+원래 페이지 자리에 합쳐진다. 대부분 디지털인 PDF는 스캔 페이지 수만큼만 OCR을 호출한다.
+
+백엔드는 BACKENDS에 등록된 이름('tesseract') 또는 'module:Class' 경로로 지정하며
+recognize(image) -> str 를 구현하면 된다. 워커 프로세스에서 새로 만들어지므로
+생성자 인자 없이 만들 수 있거나 pickle 가능한 인스턴스여야 한다.
+
+    python ocr_fallback.py scanned.pdf --backend tesseract
+"""
+
+import sys
+import abc
+import time
+import importlib
+import subprocess
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import pdfplumber
+
+MIN_GLYPHS = 50            # 공백을 뺀 글자 수가 이보다 적으면 스캔 페이지 후보
+MIN_IMAGE_COVERAGE = 0.5   # 이미지가 페이지 면적의 이 비율 이상 덮어야 OCR (빈 페이지는 제외)
+                           # page_figures는 이 비율 이상인 이미지를 그림에서 빼므로 한 이미지가 둘 다 되지 않음
+RESOLUTION = 300           # OCR용 렌더링 해상도 (dpi)
+READ_AHEAD = 8             # OCR 결과를 기다리는 동안 먼저 읽어 둘 수 있는 페이지 수
+
+
+class OcrBackend(abc.ABC):
+    """OCR 백엔드 - recognize(PIL 이미지) -> 텍스트 (구현하지 않은 백엔드는 만들 때 TypeError)"""
+
+    name = ''
+
+    @abc.abstractmethod
+    def recognize(self, image) -> str:
+        """렌더링된 페이지 이미지의 텍스트"""
+
+
+class TesseractBackend(OcrBackend):
+    """tesseract 명령행 (tesseract-ocr, kor 언어 데이터 필요)"""
+
+    name = 'tesseract'
+
+    def __init__(self, lang: str = 'kor+eng', command: str = 'tesseract', psm: int = 6):
+        self.lang = lang
+        self.command = command
+        self.psm = psm
+
+    def recognize(self, image) -> str:
+        import io
+
+        buffer = io.BytesIO()
+        image.save(buffer, format='PNG')
+        try:
+            result = subprocess.run([self.command, 'stdin', 'stdout', '-l', self.lang, '--psm', str(self.psm)],
+                                    input=buffer.getvalue(), capture_output=True, check=True)
+        except FileNotFoundError:
+            raise RuntimeError(f"OCR 명령을 찾을 수 없습니다: {self.command}") from None
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"OCR 실패: {e.stderr.decode('utf-8', 'replace').strip()}") from None
+        return result.stdout.decode('utf-8')
+
+
+BACKENDS: Dict[str, Callable[[], OcrBackend]] = {'tesseract': TesseractBackend}
+
+
+def register_backend(name: str, factory: Callable[[], OcrBackend]) -> None:
+    """백엔드 이름 등록 (spawn 방식 워커에서도 쓰려면 'module:Class' 경로를 사용)"""
+    BACKENDS[name] = factory
+
+
+def get_backend(spec) -> OcrBackend:
+    """등록된 이름, 'module:Class' 경로 또는 OcrBackend 인스턴스로 백엔드 생성"""
+    if isinstance(spec, OcrBackend):
+        return spec
+    if spec in BACKENDS:
+        return BACKENDS[spec]()
+    if ':' in spec:
+        module, _, attr = spec.partition(':')
+        return getattr(importlib.import_module(module), attr)()
+    raise ValueError(f"지원하지 않는 OCR 백엔드: {spec}")
+
+
+def backend_name(spec) -> str:
+    """설정 지문용 백엔드 이름"""
+    if isinstance(spec, OcrBackend):
+        return spec.name or type(spec).__name__
+    return str(spec)
+
+
+def glyph_count(text: Optional[str]) -> int:
+    """공백을 뺀 글자 수"""
+    return sum(not ch.isspace() for ch in text or '')
+
+
+def is_sparse(text: Optional[str], min_glyphs: int = MIN_GLYPHS) -> bool:
+    """텍스트 레이어가 비었거나 거의 없는 페이지인지"""
+    return glyph_count(text) < min_glyphs
+
+
+def image_coverage(page) -> float:
+    """페이지 면적 대비 이미지가 덮는 비율 (겹침은 무시하고 합산, 최대 1)"""
+    area = float(page.width * page.height) or 1.0
+    covered = sum(max(image['x1'] - image['x0'], 0) * max(image['bottom'] - image['top'], 0)
+                  for image in page.images)
+    return min(covered / area, 1.0)
+
+
+# 워커 프로세스마다 한 번 만드는 백엔드
+_backend: Optional[OcrBackend] = None
+
+
+def _init_worker(spec) -> None:
+    global _backend
+    _backend = get_backend(spec)
+
+
+def _ocr_page(pdf_path: str, page_num: int, resolution: int = RESOLUTION) -> Tuple[Optional[str], float]:
+    """페이지 하나를 렌더링해 OCR - 이미지가 없는 페이지는 (None, 0.0)으로 건너뜀"""
+    with pdfplumber.open(pdf_path) as pdf:
+        page = pdf.pages[page_num]
+        if image_coverage(page) < MIN_IMAGE_COVERAGE:
+            return None, 0.0
+        start = time.perf_counter()
+        image = page.to_image(resolution=resolution).original
+        text = _backend.recognize(image)
+    return text, time.perf_counter() - start
+
+
+class OcrRouter:
+    """글자가 적은 페이지만 OCR 풀로 보내고 결과를 페이지 순서대로 합치는 필터"""
+
+    def __init__(self, backend, workers: int = 1, min_glyphs: int = MIN_GLYPHS,
+                 resolution: int = RESOLUTION, read_ahead: int = READ_AHEAD):
+        self.backend = backend          # 이름, 'module:Class' 또는 OcrBackend 인스턴스
+        self.workers = max(workers, 1)  # OCR 풀의 동시 실행 수 (텍스트 추출 workers와 별개)
+        self.min_glyphs = min_glyphs
+        self.resolution = resolution
+        self.read_ahead = max(read_ahead, self.workers)
+
+    def route(self, pdf_path: str, pages, count: Optional[Callable[[str, int], None]] = None
+              ) -> Iterator[Tuple[int, Optional[str], List, Dict]]:
+        """
+        (페이지 번호, 텍스트, 테이블, 소요 시간)을 그대로 흘려보내되 글자가 적은 페이지는
+        OCR 텍스트로 바꿔서 - 풀은 첫 후보 페이지에서 만들고 끝나면 닫는다.
+        OCR할 이미지가 없는 페이지는 원래 텍스트를 유지한다.
+        """
+        executor = None
+        pending = deque()   # [(페이지 튜플, future 또는 None)] - 페이지 순서 유지
+
+        def finish(item, future):
+            page_num, text, tables, timings = item
+            if future is None:
+                return item
+            ocr_text, seconds = future.result()
+            if ocr_text is None:
+                if count:
+                    count('ocr_skipped', 1)
+                return item
+            if count:
+                count('ocr_pages', 1)
+            return page_num, ocr_text, tables, {**timings, 'ocr': seconds}
+
+        try:
+            for item in pages:
+                future = None
+                if is_sparse(item[1], self.min_glyphs):
+                    if executor is None:
+                        executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                       initargs=(self.backend,))
+                    future = executor.submit(_ocr_page, pdf_path, item[0], self.resolution)
+                pending.append((item, future))
+
+                # 앞쪽이 끝났으면 바로 내보내고, 너무 앞서 읽었으면 맨 앞 OCR을 기다림
+                while pending and (pending[0][1] is None or pending[0][1].done()
+                                   or len(pending) > self.read_ahead):
+                    yield finish(*pending.popleft())
+
+            while pending:
+                yield finish(*pending.popleft())
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+
+def main():
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description='스캔 페이지만 OCR한 페이지별 텍스트 출력')
+    arg_parser.add_argument('pdf', help='PDF 파일')
+    arg_parser.add_argument('--backend', default='tesseract', help="OCR 백엔드 ('tesseract' 또는 'module:Class')")
+    arg_parser.add_argument('--workers', type=int, default=1, help='OCR 동시 실행 수')
+    arg_parser.add_argument('--min-glyphs', type=int, default=MIN_GLYPHS, help='OCR 대상이 되는 최대 글자 수')
+    args = arg_parser.parse_args()
+
+    from exam_pdf_parser_v2 import _extract_page_range
+
+    router = OcrRouter(args.backend, workers=args.workers, min_glyphs=args.min_glyphs)
+    for page_num, text, _, timings in router.route(args.pdf, _extract_page_range(args.pdf, with_tables=False)):
+        source = 'ocr' if 'ocr' in timings else 'text'
+        print(f"--- page {page_num + 1} ({source}, {glyph_count(text)} glyphs)")
+        print(text or '')
+
+
+if __name__ == "__main__":
+    sys.exit(main())
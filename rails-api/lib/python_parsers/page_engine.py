@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+페이지 한 번 순회 추출
+
+pdfplumber는 page.extract_tables(), page.extract_text(), page.extract_words()가 각자
+글자를 단어로 묶고, 읽은 레이아웃(_layout, objects)과 텍스트 맵을 페이지 객체에 캐시해
+PDF를 닫을 때까지 들고 있다. 여기서는 페이지 레이아웃을 한 번 읽어 같은 단어 묶음(wordmap)에서
+텍스트와 단어 박스를 만들고, 테이블/그림/2단 텍스트도 그 결과로 구한 뒤 페이지 캐시를 비운다.
+그래서 페이지 수가 늘어도 최대 메모리는 한 페이지 분량에서 크게 늘지 않는다.
+
+텍스트와 단어 박스는 page.extract_text() / page.extract_words()와 같다.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from pdfplumber.utils.text import TEXTMAP_KWARGS, WORD_EXTRACTOR_KWARGS, WordExtractor
+
+
+@dataclass(slots=True)
+class PageExtraction:
+    """페이지 하나의 추출 결과"""
+    text: Optional[str]                  # layout에 따른 본문 텍스트 (columns면 단 순서)
+    tables: List                         # extract_tables() 결과 (with_tables=False면 [])
+    timings: Dict                        # {'tables': 초, 'text': 초, ('words': 초)}
+    words: List = field(default_factory=list)     # extract_words() 결과 (with_words=True일 때)
+    figures: List = field(default_factory=list)   # page_figures.find_figures() 결과
+    columns: Optional[str] = None        # 2단 페이지를 단 순서로 읽은 텍스트 (1단이면 None)
+    gutter: Optional[Tuple[float, float]] = None
+
+
+def _textmap(page):
+    """page.get_textmap()과 같은 설정으로 wordmap과 textmap을 한 번에"""
+    options = {'layout_bbox': page.bbox, 'layout_width': page.width, 'layout_height': page.height,
+               'presorted': True}
+    extractor = WordExtractor(**{k: options[k] for k in WORD_EXTRACTOR_KWARGS if k in options})
+    wordmap = extractor.extract_wordmap(page.chars)
+    return wordmap, wordmap.to_textmap(**{k: options[k] for k in TEXTMAP_KWARGS if k in options})
+
+
+def extract_page(page, with_tables: bool = True, layout: str = 'text', with_words: bool = False,
+                 with_columns: bool = False, with_figures: bool = True, close: bool = True) -> PageExtraction:
+    """
+    페이지 레이아웃을 한 번 읽어 텍스트/테이블/단어 박스/그림을 모두 구함
+
+    layout='columns'이거나 with_columns=True면 단 사이 여백을 찾아 단 순서 텍스트도 만든다
+    (page_layout, NumPy 필요). close=True면 끝난 뒤 페이지 캐시를 비운다 - 같은 페이지를
+    다시 쓰면 레이아웃을 새로 읽는다.
+    """
+    try:
+        start = time.perf_counter()
+        tables = page.extract_tables() if with_tables else []
+        middle = time.perf_counter()
+        wordmap, textmap = _textmap(page)
+        text = textmap.as_string
+        timings = {'tables': middle - start, 'text': time.perf_counter() - middle}
+
+        result = PageExtraction(text=text, tables=tables, timings=timings)
+        if with_words or with_columns or layout == 'columns':
+            start = time.perf_counter()
+            words = [word for word, _ in wordmap.tuples]
+            if with_words:
+                result.words = words
+            if with_columns or layout == 'columns':
+                from page_layout import word_boxes, find_gutter, read_columns
+                boxes = word_boxes(words)
+                result.gutter = find_gutter(boxes)
+                if result.gutter is not None:
+                    result.columns = read_columns(page, boxes, result.gutter)
+                    if layout == 'columns':
+                        result.text = result.columns
+            if with_words:
+                timings['words'] = time.perf_counter() - start
+            else:
+                timings['text'] += time.perf_counter() - start
+
+        if with_figures:
+            from page_figures import find_figures
+            result.figures = find_figures(page, textmap)
+        return result
+    finally:
+        if close:
+            page.close()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+문제지 그림/도표 영역
+
+텍스트를 읽는 같은 페이지 순회에서 page.images와 벡터 그림(curve 묶음)의 영역을 모으고,
+그 위쪽에서 가장 가까운 문제 번호 줄에 묶어 둔다 (anchor). 파서는 anchor로 그림을 문제 블록에
+붙이고, 그림이 있는 문제만 잘라낸 PNG를 워커 풀에서 저장한다 (페이지 전체 래스터화 없음).
+"""
+
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pdfplumber
+
+from ocr_fallback import MIN_IMAGE_COVERAGE
+
+MIN_FIGURE_SIZE = 20.0      # 이보다 작은 이미지/그림(pt)은 장식으로 보고 무시
+MAX_FIGURE_COVERAGE = MIN_IMAGE_COVERAGE  # 페이지 면적의 이 비율 이상인 이미지는 스캔 페이지 (ocr_fallback 대상)
+DRAWING_GAP = 6.0           # 이 거리(pt) 안의 curve는 한 그림으로 묶음
+ANCHOR_TOLERANCE = 2.0      # 문제 번호 줄과 같은 높이에서 시작하는 그림도 그 문제로
+RESOLUTION = 150            # 잘라낸 PNG 해상도 (dpi)
+
+QUESTION_LINE = re.compile(r'(?m)^(\d{1,2})\.\s')   # Patterns.QUESTION_START와 같은 문제 번호 줄
+
+BBox = Tuple[float, float, float, float]            # (x0, top, x1, bottom) - pt, 페이지 왼쪽 위 기준
+
+
+def _bbox(obj) -> BBox:
+    return (float(obj['x0']), float(obj['top']), float(obj['x1']), float(obj['bottom']))
+
+
+def _near(a: BBox, b: BBox, gap: float) -> bool:
+    return a[0] - gap <= b[2] and b[0] - gap <= a[2] and a[1] - gap <= b[3] and b[1] - gap <= a[3]
+
+
+def _merge_boxes(boxes: List[BBox], gap: float = DRAWING_GAP) -> List[BBox]:
+    """겹치거나 gap 안으로 가까운 영역을 더 이상 합칠 수 없을 때까지 합침"""
+    merged: List[BBox] = []
+    for box in sorted(boxes, key=lambda b: (b[1], b[0])):
+        while True:
+            hit = next((i for i, other in enumerate(merged) if _near(box, other, gap)), None)
+            if hit is None:
+                break
+            other = merged.pop(hit)
+            box = (min(box[0], other[0]), min(box[1], other[1]), max(box[2], other[2]), max(box[3], other[3]))
+        merged.append(box)
+    return merged
+
+
+def figure_regions(page) -> List[Tuple[str, BBox]]:
+    """페이지의 그림 영역 [(종류, bbox)] - 'image'는 삽입 이미지, 'drawing'은 curve 묶음 (위→아래 순)"""
+    page_area = float(page.width * page.height) or 1.0
+    regions = []
+
+    images = [_bbox(image) for image in page.images]
+    drawings = _merge_boxes([_bbox(curve) for curve in page.curves]) if page.curves else []
+    for kind, boxes in (('image', images), ('drawing', drawings)):
+        for x0, top, x1, bottom in boxes:
+            width, height = x1 - x0, bottom - top
+            if width < MIN_FIGURE_SIZE or height < MIN_FIGURE_SIZE:
+                continue
+            if kind == 'image' and width * height >= page_area * MAX_FIGURE_COVERAGE:
+                continue
+            regions.append((kind, (round(x0, 1), round(top, 1), round(x1, 1), round(bottom, 1))))
+    return sorted(regions, key=lambda r: (r[1][1], r[1][0]))
+
+
+def find_figures(page, textmap=None) -> List[Dict]:
+    """
+    페이지의 그림 [{'kind', 'bbox', 'anchor'}] - anchor는 그림 위쪽의 마지막 문제 번호
+    (그 페이지에서 문제가 시작되기 전의 그림이면 None: 앞 페이지에서 이어지는 문제)
+    textmap을 주면 문제 번호 줄을 그 텍스트 맵에서 찾음 (page_engine이 이미 만든 것)
+    """
+    regions = figure_regions(page)
+    if not regions:
+        return []
+
+    search = textmap.search if textmap is not None else page.search
+    starts = [(float(match['top']), int(match['groups'][0]))
+              for match in search(QUESTION_LINE.pattern, regex=True)]
+    figures = []
+    for kind, bbox in regions:
+        above = [number for top, number in starts if top <= bbox[1] + ANCHOR_TOLERANCE]
+        figures.append({'kind': kind, 'bbox': bbox, 'anchor': above[-1] if above else None})
+    return figures
+
+
+def _write_crop(pdf_path: str, page_num: int, bbox: BBox, path: str, resolution: int) -> str:
+    """워커 프로세스 - 페이지의 bbox 영역만 PNG로 저장"""
+    with pdfplumber.open(pdf_path) as pdf:
+        page = pdf.pages[page_num]
+        x0, top, x1, bottom = bbox
+        region = (max(x0, 0), max(top, 0), min(x1, float(page.width)), min(bottom, float(page.height)))
+        page.crop(region).to_image(resolution=resolution).save(path, format='PNG')
+    return path
+
+
+class FigureWriter:
+    """잘라낸 그림 PNG를 프로세스 풀에서 저장 - 풀은 첫 그림에서 만들고 close()에서 끝날 때까지 기다림"""
+
+    def __init__(self, output_dir: str, workers: int = 1, resolution: int = RESOLUTION):
+        self.output_dir = Path(output_dir)
+        self.workers = max(workers, 1)
+        self.resolution = resolution
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._futures = []
+
+    def submit(self, pdf_path: str, page_num: int, bbox: BBox, name: str) -> str:
+        """저장할 경로를 바로 돌려주고 실제 저장은 풀에서"""
+        if self._executor is None:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        path = str(self.output_dir / name)
+        self._futures.append(self._executor.submit(_write_crop, pdf_path, page_num, bbox, path, self.resolution))
+        return path
+
+    def close(self) -> int:
+        """제출한 그림을 모두 저장할 때까지 기다림 - 저장한 수 (실패하면 예외)"""
+        if self._executor is None:
+            return 0
+        try:
+            written = len([future.result() for future in self._futures])
+        finally:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+            self._futures = []
+        return written
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+2단 편집 페이지 추출
+
+page.extract_text()는 좌우 단의 같은 높이 줄을 한 줄로 합쳐 버리므로,
+단어 박스 좌표로 페이지마다 한 번 단 사이 여백(gutter)을 찾고 page.crop으로
+왼쪽 단 -> 오른쪽 단 순서로 읽는다. 여백을 가로지르는 줄(제목, 머리글 등)은
+전체 폭 띠로 따로 읽어 띠 사이 구간마다 단을 나눈다. 좌표 계산은 모두 NumPy 배열 연산.
+
+여백을 찾지 못한 페이지(1단)는 page.extract_text()를 그대로 쓰므로 결과가 같다.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# 단 사이 여백으로 볼 최소 폭 (pt)
+MIN_GUTTER = 12.0
+# 여백 탐색 구간 - 본문 가로 범위에서 가운데 이 비율 안쪽
+CENTER_BAND = (0.3, 0.7)
+# 여백을 가로지를 수 있는 단어 수 (가운데 정렬된 머리글/쪽 번호 등)
+MAX_CROSSING = 3
+# 한쪽 단에 있어야 할 최소 단어 비율
+MIN_COLUMN_SHARE = 0.2
+
+Gutter = Tuple[float, float]
+BBox = Tuple[float, float, float, float]
+
+
+def word_boxes(words: List) -> np.ndarray:
+    """extract_words() 결과(dict) 또는 [x0, top, x1, bottom, ...] 목록 -> (n, 4) 배열"""
+    if not words:
+        return np.empty((0, 4))
+    if isinstance(words[0], dict):
+        return np.array([(w['x0'], w['top'], w['x1'], w['bottom']) for w in words], dtype=float)
+    return np.array([w[:4] for w in words], dtype=float)
+
+
+def _widest_run(mask: np.ndarray) -> Optional[Tuple[int, int]]:
+    """True가 연속된 가장 넓은 구간 [시작, 끝) - 없으면 None"""
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.astype(int), [0]))))
+    if not len(edges):
+        return None
+    starts, ends = edges[0::2], edges[1::2]
+    best = np.argmax(ends - starts)
+    return int(starts[best]), int(ends[best])
+
+
+def find_gutter(boxes: np.ndarray, min_gap: float = MIN_GUTTER) -> Optional[Gutter]:
+    """
+    단 사이 여백 (왼쪽 끝, 오른쪽 끝) - 없으면 None
+
+    1pt 단위로 각 x를 덮는 단어 수를 차분 배열 누적합으로 구하고, 본문 가운데 구간에서
+    MAX_CROSSING 이하로 덮인 가장 넓은 연속 구간 중 가장 적게 덮인 부분을 고른다.
+    좌우 단 모두에 단어가 충분하고 세로 범위가 겹쳐야 2단으로 본다.
+    """
+    if len(boxes) < 10:
+        return None
+
+    left = np.floor(boxes[:, 0]).astype(int)
+    right = np.ceil(boxes[:, 2]).astype(int)
+    origin = left.min()
+    span = right.max() - origin
+    if span <= 0:
+        return None
+
+    diff = np.zeros(span + 2, dtype=int)
+    np.add.at(diff, left - origin, 1)
+    np.add.at(diff, right - origin, -1)
+    coverage = np.cumsum(diff)[:span]
+
+    lo, hi = int(span * CENTER_BAND[0]), int(span * CENTER_BAND[1])
+    run = _widest_run(coverage[lo:hi] <= MAX_CROSSING)
+    if run is None:
+        return None
+    # 후보 구간 안에서도 가장 적게 덮인 부분만 여백으로 (긴 줄 몇 개가 단 끝을 넘는 경우)
+    start, end = lo + run[0], lo + run[1]
+    inner = coverage[start:end]
+    inner_start, inner_end = _widest_run(inner == inner.min())
+    start, end = start + inner_start, start + inner_end
+    if end - start < min_gap:
+        return None
+    gutter = (float(origin + start), float(origin + end))
+
+    # 좌우 단 단어 비율과 세로 범위 겹침 확인
+    in_left = boxes[:, 2] <= gutter[0]
+    in_right = boxes[:, 0] >= gutter[1]
+    if min(in_left.mean(), in_right.mean()) < MIN_COLUMN_SHARE:
+        return None
+    left_y = boxes[in_left, 1].min(), boxes[in_left, 3].max()
+    right_y = boxes[in_right, 1].min(), boxes[in_right, 3].max()
+    overlap = min(left_y[1], right_y[1]) - max(left_y[0], right_y[0])
+    if overlap < 0.5 * min(left_y[1] - left_y[0], right_y[1] - right_y[0]):
+        return None
+    return gutter
+
+
+def spanning_bands(boxes: np.ndarray, gutter: Gutter) -> List[Tuple[float, float]]:
+    """여백을 가로지르는 단어들의 세로 띠 (겹치는 것은 합침, 위에서 아래 순서)"""
+    crossing = boxes[(boxes[:, 0] < gutter[0]) & (boxes[:, 2] > gutter[1])]
+    if not len(crossing):
+        return []
+
+    order = np.argsort(crossing[:, 1])
+    tops, bottoms = crossing[order, 1], np.maximum.accumulate(crossing[order, 3])
+    # 이전 띠의 아래 끝보다 아래에서 시작하면 새 띠
+    starts = np.concatenate(([True], tops[1:] > bottoms[:-1]))
+    first = np.flatnonzero(starts)
+    last = np.concatenate((first[1:] - 1, [len(tops) - 1]))
+    return [(float(tops[a]), float(bottoms[b])) for a, b in zip(first, last)]
+
+
+def reading_regions(bbox: BBox, gutter: Gutter, bands: List[Tuple[float, float]]) -> List[BBox]:
+    """읽는 순서의 crop 영역 - 띠 사이 구간마다 왼쪽 단, 오른쪽 단, 그다음 전체 폭 띠"""
+    x0, top, x1, bottom = bbox
+    split = (gutter[0] + gutter[1]) / 2
+    regions = []
+    cursor = top
+    for band_top, band_bottom in bands + [(bottom, bottom)]:
+        band_top = max(band_top, cursor)
+        if band_top > cursor:
+            regions.append((x0, cursor, split, band_top))
+            regions.append((split, cursor, x1, band_top))
+        if band_bottom > band_top:
+            regions.append((x0, band_top, x1, band_bottom))
+        cursor = max(cursor, band_bottom)
+    return regions
+
+
+def extract_columns(page, words: Optional[List] = None) -> Tuple[Optional[str], Optional[Gutter]]:
+    """
+    2단이면 단 순서대로 읽은 텍스트, 아니면 page.extract_text()
+
+    Returns:
+        (텍스트, 여백 또는 None)
+    """
+    if words is None:
+        words = page.extract_words()
+    boxes = word_boxes(words)
+    gutter = find_gutter(boxes)
+    if gutter is None:
+        return page.extract_text(), None
+    return read_columns(page, boxes, gutter), gutter
+
+
+def read_columns(page, boxes: np.ndarray, gutter: Gutter) -> str:
+    """여백이 있는 페이지를 영역별로 crop해 읽는 순서대로 이어 붙임"""
+    regions = reading_regions(page.bbox, gutter, spanning_bands(boxes, gutter))
+    texts = [page.crop(region).extract_text() for region in regions]
+    return '\n'.join(t for t in texts if t)
+
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+페이지 추출 결과 저장소
+
+pdfplumber가 뽑은 페이지별 텍스트 / 테이블 / 단어 박스 / 그림 영역을 파일 해시 + 페이지 번호로
+SQLite 파일 하나에 zlib 압축해 저장한다. 문제 분리 규칙이나 시험 프로필이 바뀌어도
+페이지 추출 결과는 그대로이므로, 저장된 문서는 PDF를 열지 않고 다시 파싱할 수 있다.
+
+    parser = ExamPDFParser('exam.pdf', page_store='pages.sqlite3')   # 없으면 추출 후 저장
+    parser = ExamPDFParser.from_page_store(file_hash, 'pages.sqlite3')  # 저장소만으로 파싱
+
+CLI:
+    python3 page_store.py ingest sample-data/
+    python3 page_store.py reparse -o out/
+    python3 page_store.py stats
+"""
+
+import os
+import json
+import time
+import zlib
+import sqlite3
+import argparse
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import pdfplumber
+
+# 저장 형식이나 추출 방식(테이블/단어/그림 옵션)이 바뀌면 올린다 - 버전이 다른 문서는 다시 추출
+EXTRACTOR_VERSION = f"3/pdfplumber-{getattr(pdfplumber, '__version__', 'unknown')}"
+
+DEFAULT_STORE_PATH = os.environ.get(
+    'EXAM_PARSER_PAGE_STORE', str(Path.home() / '.cache' / 'exam_parser' / 'pages.sqlite3')
+)
+
+# (페이지 번호, 텍스트, 테이블, 단어 박스 [[x0, top, x1, bottom, text], ...])
+PageRecord = Tuple[int, Optional[str], List, List]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    file_hash TEXT PRIMARY KEY,
+    page_count INTEGER NOT NULL,
+    extractor TEXT NOT NULL,
+    source TEXT,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    file_hash TEXT NOT NULL,
+    page_num INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (file_hash, page_num)
+) WITHOUT ROWID;
+"""
+
+
+def _pack(text: Optional[str], tables: List, words: List, columns: Optional[str] = None,
+          figures: Optional[List] = None) -> bytes:
+    record = {'text': text, 'tables': tables, 'words': words, 'columns': columns, 'figures': figures or []}
+    return zlib.compress(json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+
+def _unpack(data: bytes) -> Dict:
+    return json.loads(zlib.decompress(data))
+
+
+def _page_words(words: List[Dict]) -> List:
+    """단어 박스 (extract_words() 결과) - 좌표는 소수점 2자리"""
+    return [[round(w['x0'], 2), round(w['top'], 2), round(w['x1'], 2), round(w['bottom'], 2), w['text']]
+            for w in words]
+
+
+def extract_document(pdf_path: str) -> Iterator[Tuple[PageRecord, Optional[str], List, Dict]]:
+    """
+    PDF의 모든 페이지를 (페이지 기록, 2단 읽기 텍스트, 그림, 소요 시간) 순서대로 추출
+
+    테이블과 그림 영역(page_figures.find_figures)은 항상 포함하고, 단 사이 여백이 있는 페이지는
+    layout='columns'용 텍스트도 만든다 (1단 페이지는 None - 일반 텍스트와 같음).
+    """
+    from page_engine import extract_page
+    from hwp_reader import is_hwp, iter_hwp_pages
+
+    if is_hwp(pdf_path):
+        # HWP/HWPX는 구역이 페이지 - 단어 박스/2단 텍스트 없음
+        for page_num, text, tables, timings in iter_hwp_pages(pdf_path):
+            yield (page_num, text, tables, []), None, [], timings
+        return
+
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            # 레이아웃 한 번으로 텍스트/테이블/단어 박스/2단 텍스트/그림 - 끝나면 페이지 캐시를 비움
+            extracted = extract_page(page, with_tables=True, with_words=True, with_columns=True, with_figures=True)
+            yield ((page_num, extracted.text, extracted.tables, _page_words(extracted.words)),
+                   extracted.columns, extracted.figures, extracted.timings)
+
+
+class PageStore:
+    """파일 해시 + 페이지 번호 -> 추출 결과 (SQLite, 여러 워커 프로세스에서 동시 사용 가능)"""
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path), timeout=30)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def has(self, file_hash: str) -> bool:
+        """현재 추출 버전으로 모든 페이지가 저장되어 있는지"""
+        row = self.conn.execute(
+            'SELECT page_count, extractor FROM documents WHERE file_hash = ?', (file_hash,)
+        ).fetchone()
+        if row is None or row[1] != EXTRACTOR_VERSION:
+            return False
+        stored = self.conn.execute('SELECT COUNT(*) FROM pages WHERE file_hash = ?', (file_hash,)).fetchone()[0]
+        return stored == row[0]
+
+    def put(self, file_hash: str, pages: List[PageRecord], source: str = '',
+            columns: Optional[Dict[int, str]] = None, figures: Optional[Dict[int, List]] = None) -> None:
+        """
+        문서 전체를 한 트랜잭션으로 저장 (기존 항목은 교체)
+        columns: 2단 페이지의 단 순서 텍스트, figures: 그림이 있는 페이지의 find_figures 결과
+        """
+        columns = columns or {}
+        figures = figures or {}
+        with self.conn:
+            self.conn.execute('DELETE FROM pages WHERE file_hash = ?', (file_hash,))
+            self.conn.executemany(
+                'INSERT INTO pages (file_hash, page_num, data) VALUES (?, ?, ?)',
+                [(file_hash, page_num, _pack(text, tables, words, columns.get(page_num), figures.get(page_num)))
+                 for page_num, text, tables, words in pages]
+            )
+            self.conn.execute(
+                'INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?)',
+                (file_hash, len(pages), EXTRACTOR_VERSION, source, time.time())
+            )
+
+    def iter_pages(self, file_hash: str, with_words: bool = False, layout: str = 'text',
+                   figures: Optional[Dict[int, List]] = None) -> Iterator[PageRecord]:
+        """
+        페이지 순서대로 (페이지 번호, 텍스트, 테이블, 단어 박스) - 한 페이지씩 압축 해제
+
+        layout='columns'면 2단 페이지는 단 순서대로 읽은 텍스트를 돌려준다.
+        figures를 주면 그림이 있는 페이지를 {페이지 번호: [그림]}으로 채움 (페이지를 내보내기 전에).
+        """
+        cursor = self.conn.execute(
+            'SELECT page_num, data FROM pages WHERE file_hash = ? ORDER BY page_num', (file_hash,)
+        )
+        for page_num, data in cursor:
+            record = _unpack(data)
+            text = record['text']
+            if layout == 'columns' and record.get('columns') is not None:
+                text = record['columns']
+            if figures is not None and record.get('figures'):
+                figures[page_num] = [dict(found, bbox=tuple(found['bbox'])) for found in record['figures']]
+            yield page_num, text, record['tables'], record['words'] if with_words else []
+
+    def page(self, file_hash: str, page_num: int) -> Optional[PageRecord]:
+        row = self.conn.execute(
+            'SELECT data FROM pages WHERE file_hash = ? AND page_num = ?', (file_hash, page_num)
+        ).fetchone()
+        if row is None:
+            return None
+        record = _unpack(row[0])
+        return page_num, record['text'], record['tables'], record['words']
+
+    def ensure(self, pdf_path: str, file_hash: Optional[str] = None, on_page=None) -> str:
+        """
+        PDF가 저장되어 있지 않으면 추출해 저장 - 파일 해시 반환
+
+        on_page(페이지 번호, 텍스트, 소요 시간)는 새로 추출한 페이지마다 호출된다 (계측용).
+        """
+        from parse_cache import file_sha256
+
+        file_hash = file_hash or file_sha256(pdf_path)
+        if not self.has(file_hash):
+            pages, columns, figures = [], {}, {}
+            for record, column_text, found, timings in extract_document(pdf_path):
+                if on_page:
+                    on_page(record[0], record[1], timings)
+                pages.append(record)
+                if column_text is not None:
+                    columns[record[0]] = column_text
+                if found:
+                    figures[record[0]] = found
+            self.put(file_hash, pages, source=os.path.basename(pdf_path), columns=columns, figures=figures)
+        return file_hash
+
+    def documents(self) -> List[Dict]:
+        rows = self.conn.execute(
+            'SELECT file_hash, page_count, extractor, source, created_at FROM documents ORDER BY source'
+        ).fetchall()
+        return [
+            {'file_hash': h, 'page_count': n, 'extractor': e, 'source': s, 'created_at': c,
+             'current': e == EXTRACTOR_VERSION}
+            for h, n, e, s, c in rows
+        ]
+
+    def delete(self, file_hash: str) -> None:
+        with self.conn:
+            self.conn.execute('DELETE FROM pages WHERE file_hash = ?', (file_hash,))
+            self.conn.execute('DELETE FROM documents WHERE file_hash = ?', (file_hash,))
+
+    def stats(self) -> Dict:
+        documents, pages = self.conn.execute(
+            'SELECT (SELECT COUNT(*) FROM documents), (SELECT COUNT(*) FROM pages)'
+        ).fetchone()
+        return {
+            'path': str(self.path),
+            'documents': documents,
+            'pages': pages,
+            'bytes': self.path.stat().st_size if self.path.exists() else 0
+        }
+
+
+def reparse_all(store: PageStore, output_dir: str, options: Optional[Dict] = None,
+                progress=print) -> List[Dict]:
+    """저장소의 모든 문서를 PDF 없이 다시 파싱해 JSON 저장"""
+    from exam_pdf_parser_v2 import ExamPDFParser
+
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+    results = []
+
+    for doc in store.documents():
+        if not doc['current']:
+            progress(f"  건너뜀 (추출 버전 다름): {doc['source']}")
+            continue
+        start = time.perf_counter()
+        parser = ExamPDFParser.from_page_store(doc['file_hash'], store, source=doc['source'], **(options or {}))
+        parser.parse_questions()
+        stem = Path(doc['source']).stem or doc['file_hash'][:16]
+        parser.to_json(str(output / f"{stem}.json"))
+
+        elapsed = time.perf_counter() - start
+        results.append({'file_hash': doc['file_hash'], 'source': doc['source'],
+                        'questions': len(parser.questions), 'seconds': round(elapsed, 4)})
+        progress(f"  {doc['source']}: {len(parser.questions)}문제 ({elapsed:.3f}s)")
+    return results
+
+
+def main():
+    from batch_parser import collect_inputs
+    from exam_pdf_parser_v2 import DOCUMENT_SUFFIXES
+
+    arg_parser = argparse.ArgumentParser(description='페이지 추출 결과 저장소')
+    arg_parser.add_argument('--store', default=DEFAULT_STORE_PATH, help='저장소 SQLite 파일 경로')
+    commands = arg_parser.add_subparsers(dest='command', required=True)
+
+    ingest = commands.add_parser('ingest', help='PDF를 추출해 저장 (이미 있으면 건너뜀)')
+    ingest.add_argument('inputs', nargs='+', help='PDF/HWP/HWPX 파일, 디렉터리 또는 glob 패턴')
+
+    reparse = commands.add_parser('reparse', help='저장된 모든 문서를 PDF 없이 다시 파싱')
+    reparse.add_argument('-o', '--output-dir', default='.', help='JSON 저장 디렉터리')
+    reparse.add_argument('--profile', default=None, help='시험 프로필 id (기본: 자동 선택)')
+
+    commands.add_parser('stats', help='저장소 통계')
+
+    args = arg_parser.parse_args()
+    store = PageStore(args.store)
+
+    if args.command == 'ingest':
+        for pdf_path in collect_inputs(args.inputs, DOCUMENT_SUFFIXES):
+            start = time.perf_counter()
+            store.ensure(str(pdf_path))
+            print(f"  {pdf_path.name} ({time.perf_counter() - start:.2f}s)")
+
+    elif args.command == 'reparse':
+        start = time.perf_counter()
+        results = reparse_all(store, args.output_dir, {'profile': args.profile})
+        print(f"\n{len(results)}개 문서 / {sum(r['questions'] for r in results)}문제 "
+              f"({time.perf_counter() - start:.2f}s)")
+
+    elif args.command == 'stats':
+        stats = store.stats()
+        print(f"저장소: {stats['path']}")
+        print(f"문서: {stats['documents']}개 / 페이지: {stats['pages']}개 / {stats['bytes'] / 1024:.1f}KB")
+
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
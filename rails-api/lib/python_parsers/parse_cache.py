@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+시험 문제지 파싱 결과 캐시
+
+같은 기출 PDF(제19회~제23회)가 반복 업로드되므로, 파일 내용의 SHA-256과
+파서 버전/설정 fingerprint를 키로 to_dict() 결과를 로컬 디스크에 저장한다.
+용량 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제(LRU)한다.
+
+CLI:
+    python3 parse_cache.py stats
+    python3 parse_cache.py list
+    python3 parse_cache.py warm exam1.pdf exam2.pdf
+    python3 parse_cache.py purge [--older-than DAYS]
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+from pathlib import Path
+from typing import List, Optional, Dict
+
+from exam_pdf_parser_v2 import ExamPDFParser
+
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    'EXAM_PARSER_CACHE_DIR', str(Path.home() / '.cache' / 'exam_parser')
+)
+DEFAULT_MAX_BYTES = int(os.environ.get('EXAM_PARSER_CACHE_MAX_MB', '512')) * 1024 * 1024
+
+
+def file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """파일 내용의 SHA-256 (hashlib.sha256(f.read()).hexdigest()와 동일, 청크 단위로 읽음)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_key(file_hash: str, fingerprint: Dict) -> str:
+    """파일 해시 + 파서 설정 fingerprint로 캐시 키 생성"""
+    config = json.dumps(fingerprint, sort_keys=True, ensure_ascii=False)
+    config_hash = hashlib.sha256(config.encode('utf-8')).hexdigest()[:16]
+    return f"{file_hash}-{config_hash}"
+
+
+class ParseCache:
+    """SHA-256 기반 파싱 결과 디스크 캐시 (용량 상한 LRU)"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """캐시 조회 - 적중 시 접근 시각을 갱신해 LRU 순서 유지"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        os.utime(path)
+        return entry['data']
+
+    def put(self, key: str, data: Dict, source: str = '') -> None:
+        """캐시 저장 (임시 파일에 쓴 뒤 교체) 후 용량 상한 적용"""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        entry = {
+            'meta': {'key': key, 'source': source, 'created_at': time.time()},
+            'data': data
+        }
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+        self.evict()
+
+    def parse(self, pdf_path: str, **options) -> Dict:
+        """캐시를 거쳐 PDF 파싱 - 적중하면 pdfplumber를 전혀 호출하지 않음"""
+        parser = ExamPDFParser(pdf_path, **options)
+        key = cache_key(file_sha256(pdf_path), parser.config_fingerprint())
+
+        data = self.get(key)
+        if data is not None:
+            if parser.tracer:
+                parser.tracer.count('cache_hits')
+                data['metrics'] = parser.tracer.to_dict()
+            return data
+
+        parser.extract_text()
+        parser.identify_sections()
+        parser.parse_questions()
+        data = parser.to_dict()
+
+        # 계측 결과는 이번 실행에만 해당하므로 캐시에는 저장하지 않음
+        metrics = data.pop('metrics', None)
+        self.put(key, data, source=os.path.basename(pdf_path))
+        if metrics is not None:
+            data['metrics'] = metrics
+        return data
+
+    def entries(self) -> List[Dict]:
+        """캐시 항목 목록 (최근 사용 순)"""
+        result = []
+        for path in self.cache_dir.glob('*/*.json'):
+            stat = path.stat()
+            result.append({
+                'key': path.stem,
+                'path': str(path),
+                'size': stat.st_size,
+                'last_access': stat.st_mtime
+            })
+        result.sort(key=lambda e: e['last_access'], reverse=True)
+        return result
+
+    def stats(self) -> Dict:
+        """캐시 항목 수와 전체 크기"""
+        entries = self.entries()
+        return {
+            'cache_dir': str(self.cache_dir),
+            'entries': len(entries),
+            'total_bytes': sum(e['size'] for e in entries),
+            'max_bytes': self.max_bytes
+        }
+
+    def evict(self) -> int:
+        """용량 상한을 넘으면 오래 사용하지 않은 항목부터 삭제"""
+        entries = self.entries()
+        total = sum(e['size'] for e in entries)
+        removed = 0
+
+        while entries and total > self.max_bytes:
+            oldest = entries.pop()
+            Path(oldest['path']).unlink(missing_ok=True)
+            total -= oldest['size']
+            removed += 1
+
+        return removed
+
+    def purge(self, older_than: Optional[float] = None) -> int:
+        """캐시 삭제 - older_than(초)을 주면 그보다 오래 사용하지 않은 항목만"""
+        cutoff = time.time() - older_than if older_than is not None else None
+        removed = 0
+
+        for entry in self.entries():
+            if cutoff is None or entry['last_access'] < cutoff:
+                Path(entry['path']).unlink(missing_ok=True)
+                removed += 1
+
+        return removed
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='시험 문제지 파싱 결과 캐시 관리')
+    arg_parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR)
+    arg_parser.add_argument('--max-mb', type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024))
+    commands = arg_parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('stats', help='항목 수와 전체 크기')
+    commands.add_parser('list', help='캐시 항목 목록 (최근 사용 순)')
+    warm = commands.add_parser('warm', help='PDF를 파싱해 캐시에 미리 적재')
+    warm.add_argument('pdf_paths', nargs='+')
+    purge = commands.add_parser('purge', help='캐시 삭제')
+    purge.add_argument('--older-than', type=float, metavar='DAYS',
+                       help='지정한 일수 이상 사용하지 않은 항목만 삭제')
+
+    args = arg_parser.parse_args()
+    cache = ParseCache(args.cache_dir, max_bytes=args.max_mb * 1024 * 1024)
+
+    if args.command == 'stats':
+        stats = cache.stats()
+        print(f"캐시 경로: {stats['cache_dir']}")
+        print(f"항목 수: {stats['entries']}")
+        print(f"사용량: {stats['total_bytes'] / 1024 / 1024:.2f}MB / {stats['max_bytes'] / 1024 / 1024:.0f}MB")
+
+    elif args.command == 'list':
+        for entry in cache.entries():
+            accessed = time.strftime('%Y-%m-%d %H:%M', time.localtime(entry['last_access']))
+            print(f"{entry['key']}  {entry['size'] / 1024:8.1f}KB  {accessed}")
+
+    elif args.command == 'warm':
+        for pdf_path in args.pdf_paths:
+            start = time.perf_counter()
+            try:
+                data = cache.parse(pdf_path)
+            except Exception as e:
+                print(f"실패: {pdf_path} ({e})", file=sys.stderr)
+                continue
+            elapsed = time.perf_counter() - start
+            print(f"{pdf_path}: {data['exam_info']['total_questions']}문제 ({elapsed:.2f}s)")
+
+    elif args.command == 'purge':
+        older_than = args.older_than * 86400 if args.older_than is not None else None
+        removed = cache.purge(older_than)
+        print(f"삭제된 항목: {removed}")
+
+
+if __name__ == "__main__":
+    main()
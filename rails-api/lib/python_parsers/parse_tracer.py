@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+시험 문제지 파서 계측
+
+ExamPDFParser(..., trace=True) 또는 tracer=ParseTracer(hooks=[...])로 켜면
+단계별/페이지별 소요 시간, 정규식 매치 수, 생성 객체 수를 모아
+to_json()/to_dict() 출력의 metrics 블록으로 내보낸다. 꺼져 있으면 기록하지 않는다.
+
+훅은 hook(event, name, data) 형태의 callable이며 event는
+'stage' (단계 종료), 'page' (페이지 추출), 'count' (카운터 증가) 중 하나다.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+Hook = Callable[[str, str, Dict], None]
+
+
+class ParseTracer:
+    """단계/페이지별 소요 시간과 카운터 수집기"""
+
+    def __init__(self, hooks: Optional[List[Hook]] = None):
+        self.hooks = list(hooks or [])
+        self.stages: Dict[str, Dict] = {}     # 단계 -> {'seconds', 'calls'} (같은 단계는 누적)
+        self.pages: Dict[int, Dict] = {}      # 페이지 -> {'text', 'tables', 'chars', ...}
+        self.counts: Dict[str, int] = {}
+        self.started = time.perf_counter()
+
+    def add_hook(self, hook: Hook) -> None:
+        self.hooks.append(hook)
+
+    def _emit(self, event: str, name: str, data: Dict) -> None:
+        for hook in self.hooks:
+            hook(event, name, data)
+
+    @contextmanager
+    def stage(self, name: str):
+        """with tracer.stage('parse_questions'): ... - 블록 소요 시간을 단계에 누적"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            entry = self.stages.setdefault(name, {'seconds': 0.0, 'calls': 0})
+            entry['seconds'] += seconds
+            entry['calls'] += 1
+            self._emit('stage', name, {'seconds': seconds})
+
+    def page(self, page_num: int, **values) -> None:
+        """페이지별 측정값 기록 (같은 페이지에 여러 번 기록하면 합쳐짐)"""
+        self.pages.setdefault(page_num, {}).update(values)
+        self._emit('page', str(page_num), values)
+
+    def count(self, name: str, n: int = 1) -> None:
+        """카운터 증가"""
+        self.counts[name] = self.counts.get(name, 0) + n
+        self._emit('count', name, {'n': n})
+
+    def to_dict(self) -> Dict:
+        """metrics 블록 - 시간은 초 단위, 소수점 6자리"""
+        return {
+            'total_seconds': round(time.perf_counter() - self.started, 6),
+            'stages': {
+                name: {'seconds': round(entry['seconds'], 6), 'calls': entry['calls']}
+                for name, entry in self.stages.items()
+            },
+            'pages': [
+                {'page': page_num, **{k: round(v, 6) if isinstance(v, float) else v
+                                      for k, v in values.items()}}
+                for page_num, values in sorted(self.pages.items())
+            ],
+            'counts': dict(self.counts)
+        }
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+시험 문제지 파서 벤치마크
+
+sample-data의 PDF마다 extract_text / identify_sections / parse_questions /
+to_json / to_markdown / to_csv 단계를 반복 실행해 단계별 wall/CPU 시간,
+최대 RSS, 초당 문제 수를 JSON으로 저장한다. compare는 두 결과를 비교해
+임계값 이상 느려지거나 메모리가 늘어난 항목을 회귀로 표시한다.
+
+실행:
+    python3 parser_benchmark.py run -o bench/base.json
+    python3 parser_benchmark.py run "sample-data/제19회*.pdf" --repeat 5 -o bench/new.json
+    python3 parser_benchmark.py compare bench/base.json bench/new.json --threshold 0.1
+"""
+
+import sys
+import json
+import time
+import resource
+import platform
+import argparse
+import statistics
+from pathlib import Path
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Dict
+
+import pdfplumber
+
+from exam_pdf_parser_v2 import ExamPDFParser, PARSER_VERSION
+from batch_parser import collect_inputs
+
+
+DEFAULT_CORPUS = Path(__file__).resolve().parents[3] / 'sample-data'
+
+STAGES = [
+    ('extract_text', lambda p: p.extract_text()),
+    ('identify_sections', lambda p: p.identify_sections()),
+    ('parse_questions', lambda p: p.parse_questions()),
+    ('to_json', lambda p: p.to_json()),
+    ('to_markdown', lambda p: p.to_markdown()),
+    ('to_csv', lambda p: p.to_csv()),
+]
+
+# compare에서 비교하는 단계별 지표
+METRICS = ('wall', 'cpu', 'peak_rss_mb')
+
+
+def _peak_rss_mb() -> float:
+    """현재 프로세스의 최대 RSS (Linux는 KB, macOS는 byte 단위로 보고됨)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        peak /= 1024
+    return round(peak / 1024, 2)
+
+
+def benchmark_file(pdf_path: str, repeat: int = 3, options: Optional[Dict] = None) -> Dict:
+    """
+    PDF 하나의 단계별 측정 - 파일마다 새 프로세스에서 실행해야 RSS가 섞이지 않음
+
+    wall/cpu는 repeat번 실행의 중앙값, peak_rss_mb는 해당 단계까지의 프로세스 최대값.
+    """
+    samples = {name: {'wall': [], 'cpu': []} for name, _ in STAGES}
+    peak_rss = {}
+    questions = 0
+
+    for _ in range(repeat):
+        parser = ExamPDFParser(pdf_path, **(options or {}))
+        for name, stage in STAGES:
+            wall = time.perf_counter()
+            cpu = time.process_time()
+            stage(parser)
+            samples[name]['cpu'].append(time.process_time() - cpu)
+            samples[name]['wall'].append(time.perf_counter() - wall)
+            peak_rss[name] = _peak_rss_mb()
+        questions = len(parser.questions)
+
+    stages = {
+        name: {
+            'wall': round(statistics.median(samples[name]['wall']), 6),
+            'wall_min': round(min(samples[name]['wall']), 6),
+            'cpu': round(statistics.median(samples[name]['cpu']), 6),
+            'peak_rss_mb': peak_rss[name]
+        }
+        for name, _ in STAGES
+    }
+    total_wall = sum(s['wall'] for s in stages.values())
+
+    return {
+        'file': pdf_path,
+        'questions': questions,
+        'stages': stages,
+        'total': {
+            'wall': round(total_wall, 6),
+            'cpu': round(sum(s['cpu'] for s in stages.values()), 6),
+            'peak_rss_mb': max(s['peak_rss_mb'] for s in stages.values()),
+            'questions_per_sec': round(questions / total_wall, 2) if total_wall else 0.0
+        }
+    }
+
+
+def run_benchmark(inputs: List[str], repeat: int = 3, options: Optional[Dict] = None,
+                  progress=print) -> Dict:
+    """코퍼스 전체 측정 - 결과 dict (files는 파일 이름 기준)"""
+    pdf_paths = collect_inputs(inputs)
+    files = {}
+
+    # 파일마다 새 워커 프로세스 (max_tasks_per_child=1)로 최대 RSS를 분리
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as executor:
+        for pdf_path in pdf_paths:
+            result = executor.submit(benchmark_file, str(pdf_path), repeat, options).result()
+            files[pdf_path.name] = result
+            progress(f"  {pdf_path.name}: {result['questions']}문제 "
+                     f"{result['total']['wall']:.3f}s ({result['total']['questions_per_sec']:.1f}문제/s)")
+
+    total_wall = sum(r['total']['wall'] for r in files.values())
+    total_questions = sum(r['questions'] for r in files.values())
+
+    return {
+        'meta': {
+            'parser_version': PARSER_VERSION,
+            'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'pdfplumber': getattr(pdfplumber, '__version__', 'unknown'),
+            'platform': platform.platform(),
+            'repeat': repeat,
+            'options': options or {}
+        },
+        'files': files,
+        'summary': {
+            'files': len(files),
+            'questions': total_questions,
+            'wall': round(total_wall, 6),
+            'cpu': round(sum(r['total']['cpu'] for r in files.values()), 6),
+            'peak_rss_mb': max((r['total']['peak_rss_mb'] for r in files.values()), default=0.0),
+            'questions_per_sec': round(total_questions / total_wall, 2) if total_wall else 0.0
+        }
+    }
+
+
+def compare_results(base: Dict, new: Dict, threshold: float = 0.10,
+                    min_seconds: float = 0.005) -> Dict:
+    """
+    두 측정 결과 비교
+
+    같은 파일/단계의 지표가 threshold 비율 이상 증가하면 회귀로 표시한다.
+    시간 지표는 두 값이 모두 min_seconds 미만이면 측정 잡음으로 보고 건너뛴다.
+    """
+    rows = []
+    for name in sorted(set(base['files']) & set(new['files'])):
+        base_file, new_file = base['files'][name], new['files'][name]
+        stages = [(stage, base_file['stages'][stage], new_file['stages'][stage])
+                  for stage in base_file['stages'] if stage in new_file['stages']]
+        stages.append(('total', base_file['total'], new_file['total']))
+
+        for stage, before, after in stages:
+            for metric in METRICS:
+                old, cur = before.get(metric), after.get(metric)
+                if old is None or cur is None:
+                    continue
+                if metric != 'peak_rss_mb' and max(old, cur) < min_seconds:
+                    continue
+
+                change = (cur - old) / old if old else 0.0
+                rows.append({
+                    'file': name,
+                    'stage': stage,
+                    'metric': metric,
+                    'base': old,
+                    'new': cur,
+                    'change': round(change, 4),
+                    'regression': change > threshold
+                })
+
+    regressions = [r for r in rows if r['regression']]
+    return {
+        'threshold': threshold,
+        'rows': rows,
+        'regressions': regressions,
+        'missing': sorted(set(base['files']) - set(new['files'])),
+        'added': sorted(set(new['files']) - set(base['files']))
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='시험 문제지 파서 벤치마크')
+    commands = arg_parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='코퍼스 측정 후 JSON 저장')
+    run.add_argument('inputs', nargs='*', default=[str(DEFAULT_CORPUS)],
+                     help='PDF 파일, 디렉터리 또는 glob 패턴 (기본: sample-data)')
+    run.add_argument('--repeat', type=int, default=3, help='파일별 반복 횟수 (중앙값 사용)')
+    run.add_argument('--workers', type=int, default=1, help='파일 내 페이지 추출 워커 수')
+    run.add_argument('--tables', choices=ExamPDFParser.TABLE_STRATEGIES, default='eager')
+    run.add_argument('--layout', choices=ExamPDFParser.LAYOUTS, default='text')
+    run.add_argument('-o', '--output', default='benchmark.json', help='결과 JSON 경로')
+
+    compare = commands.add_parser('compare', help='두 결과를 비교해 회귀 표시')
+    compare.add_argument('base')
+    compare.add_argument('new')
+    compare.add_argument('--threshold', type=float, default=0.10, help='회귀로 볼 증가율 (기본 0.10 = 10%%)')
+    compare.add_argument('--min-seconds', type=float, default=0.005, help='이보다 짧은 단계는 비교하지 않음')
+    compare.add_argument('--all', action='store_true', help='회귀가 아닌 항목도 출력')
+
+    args = arg_parser.parse_args()
+
+    if args.command == 'run':
+        options = {'workers': args.workers, 'table_strategy': args.tables, 'layout': args.layout}
+        print(f"측정 중 (반복 {args.repeat}회)...")
+        result = run_benchmark(args.inputs, args.repeat, options)
+
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+        summary = result['summary']
+        print(f"\n{summary['files']}개 파일 / {summary['questions']}문제: "
+              f"wall {summary['wall']:.3f}s, cpu {summary['cpu']:.3f}s, "
+              f"최대 RSS {summary['peak_rss_mb']:.1f}MB, {summary['questions_per_sec']:.1f}문제/s")
+        print(f"저장: {output}")
+
+    elif args.command == 'compare':
+        with open(args.base, 'r', encoding='utf-8') as f:
+            base = json.load(f)
+        with open(args.new, 'r', encoding='utf-8') as f:
+            new = json.load(f)
+
+        report = compare_results(base, new, args.threshold, args.min_seconds)
+        rows = report['rows'] if args.all else report['regressions']
+
+        for r in rows:
+            mark = '회귀' if r['regression'] else '    '
+            print(f"{mark}  {r['file'][:40]:<40} {r['stage']:<18} {r['metric']:<12} "
+                  f"{r['base']:>10.4f} -> {r['new']:>10.4f} ({r['change']:+.1%})")
+        for name in report['missing']:
+            print(f"누락: {name}")
+        for name in report['added']:
+            print(f"추가: {name}")
+
+        print(f"\n회귀 {len(report['regressions'])}건 / 비교 {len(report['rows'])}건 "
+              f"(임계값 {args.threshold:.0%})")
+        if report['regressions']:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+시험 문제지 PDF 파서 상주 서버
+
+PythonParserBridge가 PDF마다 `python3 -c`로 인터프리터를 새로 띄우는 대신,
+pdfplumber/pdfminer를 미리 import한 워커 프로세스를 유지하고 요청을 받는다.
+
+프로토콜 (JSON Lines, 한 줄에 요청/응답 하나):
+    요청: {"id": 1, "pdf_path": "/path/exam.pdf", "options": {}}
+    응답: {"id": 1, "ok": true, "result": {...to_json()과 같은 구조...}}
+          {"id": 1, "ok": false, "error": "..."}
+    상태 확인: {"id": 2, "command": "ping"} -> {"id": 2, "ok": true, "pid": ...}
+
+실행:
+    python3 parser_server.py --stdio --workers 2
+    python3 parser_server.py --socket /tmp/exam_parser.sock --workers 4
+    python3 parser_server.py --stdio --cache-dir tmp/cache/exam_parser   # 파싱 결과 캐시 사용
+"""
+
+import os
+import sys
+import json
+import signal
+import argparse
+import threading
+import socketserver
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Optional
+
+from exam_pdf_parser_v2 import ExamPDFParser
+from parse_cache import ParseCache
+
+
+def _init_worker():
+    """워커 초기화 - 종료 신호는 부모 프로세스가 처리"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def parse_pdf(pdf_path: str, options: Dict = None, cache_dir: Optional[str] = None) -> Dict:
+    """워커 프로세스에서 PDF 하나를 파싱해 to_json()과 같은 구조로 반환"""
+    if cache_dir:
+        return ParseCache(cache_dir).parse(pdf_path, **(options or {}))
+
+    parser = ExamPDFParser(pdf_path, **(options or {}))
+    parser.extract_text()
+    parser.identify_sections()
+    parser.parse_questions()
+    return parser.to_dict()
+
+
+class ParserServer:
+    """워커 풀을 유지하며 JSON Lines 요청을 처리하는 서버"""
+
+    def __init__(self, workers: int = 2, cache_dir: Optional[str] = None):
+        self.workers = workers
+        self.cache_dir = cache_dir
+        self._executor_lock = threading.Lock()
+        self.executor = self._new_executor()
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+
+    def _restart(self, broken: ProcessPoolExecutor) -> ProcessPoolExecutor:
+        """워커가 죽어 깨진 풀을 새 풀로 교체 (다른 요청이 이미 교체했으면 그대로) - 현재 풀 반환"""
+        with self._executor_lock:
+            if self.executor is broken:
+                broken.shutdown(wait=False, cancel_futures=True)
+                self.executor = self._new_executor()
+            return self.executor
+
+    def _submit(self, *args):
+        """현재 풀에 작업 제출 - 풀이 이미 깨져 있으면 새 풀에서. (풀, future) 반환"""
+        executor = self.executor
+        try:
+            return executor, executor.submit(*args)
+        except BrokenProcessPool:
+            executor = self._restart(executor)
+            return executor, executor.submit(*args)
+
+    def handle_line(self, line: str, write: Callable[[Dict], None]):
+        """요청 한 줄을 처리하고, 결과가 준비되면 write로 응답 전송"""
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            write({'id': None, 'ok': False, 'error': f'Invalid JSON: {e}'})
+            return
+
+        request_id = request.get('id')
+
+        if request.get('command') == 'ping':
+            write({'id': request_id, 'ok': True, 'pid': os.getpid(), 'workers': self.workers})
+            return
+
+        pdf_path = request.get('pdf_path')
+        if not pdf_path or not os.path.exists(pdf_path):
+            write({'id': request_id, 'ok': False, 'error': f'PDF file not found: {pdf_path}'})
+            return
+
+        executor, future = self._submit(parse_pdf, pdf_path, request.get('options'), self.cache_dir)
+
+        def respond(f):
+            try:
+                write({'id': request_id, 'ok': True, 'result': f.result()})
+            except BrokenProcessPool as e:
+                # 워커가 비정상 종료 - 이 요청은 실패로 응답하고 이후 요청은 새 풀에서 처리
+                self._restart(executor)
+                write({'id': request_id, 'ok': False, 'error': f'{type(e).__name__}: {e}'})
+            except Exception as e:
+                write({'id': request_id, 'ok': False, 'error': f'{type(e).__name__}: {e}'})
+
+        future.add_done_callback(respond)
+
+    def serve_stdio(self, stdin=None, stdout=None):
+        """stdin/stdout JSON Lines 모드 - 응답은 완료 순서대로 id와 함께 전송"""
+        stdin = stdin or sys.stdin
+        stdout = stdout or sys.stdout
+        lock = threading.Lock()
+
+        def write(response):
+            with lock:
+                stdout.write(json.dumps(response, ensure_ascii=False) + '\n')
+                stdout.flush()
+
+        for line in stdin:
+            line = line.strip()
+            if line:
+                self.handle_line(line, write)
+
+        # stdin이 닫혀도 진행 중인 요청은 마저 응답
+        self.executor.shutdown(wait=True)
+
+    def serve_unix(self, socket_path: str):
+        """Unix 소켓 모드 - 연결마다 스레드 하나, 파싱은 공유 워커 풀에서 처리"""
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                lock = threading.Lock()
+                done = threading.Semaphore(0)
+                submitted = 0
+
+                def write(response):
+                    with lock:
+                        try:
+                            self.wfile.write((json.dumps(response, ensure_ascii=False) + '\n').encode('utf-8'))
+                            self.wfile.flush()
+                        except (BrokenPipeError, ConnectionResetError):
+                            pass
+                    done.release()
+
+                for raw in self.rfile:
+                    line = raw.decode('utf-8').strip()
+                    if line:
+                        submitted += 1
+                        server.handle_line(line, write)
+
+                # 클라이언트가 쓰기를 닫아도 남은 응답은 전송
+                for _ in range(submitted):
+                    done.acquire()
+
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+        # SIGTERM(배포 재시작)에도 소켓 파일 정리
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+        socketserver.ThreadingUnixStreamServer.daemon_threads = True
+        with socketserver.ThreadingUnixStreamServer(socket_path, Handler) as unix_server:
+            try:
+                unix_server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                if os.path.exists(socket_path):
+                    os.unlink(socket_path)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='시험 문제지 PDF 파서 상주 서버')
+    mode = arg_parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument('--stdio', action='store_true', help='stdin/stdout JSON Lines 모드')
+    mode.add_argument('--socket', help='Unix 소켓 경로')
+    arg_parser.add_argument('--workers', type=int, default=os.cpu_count() or 2,
+                            help='상주 워커 프로세스 수')
+    arg_parser.add_argument('--cache-dir', help='파싱 결과 캐시 경로 (parse_cache.py)')
+    args = arg_parser.parse_args()
+
+    server = ParserServer(workers=args.workers, cache_dir=args.cache_dir)
+
+    if args.stdio:
+        server.serve_stdio()
+    else:
+        print(f"파서 서버 시작: {args.socket} (workers={args.workers})", file=sys.stderr)
+        server.serve_unix(args.socket)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+열 기반(columnar) 문제 은행
+
+여러 회차의 문제를 메모리에 올려 둘 때 Question/Choice/PassageItem 객체를
+문제마다 만드는 대신, 모든 텍스트를 하나의 공유 문자열 버퍼에 이어 붙이고
+각 구간의 끝 위치만 array로 보관한다. 번호/마커/과목도 정수 array로 저장하며,
+JSON/CSV는 중간 dict 없이 열에서 바로 쓴다 (ExamPDFParser.to_json/to_csv와 같은 출력).
+
+사용:
+    bank = parser.to_question_bank()
+    bank.extend(other_parser.iter_questions())
+    with open('bank.json', 'w', encoding='utf-8') as f:
+        bank.write_json(f)
+"""
+
+import csv
+import json
+from io import StringIO
+from array import array
+from bisect import bisect_right
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO
+
+from exam_pdf_parser_v2 import Question, PassageItem, Choice, Table, Figure, CSV_HEADER
+
+_encode = json.encoder.encode_basestring  # ensure_ascii=False와 같은 문자열 인코딩
+
+
+class QuestionBank:
+    """
+    문제 목록의 열 기반 표현
+
+    문제 i의 텍스트 구간은 _span_start[i]부터 순서대로
+    질문 1개 -> 지문 항목들 -> 보기들이며, 지문/보기 개수는
+    _passage_start / _choice_start (길이 n+1)의 차이로 구한다.
+    """
+
+    def __init__(self, exam_info: Optional[Dict] = None):
+        self.exam_info = dict(exam_info or {})
+        self._numbers = array('H')          # 문제 번호
+        self._section_ids = array('H')      # 과목 id -> self._sections
+        self._sections: List[str] = []
+        self._section_lookup: Dict[str, int] = {}
+        self._span_start = array('I')       # 문제별 첫 텍스트 구간 번호
+        self._passage_start = array('I', [0])
+        self._passage_markers = array('I')  # 지문 마커 (ord)
+        self._choice_start = array('I', [0])
+        self._choice_numbers = array('B')
+        self._tables: Dict[int, Table] = {}  # 표가 있는 문제만 (대부분 없음)
+        self._figures: Dict[int, List[Figure]] = {}  # 그림이 있는 문제만
+
+        # 공유 텍스트 버퍼 - 구간 k는 전체 텍스트의 [_span_ends[k-1], _span_ends[k])
+        # 읽을 때마다 앞부분을 다시 복사하지 않도록 버퍼는 덩어리 목록으로 두고 덩어리 끝 위치를 따로 보관
+        self._span_ends = array('I')
+        self._chunks: List[str] = []
+        self._chunk_ends = array('I')
+        self._pending: List[str] = []       # 아직 덩어리로 합치지 않은 텍스트
+        self._length = 0
+
+    @classmethod
+    def from_questions(cls, questions: Iterable[Question], exam_info: Optional[Dict] = None) -> 'QuestionBank':
+        bank = cls(exam_info)
+        bank.extend(questions)
+        return bank
+
+    def _add_span(self, text: str) -> None:
+        self._pending.append(text)
+        self._length += len(text)
+        self._span_ends.append(self._length)
+
+    def _section_id(self, section: str) -> int:
+        section_id = self._section_lookup.get(section)
+        if section_id is None:
+            section_id = len(self._sections)
+            self._sections.append(section)
+            self._section_lookup[section] = section_id
+        return section_id
+
+    def add(self, question: Question) -> None:
+        """문제 하나 추가 (객체는 보관하지 않음)"""
+        index = len(self._numbers)
+        self._numbers.append(question.number)
+        self._section_ids.append(self._section_id(question.section))
+        self._span_start.append(len(self._span_ends))
+
+        self._add_span(question.question)
+        for item in question.passage:
+            self._passage_markers.append(ord(item.marker))
+            self._add_span(item.text)
+        for choice in question.choices:
+            self._choice_numbers.append(choice.number)
+            self._add_span(choice.text)
+
+        self._passage_start.append(len(self._passage_markers))
+        self._choice_start.append(len(self._choice_numbers))
+        if question.table is not None:
+            self._tables[index] = question.table
+        if question.figures:
+            self._figures[index] = list(question.figures)
+
+    def extend(self, questions: Iterable[Question]) -> None:
+        for question in questions:
+            self.add(question)
+
+    def __len__(self) -> int:
+        return len(self._numbers)
+
+    @property
+    def sections(self) -> List[str]:
+        return list(self._sections)
+
+    def _text(self, span: int) -> str:
+        if self._pending:
+            self._chunks.append(''.join(self._pending))
+            self._chunk_ends.append(self._length)
+            self._pending = []
+        start = self._span_ends[span - 1] if span else 0
+        end = self._span_ends[span]
+        if start == end:
+            return ''
+        chunk = bisect_right(self._chunk_ends, start)   # 구간은 덩어리 경계를 넘지 않음
+        offset = self._chunk_ends[chunk - 1] if chunk else 0
+        return self._chunks[chunk][start - offset:end - offset]
+
+    def _parts(self, i: int):
+        """문제 i의 (질문, [(마커, 지문)], [(번호, 보기)]) - 버퍼에서 잘라낸 문자열"""
+        span = self._span_start[i]
+        p_start, p_end = self._passage_start[i], self._passage_start[i + 1]
+        c_start, c_end = self._choice_start[i], self._choice_start[i + 1]
+
+        question = self._text(span)
+        span += 1
+        passage = []
+        for k in range(p_start, p_end):
+            passage.append((chr(self._passage_markers[k]), self._text(span)))
+            span += 1
+        choices = []
+        for k in range(c_start, c_end):
+            choices.append((self._choice_numbers[k], self._text(span)))
+            span += 1
+        return question, passage, choices
+
+    def __getitem__(self, i: int) -> Question:
+        """문제 i를 Question으로 복원"""
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('question index out of range')
+
+        question, passage, choices = self._parts(i)
+        return Question(
+            number=self._numbers[i],
+            section=self._sections[self._section_ids[i]],
+            question=question,
+            passage=[PassageItem(marker=m, text=t) for m, t in passage],
+            choices=[Choice(number=n, text=t) for n, t in choices],
+            table=self._tables.get(i),
+            figures=list(self._figures.get(i, ()))
+        )
+
+    def __iter__(self) -> Iterator[Question]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def _question_json(self, i: int, indent: Optional[int], level: int) -> str:
+        """문제 i를 json.dumps(to_dict()의 문제 항목, indent=indent)와 같은 문자열로"""
+        if indent is None:
+            nl = inner = inner2 = inner3 = ''
+            sep = ', '
+        else:
+            nl = '\n'
+            inner = ' ' * (indent * (level + 1))
+            inner2 = ' ' * (indent * (level + 2))
+            inner3 = ' ' * (indent * (level + 3))
+            sep = ','
+        close = '' if indent is None else ' ' * (indent * level)
+
+        question, passage, choices = self._parts(i)
+
+        def item_list(items, key, value_key):
+            if not items:
+                return '[]'
+            entries = [
+                f'{{{nl}{inner3}"{key}": {k if isinstance(k, int) else _encode(k)}{sep}{nl}'
+                f'{inner3}"{value_key}": {_encode(v)}{nl}{inner2}}}'
+                for k, v in items
+            ]
+            return f'[{nl}{inner2}' + f'{sep}{nl}{inner2}'.join(entries) + f'{nl}{inner}]'
+
+        def nested(value) -> str:
+            text = json.dumps(value, ensure_ascii=False, indent=indent)
+            return text if indent is None else text.replace('\n', '\n' + inner)
+
+        table = self._tables.get(i)
+        fields = [
+            f'"number": {self._numbers[i]}',
+            f'"section": {_encode(self._sections[self._section_ids[i]])}',
+            f'"question": {_encode(question)}',
+            f'"passage": {item_list(passage, "marker", "text")}',
+            f'"choices": {item_list(choices, "number", "text")}',
+            f'"table": {"null" if table is None else nested(table.to_dict())}',
+        ]
+        if i in self._figures:   # to_dict처럼 그림이 있는 문제만 키를 씀
+            fields.append(f'"figures": {nested([f.to_dict() for f in self._figures[i]])}')
+        return f'{{{nl}{inner}' + f'{sep}{nl}{inner}'.join(fields) + f'{nl}{close}}}'
+
+    def write_json(self, fp: TextIO, indent: Optional[int] = 2) -> None:
+        """ExamPDFParser.to_json()과 같은 구조를 문제 단위로 fp에 기록 (전체 dict를 만들지 않음)"""
+        exam_info = dict(self.exam_info, total_questions=len(self))
+        exam_info.setdefault('sections', self.sections)
+
+        if indent is None:
+            nl, pad, sep = '', '', ', '
+        else:
+            nl, pad, sep = '\n', ' ' * indent, ','
+
+        info_json = json.dumps(exam_info, ensure_ascii=False, indent=indent)
+        if indent is not None:
+            info_json = info_json.replace('\n', '\n' + pad)
+
+        fp.write(f'{{{nl}{pad}"exam_info": {info_json}{sep}{nl}{pad}"questions": ')
+        if not len(self):
+            fp.write('[]')
+        else:
+            fp.write('[')
+            for i in range(len(self)):
+                if i:
+                    fp.write(sep)
+                fp.write(nl + pad * 2 + self._question_json(i, indent, 2))
+            fp.write(f'{nl}{pad}]')
+        fp.write(f'{nl}}}')
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        output = StringIO()
+        self.write_json(output, indent)
+        return output.getvalue()
+
+    def write_csv(self, fp: TextIO) -> None:
+        """ExamPDFParser.to_csv()와 같은 행을 fp에 기록"""
+        writer = csv.writer(fp)
+        writer.writerow(CSV_HEADER)
+
+        for i in range(len(self)):
+            question, passage, choices = self._parts(i)
+            circle_items = [t for m, t in passage if m == '○']
+            jamo_items = {m: t for m, t in passage if m != '○'}
+            choice_texts = dict(choices)
+            table = self._tables.get(i)
+
+            writer.writerow(
+                [self._numbers[i], self._sections[self._section_ids[i]], question]
+                + [circle_items[k] if len(circle_items) > k else '' for k in range(3)]
+                + [jamo_items.get(m, '') for m in 'ㄱㄴㄷㄹㅁ']
+                + [choice_texts.get(n, '') for n in range(1, 6)]
+                + [table.to_markdown() if table else '']
+            )
+
+    def to_csv(self) -> str:
+        output = StringIO()
+        self.write_csv(output)
+        return output.getvalue()
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+회차/형별을 넘나드는 유사 중복 문제 탐지 (MinHash + LSH)
+
+같은 문제가 조사나 띄어쓰기만 바뀌어 다른 회차, A형/B형에 다시 나온다. 문제마다
+질문/지문/보기를 한글 기준으로 정규화해 음절 shingle 집합을 만들고, MinHash 서명을
+LSH 밴드로 나눠 같은 버킷에 들어온 문제끼리만 비교한다. 전체 쌍을 비교하지 않으므로
+문제 은행 크기에 거의 선형이고, 시험지를 하나씩 추가하며 증분으로 갱신할 수 있다.
+
+    index = DuplicateIndex(threshold=0.6)
+    index.add_exam(parser.parse_questions(), parser.exam_info())
+    index.clusters()      # [[(19, '1교시', 'A형', 7), (19, '1교시', 'B형', 12)], ...]
+    index.save('dedup.npz')
+
+    python question_dedup.py sample-data/*.pdf --index dedup.npz
+"""
+
+import re
+import sys
+import json
+import zlib
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from exam_pdf_parser_v2 import Question
+
+NUM_PERM = 128              # MinHash 서명 길이
+SHINGLE_SIZE = 3            # 음절 n-gram 크기
+THRESHOLD = 0.6             # 이 Jaccard 유사도(서명 추정치) 이상이면 유사 중복
+PRIME = 4294967291          # 2^32보다 작은 가장 큰 소수 - a*x+b가 uint64에서 넘치지 않음
+MAX_HASH = np.uint64(PRIME)
+
+# 어절 끝에서 떼어 내는 조사 (긴 것부터) - 조사만 바뀐 문장도 같은 shingle이 되도록
+PARTICLES = ('에서는', '으로서', '으로써', '에게서', '에서', '에게', '으로', '로서', '로써', '까지', '부터',
+             '보다', '처럼', '은', '는', '이', '가', '을', '를', '의', '에', '로', '와', '과', '도', '만')
+_NON_WORD = re.compile(r'[\W_]+')
+
+Key = Tuple               # (회차, 교시, 형별, 문제 번호)
+
+
+def normalize(text: str) -> str:
+    """NFKC + 소문자, 어절마다 끝 조사를 떼고 공백/문장부호 없이 이어 붙임"""
+    words = []
+    for word in unicodedata.normalize('NFKC', text).lower().split():
+        word = _NON_WORD.sub('', word)
+        for particle in PARTICLES:
+            if len(word) > len(particle) + 1 and word.endswith(particle):
+                word = word[:-len(particle)]
+                break
+        words.append(word)
+    return ''.join(words)
+
+
+def shingles(question: Question, size: int = SHINGLE_SIZE) -> set:
+    """질문/지문 항목/보기 각각의 음절 n-gram 집합 (항목 경계를 넘는 n-gram은 만들지 않음)"""
+    parts = [question.question] + [p.text for p in question.passage] + [c.text for c in question.choices]
+    result = set()
+    for part in parts:
+        text = normalize(part)
+        if len(text) <= size:
+            if text:
+                result.add(text)
+            continue
+        result.update(text[i:i + size] for i in range(len(text) - size + 1))
+    return result
+
+
+def _band_layout(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    (밴드 수, 밴드당 행 수) - S-곡선의 문턱 (1/b)^(1/r)이 threshold 이하인 것 중 가장 가까운 조합
+    (후보는 서명 유사도로 다시 거르므로 놓치는 쪽보다 후보가 조금 많은 쪽을 고름)
+    """
+    layouts = [(b, num_perm // b) for b in range(1, num_perm + 1) if num_perm % b == 0]
+    return max((layout for layout in layouts if (1 / layout[0]) ** (1 / layout[1]) <= threshold),
+               key=lambda layout: (1 / layout[0]) ** (1 / layout[1]), default=(num_perm, 1))
+
+
+class DuplicateIndex:
+    """MinHash 서명 + LSH 밴드 버킷 - 추가할 때마다 기존 문제와 유사 중복을 찾아 묶음"""
+
+    def __init__(self, threshold: float = THRESHOLD, num_perm: int = NUM_PERM,
+                 shingle_size: int = SHINGLE_SIZE, seed: int = 1):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.seed = seed
+        self.bands, self.rows = _band_layout(threshold, num_perm)
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, PRIME, size=num_perm, dtype=np.uint64)
+
+        self.keys: List[Key] = []
+        self._positions: Dict[Key, int] = {}
+        self._signatures: List[np.ndarray] = []       # 문제별 서명 (uint32, num_perm)
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(self.bands)]
+        self._parent: List[int] = []                  # union-find
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def signature(self, question: Question) -> np.ndarray:
+        """문제의 MinHash 서명 - h_i(x) = (a_i * x + b_i) mod PRIME의 shingle별 최솟값"""
+        hashes = np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingles(question, self.shingle_size)),
+                             dtype=np.uint64)
+        if not hashes.size:             # 해시 값은 PRIME 미만이므로 PRIME만으로 된 서명은 빈 문제 표시
+            return np.full(self.num_perm, PRIME, dtype=np.uint32)
+        values = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % MAX_HASH
+        return values.min(axis=1).astype(np.uint32)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        if signature[0] == PRIME:       # 글자가 없는 문제 - 어느 버킷에도 넣지 않아 아무것과도 묶이지 않음
+            return []
+        return [signature[band * self.rows:(band + 1) * self.rows].tobytes() for band in range(self.bands)]
+
+    def _candidates(self, band_keys: List[bytes]) -> set:
+        candidates = set()
+        for buckets, band_key in zip(self._buckets, band_keys):
+            candidates.update(buckets.get(band_key, ()))
+        return candidates
+
+    def query(self, question: Question) -> List[Tuple[Key, float]]:
+        """색인에 넣지 않고 유사 중복만 찾음 - [(키, 유사도)] 유사도 순"""
+        signature = self.signature(question)
+        return self._matches(signature, self._candidates(self._band_keys(signature)))
+
+    def _matches(self, signature: np.ndarray, candidates) -> List[Tuple[Key, float]]:
+        return [(self.keys[i], score) for i, score in self._scored(signature, candidates)]
+
+    def _scored(self, signature: np.ndarray, candidates) -> List[Tuple[int, float]]:
+        """후보 중 유사도가 기준 이상인 것 - [(위치, 유사도)] 유사도 순"""
+        if not candidates:
+            return []
+        ids = np.fromiter(candidates, dtype=np.int64)
+        stacked = np.stack([self._signatures[i] for i in ids])
+        scores = np.count_nonzero(stacked == signature, axis=1) / self.num_perm
+        keep = scores >= self.threshold
+        return sorted(zip(ids[keep].tolist(), scores[keep].tolist()), key=lambda m: (-m[1], m[0]))
+
+    def _neighbours(self, index: int) -> List[int]:
+        """index와 유사 중복인 다른 문제의 위치"""
+        signature = self._signatures[index]
+        return [i for i, _ in self._scored(signature, self._candidates(self._band_keys(signature)) - {index})]
+
+    def add(self, question: Question, key: Key) -> List[Tuple[Key, float]]:
+        """
+        문제 하나 추가 - 이미 있던 다른 문제 중 유사 중복 [(키, 유사도)]
+        같은 키가 이미 있으면 내용이 같을 때는 그대로 두고 [], 바뀌었으면 그 문제만 버킷을 옮기고
+        원래 속했던 묶음만 다시 만든다 (다른 묶음은 건드리지 않음).
+        """
+        key = tuple(key)
+        signature = self.signature(question)
+        position = self._positions.get(key)
+        if position is None:
+            return self._link(self._insert(signature, key, self._band_keys(signature)))
+        if np.array_equal(self._signatures[position], signature):
+            return []
+        return self._replace(position, signature)
+
+    def _link(self, index: int) -> List[Tuple[Key, float]]:
+        """앞서 들어온 문제 중 유사 중복과 묶음 - [(키, 유사도)]"""
+        signature = self._signatures[index]
+        candidates = {i for i in self._candidates(self._band_keys(signature)) if i < index}
+        matches = self._matches(signature, candidates)
+        for other, _ in matches:
+            self._union(index, self._positions[other])
+        return matches
+
+    def _replace(self, position: int, signature: np.ndarray) -> List[Tuple[Key, float]]:
+        """
+        이미 있는 문제의 서명 교체 - 그 문제의 밴드 키만 옮기고, 바뀌기 전 묶음의 문제들만
+        union-find를 풀어 다시 잇는다 (다른 묶음의 부모는 그 묶음 안만 가리키므로 그대로 둠)
+        """
+        stale, stack = {position}, [position]       # 바뀌기 전 묶음 = 유사 중복으로 이어진 문제들
+        while stack:
+            for other in self._neighbours(stack.pop()):
+                if other not in stale:
+                    stale.add(other)
+                    stack.append(other)
+
+        for buckets, band_key in zip(self._buckets, self._band_keys(self._signatures[position])):
+            bucket = buckets[band_key]
+            bucket.remove(position)
+            if not bucket:
+                del buckets[band_key]
+        self._signatures[position] = signature
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            buckets.setdefault(band_key, []).append(position)
+
+        for index in stale:
+            self._parent[index] = index
+        for index in stale:
+            for other in self._neighbours(index):
+                self._union(index, other)
+        return self._matches(signature, self._candidates(self._band_keys(signature)) - {position})
+
+    def _insert(self, signature: np.ndarray, key: Key, band_keys: List[bytes]) -> int:
+        """서명을 비교 없이 버킷에 넣음 - 새 위치"""
+        index = len(self.keys)
+        self.keys.append(key)
+        self._positions[key] = index
+        self._signatures.append(signature)
+        self._parent.append(index)
+        for buckets, band_key in zip(self._buckets, band_keys):
+            buckets.setdefault(band_key, []).append(index)
+        return index
+
+    def add_exam(self, questions: Iterable[Question], exam_info: Dict) -> List[Tuple[Key, Key, float]]:
+        """시험지 하나의 문제를 모두 추가 - 새로 찾은 유사 중복 쌍 [(새 문제, 기존 문제, 유사도)]"""
+        prefix = (exam_info.get('round'), exam_info.get('subject'), exam_info.get('type'))
+        pairs = []
+        for question in questions:
+            key = prefix + (question.number,)
+            pairs.extend((key, other, score) for other, score in self.add(question, key))
+        return pairs
+
+    def _find(self, i: int) -> int:
+        while self._parent[i] != i:
+            self._parent[i] = self._parent[self._parent[i]]
+            i = self._parent[i]
+        return i
+
+    def _union(self, first: int, second: int) -> None:
+        a, b = self._find(first), self._find(second)
+        if a != b:
+            self._parent[max(a, b)] = min(a, b)
+
+    def clusters(self) -> List[List[Key]]:
+        """유사 중복 묶음 (2개 이상) - 묶음 안은 추가 순서, 묶음은 첫 문제 순서"""
+        groups: Dict[int, List[Key]] = {}
+        for i, key in enumerate(self.keys):
+            groups.setdefault(self._find(i), []).append(key)
+        return [group for _, group in sorted(groups.items()) if len(group) > 1]
+
+    def save(self, path: str) -> None:
+        """서명/키/묶음을 .npz로 저장 (버킷은 불러올 때 서명으로 다시 만듦)"""
+        signatures = np.stack(self._signatures) if self._signatures else np.empty((0, self.num_perm), np.uint32)
+        settings = {'threshold': self.threshold, 'num_perm': self.num_perm,
+                    'shingle_size': self.shingle_size, 'seed': self.seed}
+        with open(path, 'wb') as f:
+            np.savez_compressed(f, signatures=signatures,
+                                parents=np.array([self._find(i) for i in range(len(self))], dtype=np.int64),
+                                keys=np.array(json.dumps(self.keys, ensure_ascii=False)),
+                                settings=np.array(json.dumps(settings)))
+
+    @classmethod
+    def load(cls, path: str) -> 'DuplicateIndex':
+        with np.load(path) as data:
+            index = cls(**json.loads(str(data['settings'])))
+            for signature, key in zip(data['signatures'], json.loads(str(data['keys']))):
+                index._insert(signature, tuple(key), index._band_keys(signature))
+            index._parent = data['parents'].tolist()
+        return index
+
+
+def main():
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description='회차/형별 간 유사 중복 문제 묶음')
+    arg_parser.add_argument('inputs', nargs='+', help='PDF/HWP/HWPX 문제지')
+    arg_parser.add_argument('--index', default=None, help='색인 파일 (.npz) - 있으면 이어서 추가하고 다시 저장')
+    arg_parser.add_argument('--threshold', type=float, default=THRESHOLD, help='유사도 기준 (새 색인만)')
+    args = arg_parser.parse_args()
+
+    from exam_pdf_parser_v2 import ExamPDFParser
+
+    index = (DuplicateIndex.load(args.index) if args.index and Path(args.index).exists()
+             else DuplicateIndex(threshold=args.threshold))
+    for path in args.inputs:
+        parser = ExamPDFParser(path)
+        questions = parser.parse_questions()         # exam_info()는 파싱한 뒤에 채워짐
+        pairs = index.add_exam(questions, parser.exam_info())
+        print(f"{Path(path).name}: 유사 중복 {len(pairs)}쌍 (색인 {len(index)}문제)")
+
+    for group in index.clusters():
+        print(' = '.join(f"{r}회 {s} {t} {n}번" for r, s, t, n in group))
+    if args.index:
+        index.save(args.index)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+파서 -> PythonParserBridge 바이너리 교환 형식 (MessagePack)
+
+JSON 대신 MessagePack으로, PythonParserBridge#transform_questions가 만들던
+Rails 형태의 레코드를 그대로 담아 보낸다. Ruby 쪽은 디코딩만 하면 되고
+변환 단계를 거치지 않는다.
+
+스키마 (SCHEMA_VERSION = 1):
+    {
+      "schema": "certigraph.exam_questions",
+      "version": 1,
+      "exam_info": {...to_json()의 exam_info...},
+      "questions": [
+        {"question_number": 1, "content": "...", "options": {"①": "...", ...},
+         "answer": "③" | "①,⑤" | null, "explanation": null, "passage": "○ ...\\nㄱ ..." | null,
+         "topic": "...", "difficulty": null, "has_table": false, "has_image": false,
+         "metadata": {"section": "...", "table": {...} | null,
+                      "passage_items": 2, "choices_count": 5,
+                      "figures": [{"page": 3, "bbox": [x0, top, x1, bottom], "kind": "image",
+                                   "path": "...png" | null}]}}     (figures는 그림이 있는 문제만)
+      ],
+      "metrics": {...}              (계측을 켠 경우만)
+    }
+
+answer는 파서에 정답표(answer_key)를 넘긴 경우에만 채워진다 (복수 정답은 쉼표로 연결).
+figures의 path는 파서에 figures_dir를 넘겨 잘라낸 PNG를 저장한 경우에만 채워진다.
+
+필드를 추가하는 변경은 같은 버전을 유지하고, 의미/타입이 바뀌면 SCHEMA_VERSION을 올린다.
+"""
+
+from typing import BinaryIO, Dict, List
+
+from exam_pdf_parser_v2 import ExamPDFParser, Question, CHOICE_SYMBOLS
+
+SCHEMA_NAME = 'certigraph.exam_questions'
+SCHEMA_VERSION = 1
+
+
+def _msgpack():
+    try:
+        import msgpack
+    except ImportError as e:
+        raise ImportError("MessagePack 출력에는 msgpack 패키지가 필요합니다 (pip install msgpack)") from e
+    return msgpack
+
+
+def rails_question(q: Question) -> Dict:
+    """Question -> PythonParserBridge#transform_questions와 같은 Rails 레코드"""
+    passage = '\n'.join(f"{p.marker} {p.text}" for p in q.passage) if q.passage else None
+
+    return {
+        'question_number': q.number,
+        'content': q.question,
+        'options': {CHOICE_SYMBOLS[c.number - 1]: c.text for c in q.choices},
+        'answer': None,
+        'explanation': None,
+        'passage': passage,
+        'topic': q.section,
+        'difficulty': None,
+        'has_table': q.table is not None,
+        'has_image': bool(q.figures),
+        'metadata': {
+            'section': q.section,
+            'table': q.table.to_dict() if q.table else None,
+            'passage_items': len(q.passage),
+            'choices_count': len(q.choices),
+            **({'figures': [f.to_dict() for f in q.figures]} if q.figures else {})
+        }
+    }
+
+
+def build_payload(parser: ExamPDFParser) -> Dict:
+    """파싱 결과 전체를 스키마 구조로"""
+    if not parser.questions:
+        parser.parse_questions()
+
+    with parser._stage('rails_records'):
+        questions: List[Dict] = [rails_question(q) for q in parser.questions]
+
+    info = parser.exam_info()
+    if parser.answer_key is not None:
+        from answer_key import join_answers
+        with parser._stage('join_answers'):
+            join_answers(questions, parser.answer_key.row(info), number_field='question_number', symbols=True)
+
+    payload = {
+        'schema': SCHEMA_NAME,
+        'version': SCHEMA_VERSION,
+        'exam_info': info,
+        'questions': questions
+    }
+    if parser.tracer:
+        payload['metrics'] = parser.tracer.to_dict()
+    return payload
+
+
+def encode_msgpack(parser: ExamPDFParser) -> bytes:
+    """파싱 결과를 MessagePack 바이트로"""
+    msgpack = _msgpack()
+    return msgpack.packb(build_payload(parser), use_bin_type=True)
+
+
+def write_msgpack(parser: ExamPDFParser, fp: BinaryIO) -> int:
+    """MessagePack으로 fp에 기록 - 기록한 바이트 수 반환"""
+    data = encode_msgpack(parser)
+    fp.write(data)
+    fp.flush()
+    return len(data)
+
+
+def decode_msgpack(data: bytes) -> Dict:
+    """MessagePack 페이로드 디코딩 - 스키마 이름/버전이 다르면 ValueError"""
+    msgpack = _msgpack()
+    payload = msgpack.unpackb(data, raw=False)
+
+    if not isinstance(payload, dict) or payload.get('schema') != SCHEMA_NAME:
+        raise ValueError("exam_questions 페이로드가 아닙니다")
+    if payload.get('version') != SCHEMA_VERSION:
+        raise ValueError(f"지원하지 않는 스키마 버전: {payload.get('version')} (지원: {SCHEMA_VERSION})")
+    return payload
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+토큰 수 기준 청크 분할
+
+EmbeddingService(Ruby)는 1토큰 ≈ 4글자로 잡고 512토큰 / 64토큰 겹침으로 자르지만,
+text-embedding-3-small의 cl100k_base에서 한글은 음절 하나가 대략 1토큰이라 청크가 상한을
+몇 배 넘는다. 여기서는 글자마다 토큰 비용을 NumPy로 한 번에 매기고 (tiktoken이 있으면
+tokenizer='tiktoken'으로 실제 토큰 시작 위치를 씀), 누적 합에서 searchsorted로 경계를 찾는다.
+청크 후반부에 문장 끝이 있으면 거기서 끊는다.
+
+    chunk_text(text, max_tokens=512, overlap=64)   # [Chunk(index, text, start, end, tokens)]
+    question_chunks(question)                      # 문제 하나 (대부분 청크 1개)
+"""
+
+import re
+import math
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from exam_pdf_parser_v2 import Question
+
+MAX_TOKENS = 512            # EmbeddingService::CHUNK_SIZE
+OVERLAP = 64                # EmbeddingService::CHUNK_OVERLAP
+TOKENIZERS = ('estimate', 'tiktoken')
+ENCODING = 'cl100k_base'    # text-embedding-3-small
+
+# 글자별 토큰 어림값 (cl100k_base 기준) - 공백은 다음 단어 토큰에 붙음
+HANGUL_COST = 1.0           # 한글 음절/자모
+ASCII_COST = 0.25           # 영문/숫자 - 4글자 ≈ 1토큰
+OTHER_COST = 1.0            # 문장부호, 원문자(①), 한자 등
+
+SENTENCE_END = re.compile(r'[.!?。]\s|\n')
+CIRCLES = ['', '①', '②', '③', '④', '⑤']
+
+
+@dataclass(slots=True)
+class Chunk:
+    """청크 - start/end는 원문 글자 위치, source는 문제 번호 등 출처"""
+    index: int
+    text: str
+    start: int
+    end: int
+    tokens: int
+    source: Optional[object] = None
+
+
+def _estimate_costs(text: str) -> np.ndarray:
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    hangul = ((codes >= 0xAC00) & (codes <= 0xD7A3)) | ((codes >= 0x1100) & (codes <= 0x11FF)) \
+        | ((codes >= 0x3130) & (codes <= 0x318F))
+    letters = codes | 0x20                                   # 영문 대문자 -> 소문자
+    ascii_word = (codes < 0x80) & (((codes >= 0x30) & (codes <= 0x39)) | ((letters >= 0x61) & (letters <= 0x7A)))
+    space = (codes == 0x20) | (codes == 0x09) | (codes == 0x0A) | (codes == 0x0D) | (codes == 0x3000)
+    return np.select([hangul, ascii_word, space], [HANGUL_COST, ASCII_COST, 0.0], OTHER_COST)
+
+
+def _tiktoken_costs(text: str) -> np.ndarray:
+    import tiktoken
+
+    encoding = tiktoken.get_encoding(ENCODING)
+    _, offsets = encoding.decode_with_offsets(encoding.encode(text))
+    return np.bincount(np.asarray(offsets, dtype=np.int64), minlength=len(text))[:len(text)].astype(np.float64)
+
+
+def token_costs(text: str, tokenizer: str = 'estimate') -> np.ndarray:
+    """글자별 토큰 수 (합이 텍스트 토큰 수) - 'tiktoken'은 각 토큰을 시작 글자에 1로 셈"""
+    if tokenizer not in TOKENIZERS:
+        raise ValueError(f"지원하지 않는 토크나이저: {tokenizer}")
+    if not text:
+        return np.zeros(0)
+    return _tiktoken_costs(text) if tokenizer == 'tiktoken' else _estimate_costs(text)
+
+
+def count_tokens(text: str, tokenizer: str = 'estimate') -> int:
+    return math.ceil(token_costs(text, tokenizer).sum())
+
+
+def chunk_text(text: str, max_tokens: int = MAX_TOKENS, overlap: int = OVERLAP,
+               tokenizer: str = 'estimate', source=None) -> List[Chunk]:
+    """
+    max_tokens 이하 청크로 분할 (이웃 청크는 약 overlap 토큰 겹침)
+    끝 경계 앞 후반부(max_tokens/2 이후)에 문장 끝이 있으면 그 뒤에서 끊는다.
+    """
+    if overlap >= max_tokens:
+        raise ValueError(f"overlap({overlap})은 max_tokens({max_tokens})보다 작아야 합니다")
+    costs = token_costs(text, tokenizer)
+    total = np.concatenate(([0.0], np.cumsum(costs)))        # total[i] = text[:i]의 토큰 수
+    sentence_ends = np.array([m.end() for m in SENTENCE_END.finditer(text)], dtype=np.int64)
+
+    chunks: List[Chunk] = []
+    start = 0
+    while start < len(text):
+        end = int(np.searchsorted(total, total[start] + max_tokens, side='right')) - 1
+        end = max(min(end, len(text)), start + 1)
+        if end < len(text):
+            half = int(np.searchsorted(total, total[start] + max_tokens / 2, side='left'))
+            inside = sentence_ends[(sentence_ends > half) & (sentence_ends <= end)]
+            if len(inside):
+                end = int(inside[-1])
+
+        piece = text[start:end]
+        stripped = piece.strip()
+        if stripped:
+            offset = start + len(piece) - len(piece.lstrip())
+            chunks.append(Chunk(index=len(chunks), text=stripped, start=offset, end=offset + len(stripped),
+                                tokens=math.ceil(total[end] - total[start]), source=source))
+        if end >= len(text):
+            break
+        # 다음 청크는 끝에서 overlap 토큰 앞에서 시작 (항상 앞으로 진행)
+        start = max(int(np.searchsorted(total, total[end] - overlap, side='left')), start + 1)
+    return chunks
+
+
+def question_text(question: Question) -> str:
+    """임베딩용 문제 텍스트 - 질문, 지문 항목, 보기 (to_markdown과 같은 표기)"""
+    lines = [question.question]
+    for item in question.passage:
+        lines.append(f"○ {item.text}" if item.marker == '○' else f"{item.marker}. {item.text}")
+    if question.table:
+        for row in [question.table.headers] + question.table.rows:
+            lines.append(' | '.join(cell or '' for cell in row))
+    lines.extend(f"{CIRCLES[c.number] if c.number < len(CIRCLES) else c.number} {c.text}"
+                 for c in question.choices)
+    return '\n'.join(line for line in lines if line)
+
+
+def question_chunks(question: Question, max_tokens: int = MAX_TOKENS, overlap: int = OVERLAP,
+                    tokenizer: str = 'estimate') -> List[Chunk]:
+    """문제 하나의 청크 (source = 문제 번호)"""
+    return chunk_text(question_text(question), max_tokens, overlap, tokenizer, source=question.number)
+
+
+def chunk_questions(questions: Iterable[Question], max_tokens: int = MAX_TOKENS, overlap: int = OVERLAP,
+                    tokenizer: str = 'estimate') -> List[Chunk]:
+    """여러 문제의 청크를 순서대로"""
+    return [chunk for question in questions for chunk in question_chunks(question, max_tokens, overlap, tokenizer)]
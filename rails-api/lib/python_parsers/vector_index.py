@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+문제 임베딩 로컬 근사 최근접 이웃(ANN) 색인
+
+scripts/legacy-python/gcp/4_setup_vertex_ai.py가 GCP에 만드는 Tree-AH 색인(1536차원,
+DOT_PRODUCT_DISTANCE)을 개발 환경과 CPU 배포에서 대신한다. IVF(k-means 목록)로 검색할
+목록을 줄이고, 벡터는 디스크의 .npy를 memmap으로 열어 후보 행만 읽는다. PQ를 켜면 목록 안
+후보를 바이트 코드로 점수 매긴 뒤 상위 후보만 원본 벡터로 다시 계산한다 (Tree-AH의 reorder).
+점수는 내적이며 클수록 가깝다.
+
+    index = VectorIndex('tmp/vector_index', dtype='float16', pq_subspaces=96)
+    index.build(ids, vectors)          # 일괄 구축 (IVF/PQ 학습 포함)
+    index.add(['q-101'], [vector])     # 같은 id가 있으면 교체
+    index.delete(['q-7'])
+    index.search(queries, k=10)        # [[('q-3', 0.91), ...], ...] 질의 순서대로
+
+CLI:
+    python3 vector_index.py build vectors.npy ids.json --index tmp/vector_index [--pq 96]
+    python3 vector_index.py search queries.npy --index tmp/vector_index -k 10
+    python3 vector_index.py stats --index tmp/vector_index
+"""
+
+import os
+import sys
+import json
+import math
+import argparse
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_INDEX_DIR = os.environ.get('VECTOR_INDEX_DIR', str(Path.home() / '.cache' / 'vector_index'))
+
+DIMENSIONS = 1536             # OpenAI text-embedding-3-small (4_setup_vertex_ai.py와 같음)
+NEIGHBORS = 10                # approximate_neighbors_count
+SEARCH_PERCENT = 10           # leaf_nodes_to_search_percent - 질의마다 살펴볼 IVF 목록 비율(%)
+RERANK_FACTOR = 10            # PQ 점수 상위 k*RERANK_FACTOR개를 원본 벡터로 다시 계산
+PQ_CENTROIDS = 256            # 부분공간별 중심 수 (코드 1바이트)
+KMEANS_ITERATIONS = 10
+TRAIN_SAMPLE = 50_000         # 학습에 쓰는 최대 행 수
+INITIAL_CAPACITY = 1024
+CHUNK_ROWS = 8192             # 가까운 중심을 찾을 때 한 번에 처리할 행 수
+DTYPES = ('float32', 'float16')
+DELETED = -1
+
+
+def _nearest(data: np.ndarray, centroids: np.ndarray, count: int = 1) -> np.ndarray:
+    """행마다 L2로 가장 가까운 중심 번호 (count > 1이면 가까운 순 (행, count))"""
+    norms = np.einsum('ij,ij->i', centroids, centroids)
+    result = []
+    for start in range(0, len(data), CHUNK_ROWS):
+        distances = norms - 2.0 * (data[start:start + CHUNK_ROWS] @ centroids.T)
+        if count == 1:
+            result.append(distances.argmin(axis=1))
+            continue
+        top = np.argpartition(distances, count - 1, axis=1)[:, :count]
+        order = np.take_along_axis(distances, top, axis=1).argsort(axis=1)
+        result.append(np.take_along_axis(top, order, axis=1))
+    return np.concatenate(result) if result else np.empty((0,) if count == 1 else (0, count), np.int64)
+
+
+def _kmeans(data: np.ndarray, k: int, iterations: int, rng: np.random.Generator) -> np.ndarray:
+    """Lloyd k-means - 빈 군집은 이전 중심을 유지"""
+    centroids = data[rng.choice(len(data), size=k, replace=False)].copy()
+    for _ in range(iterations):
+        labels = _nearest(data, centroids)
+        counts = np.bincount(labels, minlength=k)
+        filled = np.nonzero(counts)[0]
+        starts = (np.cumsum(counts) - counts)[filled]
+        sums = np.add.reduceat(data[np.argsort(labels, kind='stable')], starts, axis=0)
+        centroids[filled] = sums / counts[filled, None]
+    return centroids
+
+
+def _top(rows: np.ndarray, scores: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """점수 상위 k개 (점수 내림차순)"""
+    if len(scores) > k:
+        keep = np.argpartition(-scores, k - 1)[:k]
+        rows, scores = rows[keep], scores[keep]
+    order = np.argsort(-scores, kind='stable')
+    return rows[order], scores[order]
+
+
+def _open_column(path: Path, shape: Tuple, dtype) -> np.memmap:
+    if path.exists():
+        return np.load(path, mmap_mode='r+')
+    return np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=shape)
+
+
+def _grow_column(path: Path, column: np.memmap, rows: int) -> np.memmap:
+    """rows행 이상 담도록 용량을 두 배씩 늘린 파일로 교체"""
+    capacity = max(rows, 2 * len(column), INITIAL_CAPACITY)
+    temp = path.with_name(path.stem + '.tmp.npy')
+    grown = np.lib.format.open_memmap(temp, mode='w+', dtype=column.dtype, shape=(capacity,) + column.shape[1:])
+    for start in range(0, len(column), CHUNK_ROWS):
+        chunk = column[start:start + CHUNK_ROWS]
+        grown[start:start + len(chunk)] = chunk
+    grown.flush()
+    del grown
+    os.replace(temp, path)
+    return np.load(path, mmap_mode='r+')
+
+
+class VectorIndex:
+    """
+    IVF(+PQ) 내적 색인 - 디렉터리 하나에 memmap 벡터와 목록/코드/학습 결과를 저장
+
+    이미 만든 디렉터리를 열면 저장된 설정(dim, dtype, pq_subspaces)을 쓴다. 학습 전에는
+    모든 행을 원본 벡터로 비교(정확 검색)하고, build()나 train() 뒤에는 IVF 목록
+    SEARCH_PERCENT%만 살펴본다. 추가/삭제 후에는 메타데이터를 바로 디스크에 쓴다.
+    """
+
+    def __init__(self, path: str = DEFAULT_INDEX_DIR, dim: int = DIMENSIONS, dtype: str = 'float32',
+                 pq_subspaces: int = 0, search_percent: float = SEARCH_PERCENT, seed: int = 0):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        meta_path = self.path / 'meta.json'
+        meta = json.loads(meta_path.read_text(encoding='utf-8')) if meta_path.exists() else {}
+
+        self.dim = meta.get('dim', dim)
+        self.dtype = meta.get('dtype', dtype)
+        self.pq_subspaces = meta.get('pq_subspaces', pq_subspaces)
+        self.search_percent = search_percent
+        self.seed = seed
+        if self.dtype not in DTYPES:
+            raise ValueError(f"dtype은 {DTYPES} 중 하나여야 합니다: {self.dtype}")
+        if self.pq_subspaces and self.dim % self.pq_subspaces:
+            raise ValueError(f"pq_subspaces({self.pq_subspaces})가 차원({self.dim})을 나누지 않습니다")
+
+        self._count = meta.get('count', 0)
+        self._vectors = _open_column(self.path / 'vectors.npy', (INITIAL_CAPACITY, self.dim), self.dtype)
+        self._lists = _open_column(self.path / 'lists.npy', (INITIAL_CAPACITY,), np.int32)
+        self._codes = (_open_column(self.path / 'codes.npy', (INITIAL_CAPACITY, self.pq_subspaces), np.uint8)
+                       if self.pq_subspaces else None)
+        self.centroids = self._load_array('centroids.npy')
+        self.codebooks = self._load_array('codebooks.npy')
+
+        ids_path = self.path / 'ids.json'
+        self._ids: List = json.loads(ids_path.read_text(encoding='utf-8')) if ids_path.exists() else []
+        self._rows: Dict = {key: row for row, key in enumerate(self._ids) if key is not None}
+        self._members: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def _load_array(self, name: str) -> Optional[np.ndarray]:
+        path = self.path / name
+        return np.load(path) if path.exists() else None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key) -> bool:
+        return key in self._rows
+
+    @property
+    def trained(self) -> bool:
+        return self.centroids is not None
+
+    def _as_matrix(self, vectors) -> np.ndarray:
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim == 1:
+            matrix = matrix[None, :]
+        if matrix.ndim != 2 or matrix.shape[1] != self.dim:
+            raise ValueError(f"벡터 차원이 {self.dim}이 아닙니다: {matrix.shape}")
+        return matrix
+
+    # ---- 쓰기 ----
+
+    def build(self, ids: Sequence, vectors, nlist: Optional[int] = None) -> None:
+        """기존 내용을 지우고 일괄 구축 - 벡터를 쓴 뒤 IVF/PQ를 학습해 모든 행을 배정"""
+        matrix = self._as_matrix(vectors)
+        self._check_ids(ids, matrix)
+        self._count = 0
+        self._ids, self._rows = [], {}
+        self.centroids = self.codebooks = None
+        self._append(ids, matrix)
+        self.train(nlist)
+
+    def add(self, ids: Sequence, vectors) -> None:
+        """행 추가 (증분) - 이미 있는 id는 이전 행을 지우고 새로 넣음. 학습돼 있으면 기존 중심에 배정"""
+        matrix = self._as_matrix(vectors)
+        self._check_ids(ids, matrix)
+        self._tombstone(ids)
+        start = self._count
+        self._append(ids, matrix)
+        self._assign(np.arange(start, self._count), matrix)
+        self.flush()
+
+    def delete(self, ids: Iterable) -> int:
+        """행 삭제 (목록에서 빼고 id만 지움, 공간은 build()/compact()에서 회수) - 지운 수"""
+        deleted = self._tombstone(ids)
+        self.flush()
+        return deleted
+
+    def _tombstone(self, ids: Iterable) -> int:
+        deleted = 0
+        for key in list(ids):
+            row = self._rows.pop(key, None)
+            if row is None:
+                continue
+            self._lists[row] = DELETED
+            self._ids[row] = None
+            deleted += 1
+        self._members = None
+        return deleted
+
+    @staticmethod
+    def _check_ids(ids: Sequence, matrix: np.ndarray) -> None:
+        if len(ids) != len(matrix):
+            raise ValueError(f"id {len(ids)}개와 벡터 {len(matrix)}개의 수가 다릅니다")
+        if len(set(ids)) != len(ids):
+            raise ValueError("한 번에 추가하는 id가 중복됩니다")
+
+    def _append(self, ids: Sequence, matrix: np.ndarray) -> None:
+        end = self._count + len(matrix)
+        if end > len(self._vectors):
+            self._vectors = _grow_column(self.path / 'vectors.npy', self._vectors, end)
+            self._lists = _grow_column(self.path / 'lists.npy', self._lists, end)
+            if self._codes is not None:
+                self._codes = _grow_column(self.path / 'codes.npy', self._codes, end)
+        self._vectors[self._count:end] = matrix.astype(self.dtype)
+        self._lists[self._count:end] = 0
+        for row, key in enumerate(ids, self._count):
+            self._ids.append(key)
+            self._rows[key] = row
+        self._count = end
+        self._members = None
+
+    def _assign(self, rows: np.ndarray, matrix: np.ndarray) -> None:
+        """행을 IVF 목록과 PQ 코드에 배정 (학습 전이면 목록 0 하나)"""
+        if self.centroids is not None:
+            self._lists[rows] = _nearest(matrix, self.centroids)
+        if self.codebooks is not None:
+            self._codes[rows] = self._encode(self._residuals(matrix, np.asarray(self._lists[rows])))
+        self._members = None
+
+    def _residuals(self, matrix: np.ndarray, lists: np.ndarray) -> np.ndarray:
+        """PQ는 IVF 중심과의 차이를 부호화 (내적 = q·중심 + q·차이)"""
+        return matrix - self.centroids[lists] if self.centroids is not None else matrix
+
+    def _encode(self, residuals: np.ndarray) -> np.ndarray:
+        sub = residuals.reshape(len(residuals), self.pq_subspaces, -1)
+        return np.stack([_nearest(sub[:, j], self.codebooks[j]) for j in range(self.pq_subspaces)],
+                        axis=1).astype(np.uint8)
+
+    def train(self, nlist: Optional[int] = None, iterations: int = KMEANS_ITERATIONS) -> None:
+        """
+        남은 행으로 IVF 중심(기본 √n개)과 PQ 코드북을 학습하고 모든 행을 다시 배정
+        행이 적어 목록이 2개 미만이면 IVF 없이 정확 검색을 유지한다.
+        """
+        live = self._live_rows()
+        rng = np.random.default_rng(self.seed)
+        sample_rows = np.sort(rng.choice(live, size=min(len(live), TRAIN_SAMPLE), replace=False))
+        sample = np.asarray(self._vectors[sample_rows], dtype=np.float32)
+
+        nlist = min(nlist or int(math.sqrt(len(live))), len(sample))
+        self.centroids = _kmeans(sample, nlist, iterations, rng) if nlist >= 2 else None
+        if self.pq_subspaces and len(sample):
+            lists = _nearest(sample, self.centroids) if self.trained else None
+            sub = self._residuals(sample, lists).reshape(len(sample), self.pq_subspaces, -1)
+            k = min(PQ_CENTROIDS, len(sample))
+            self.codebooks = np.stack([_kmeans(np.ascontiguousarray(sub[:, j]), k, iterations, rng)
+                                       for j in range(self.pq_subspaces)])
+
+        for start in range(0, len(live), CHUNK_ROWS):
+            rows = live[start:start + CHUNK_ROWS]
+            self._assign(rows, np.asarray(self._vectors[rows], dtype=np.float32))
+        self.flush()
+
+    def compact(self) -> None:
+        """삭제된 행을 빼고 같은 학습 결과로 다시 씀"""
+        live = self._live_rows()
+        ids = [self._ids[row] for row in live]
+        matrix = np.asarray(self._vectors[live], dtype=np.float32)
+        lists = np.asarray(self._lists[live])
+        codes = np.asarray(self._codes[live]) if self._codes is not None else None
+
+        self._count = 0
+        self._ids, self._rows = [], {}
+        self._append(ids, matrix)
+        self._lists[:len(live)] = lists
+        if codes is not None:
+            self._codes[:len(live)] = codes
+        self.flush()
+
+    def flush(self) -> None:
+        """memmap과 메타데이터(id, 학습 결과)를 디스크에 씀 (임시 파일 후 교체)"""
+        for column in (self._vectors, self._lists, self._codes):
+            if column is not None:
+                column.flush()
+        for name, array in (('centroids.npy', self.centroids), ('codebooks.npy', self.codebooks)):
+            if array is not None:
+                np.save(self.path / name, array)
+            else:
+                (self.path / name).unlink(missing_ok=True)
+        meta = {'dim': self.dim, 'dtype': self.dtype, 'pq_subspaces': self.pq_subspaces, 'count': self._count,
+                'nlist': len(self.centroids) if self.trained else 0}
+        for name, data in (('ids.json', self._ids), ('meta.json', meta)):
+            temp = self.path / f"{name}.tmp"
+            temp.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+            os.replace(temp, self.path / name)
+
+    # ---- 검색 ----
+
+    def _live_rows(self) -> np.ndarray:
+        return np.nonzero(np.asarray(self._lists[:self._count]) != DELETED)[0]
+
+    def _list_members(self, list_id: int) -> np.ndarray:
+        """IVF 목록의 행 번호 (오름차순) - 목록 번호로 정렬한 색인을 한 번 만들어 재사용"""
+        if self._members is None:
+            lists = np.asarray(self._lists[:self._count])
+            order = np.argsort(lists, kind='stable')
+            bounds = np.searchsorted(lists[order], np.arange(len(self.centroids) + 1 if self.trained else 2))
+            self._members = (order, bounds)
+        order, bounds = self._members
+        return order[bounds[list_id]:bounds[list_id + 1]]
+
+    def _exact_scores(self, rows: np.ndarray, queries: np.ndarray) -> np.ndarray:
+        """(행, 질의) 내적 - 후보 행만 memmap에서 읽음"""
+        return np.asarray(self._vectors[rows], dtype=np.float32) @ queries.T
+
+    def search(self, queries, k: int = NEIGHBORS, search_percent: Optional[float] = None,
+               rerank: bool = True) -> List[List[Tuple[object, float]]]:
+        """
+        질의 여러 개의 top-k [(id, 내적)] - 질의마다 가까운 IVF 목록을 고르고, 같은 목록을 고른
+        질의끼리 한 번의 행렬곱으로 점수를 구한다. PQ가 있으면 코드 점수로 좁힌 뒤
+        rerank=True면 상위 k*RERANK_FACTOR개를 원본 벡터로 다시 계산한다.
+        """
+        matrix = self._as_matrix(queries)
+        if self.trained:
+            nprobe = max(1, math.ceil(len(self.centroids) * (search_percent or self.search_percent) / 100))
+            probes = _nearest(matrix, self.centroids, count=min(nprobe, len(self.centroids)))
+            probes = probes.reshape(len(matrix), -1)
+        else:
+            probes = np.zeros((len(matrix), 1), dtype=np.int64)
+        tables = self._lookup_tables(matrix) if self.codebooks is not None else None
+
+        found_rows = [[] for _ in matrix]
+        found_scores = [[] for _ in matrix]
+        for list_id in np.unique(probes):
+            rows = self._list_members(int(list_id))
+            if not len(rows):
+                continue
+            asking = np.nonzero((probes == list_id).any(axis=1))[0]
+            if tables is None:
+                scores = self._exact_scores(rows, matrix[asking])
+            else:
+                codes = np.asarray(self._codes[rows])
+                scores = tables[asking][:, np.arange(self.pq_subspaces), codes].sum(axis=-1).T
+                if self.trained:
+                    scores += matrix[asking] @ self.centroids[list_id]
+            for column, query in enumerate(asking):
+                found_rows[query].append(rows)
+                found_scores[query].append(scores[:, column])
+
+        results = []
+        for query, (rows, scores) in enumerate(zip(found_rows, found_scores)):
+            if not rows:
+                results.append([])
+                continue
+            rows, scores = np.concatenate(rows), np.concatenate(scores)
+            if tables is not None and rerank:
+                rows, _ = _top(rows, scores, k * RERANK_FACTOR)
+                rows = np.sort(rows)
+                scores = self._exact_scores(rows, matrix[query:query + 1])[:, 0]
+            rows, scores = _top(rows, scores, k)
+            results.append([(self._ids[row], float(score)) for row, score in zip(rows, scores)])
+        return results
+
+    def _lookup_tables(self, matrix: np.ndarray) -> np.ndarray:
+        """PQ 내적 표 (질의, 부분공간, 중심) - 코드 점수는 부분공간별 표 값의 합"""
+        sub = matrix.reshape(len(matrix), self.pq_subspaces, -1)
+        return np.einsum('qmd,mkd->qmk', sub, self.codebooks)
+
+    def stats(self) -> Dict:
+        return {'path': str(self.path), 'vectors': len(self), 'rows': self._count, 'dim': self.dim,
+                'dtype': self.dtype, 'nlist': len(self.centroids) if self.trained else 0,
+                'pq_subspaces': self.pq_subspaces,
+                'bytes': sum(p.stat().st_size for p in self.path.iterdir() if p.is_file())}
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='문제 임베딩 로컬 ANN 색인 (Vertex AI 색인 대체)')
+    arg_parser.add_argument('--index', default=DEFAULT_INDEX_DIR, help='색인 디렉터리')
+    sub = arg_parser.add_subparsers(dest='command', required=True)
+
+    build = sub.add_parser('build', help='.npy 벡터와 JSON id 목록으로 일괄 구축')
+    build.add_argument('vectors', help='(n, dim) .npy')
+    build.add_argument('ids', help='id 목록 JSON')
+    build.add_argument('--dtype', choices=DTYPES, default='float32', help='저장 자료형')
+    build.add_argument('--pq', type=int, default=0, help='PQ 부분공간 수 (0이면 PQ 없음)')
+    build.add_argument('--nlist', type=int, default=None, help='IVF 목록 수 (기본 √n)')
+
+    search = sub.add_parser('search', help='.npy 질의의 top-k')
+    search.add_argument('queries', help='(q, dim) .npy')
+    search.add_argument('-k', type=int, default=NEIGHBORS)
+    search.add_argument('--percent', type=float, default=SEARCH_PERCENT, help='살펴볼 IVF 목록 비율(%%)')
+
+    sub.add_parser('stats', help='색인 정보')
+    args = arg_parser.parse_args()
+
+    if args.command == 'build':
+        vectors = np.load(args.vectors, mmap_mode='r')
+        with open(args.ids, 'r', encoding='utf-8') as f:
+            ids = json.load(f)
+        index = VectorIndex(args.index, dim=vectors.shape[1], dtype=args.dtype, pq_subspaces=args.pq)
+        index.build(ids, vectors, nlist=args.nlist)
+        print(json.dumps(index.stats(), ensure_ascii=False, indent=2))
+    elif args.command == 'search':
+        index = VectorIndex(args.index)
+        results = index.search(np.load(args.queries), k=args.k, search_percent=args.percent)
+        print(json.dumps([[{'id': key, 'score': score} for key, score in found] for found in results],
+                         ensure_ascii=False, indent=2))
+    else:
+        print(json.dumps(VectorIndex(args.index).stats(), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
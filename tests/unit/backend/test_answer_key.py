@@ -0,0 +1,99 @@
+"""
+P2 Group: Backend Service Tests - Answer Key Parsing and Join
+Test IDs: BE-UNIT-086 to BE-UNIT-088
+
+Run with: pytest tests/unit/backend/test_answer_key.py -n auto
+"""
+
+import io
+import sys
+import json
+import pytest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+PARSER_DIR = ROOT / "rails-api" / "lib" / "python_parsers"
+sys.path.insert(0, str(PARSER_DIR))
+
+pytest.importorskip("pdfplumber")
+pytest.importorskip("numpy")
+
+from answer_key import AnswerKey, join_answers, parse_answer_pdf  # noqa: E402
+from exam_pdf_parser_v2 import ExamPDFParser  # noqa: E402
+
+SAMPLE_DIR = ROOT / "sample-data"
+ANSWER_PDF_19 = SAMPLE_DIR / "2021년 제19회 사회복지사 1급 국가자격시험 최종정답 (1).pdf"
+ANSWER_PDF_21 = SAMPLE_DIR / "2023년 제21회 사회복지사 1급 최종정답.pdf"
+SAMPLE_PDF = SAMPLE_DIR / "제19회 사회복지사 1급_1교시_B형.pdf"
+
+
+class TestAnswerKey:
+    """Tests for reading answer grids and joining them onto questions"""
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not (ANSWER_PDF_19.exists() and ANSWER_PDF_21.exists()),
+                        reason="sample-data answer PDFs not available")
+    def test_be_unit_086_read_answer_grid_images(self):
+        """BE-UNIT-086: Every session/type grid is read, including multiple accepted answers"""
+        key = parse_answer_pdf(str(ANSWER_PDF_21))
+        assert sorted(key.rows) == [(21, "1교시", "A형"), (21, "2교시", "A형"), (21, "3교시", "A형")]
+        first = [join_answers([{"number": n}], key.rows[(21, "1교시", "A형")]) for n in (1, 50, 51)]
+        assert first == [1, 1, 0]
+        records = [{"number": n} for n in range(1, 11)]
+        join_answers(records, key.row({"round": 21, "subject": "1교시", "type": "A형"}))
+        assert [r["answer"] for r in records] == [[1], [5], [5], [4], [5], [3], [2], [4], [2], [4]]
+
+        key19 = parse_answer_pdf(str(ANSWER_PDF_19))
+        assert len(key19) == 6
+        row = key19.rows[(19, "1교시", "B형")]
+        assert len(row) == 50
+        records = [{"number": n} for n in (18, 19, 20)]
+        join_answers(records, row)
+        assert [r["answer"] for r in records] == [[1, 2, 3, 4, 5], [1, 2, 3, 4, 5], [1, 5]]
+
+    @pytest.mark.unit
+    def test_be_unit_087_answer_key_round_trip_and_join(self, tmp_path):
+        """BE-UNIT-087: The compact table round-trips through JSON and joins in one pass"""
+        key = AnswerKey()
+        key.add(19, "3교시", "A형", [[2], [1, 5], [], [4]])
+        path = tmp_path / "answers.json"
+        key.save(str(path))
+
+        loaded = AnswerKey.load(str(path))
+        assert loaded.rows == key.rows
+        assert loaded.fingerprint == key.fingerprint
+        assert json.loads(path.read_text(encoding="utf-8"))["keys"][0]["answers"] == "2 1,5 0 4"
+
+        info = {"round": 19, "subject": "3교시", "type": "A형"}
+        records = [{"question_number": n} for n in (4, 1, 2, 3, 9)]
+        joined = join_answers(records, loaded.row(info), number_field="question_number", symbols=True)
+        assert joined == 3
+        assert [r["answer"] for r in records] == ["④", "②", "①,⑤", None, None]
+        assert loaded.row({"round": 20, "subject": "3교시", "type": "A형"}) is None
+        with pytest.raises(ValueError):
+            key.add(19, "1교시", "A형", [[6]])
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not SAMPLE_PDF.exists(), reason="sample-data PDF not available")
+    def test_be_unit_088_parser_outputs_joined_answers(self):
+        """BE-UNIT-088: JSON, NDJSON and MessagePack records carry the joined answers"""
+        key = AnswerKey()
+        key.add(19, "1교시", "B형", [[n % 5 + 1] for n in range(50)])
+
+        plain = ExamPDFParser(str(SAMPLE_PDF)).to_dict()
+        assert "answer" not in plain["questions"][0]
+
+        parser = ExamPDFParser(str(SAMPLE_PDF), answer_key=key)
+        data = parser.to_dict()
+        assert [q["answer"] for q in data["questions"][:3]] == [[1], [2], [3]]
+        assert parser.config_fingerprint()["answers"] == key.fingerprint
+
+        buffer = io.StringIO()
+        ExamPDFParser(str(SAMPLE_PDF), answer_key=key).write_ndjson(buffer)
+        streamed = [json.loads(line)["question"] for line in buffer.getvalue().splitlines()[1:-1]]
+        assert streamed == data["questions"]
+
+        pytest.importorskip("msgpack")
+        from rails_interchange import build_payload
+        records = build_payload(parser)["questions"]
+        assert [r["answer"] for r in records[:3]] == ["①", "②", "③"]
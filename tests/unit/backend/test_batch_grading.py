@@ -0,0 +1,95 @@
+"""
+P2 Group: Backend Service Tests - Batch Grading
+Test IDs: BE-UNIT-112 to BE-UNIT-114
+
+Run with: pytest tests/unit/backend/test_batch_grading.py -n auto
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+PARSER_DIR = ROOT / "rails-api" / "lib" / "python_parsers"
+sys.path.insert(0, str(PARSER_DIR))
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("pdfplumber")
+
+from answer_key import AnswerKey, answer_mask  # noqa: E402
+from batch_grading import BatchGrader, CutoffRule  # noqa: E402
+
+S3_SECTIONS = [(1, 25, "사회복지정책과 제도(사회복지정책론)"), (26, 50, "사회복지정책과 제도(사회복지행정론)"),
+               (51, 75, "사회복지정책과 제도(사회복지법제론)")]
+
+
+class TestBatchGrading:
+    """Tests for grading answer matrices against answer-key bitmasks"""
+
+    @pytest.mark.unit
+    def test_be_unit_112_matches_per_record_grading(self):
+        """BE-UNIT-112: Vectorized counts and scores match grading each answer one at a time"""
+        rng = np.random.default_rng(7)
+        keys = [[int(n)] for n in rng.integers(1, 6, 75)]
+        keys[3] = [1, 5]                                    # 복수 정답
+        grader = BatchGrader(bytes(answer_mask(k) for k in keys), S3_SECTIONS)
+        answers = rng.integers(0, 6, (200, 75))
+
+        result = grader.grade(answers)
+        for i, row in enumerate(answers):
+            correct = sum(1 for a, k in zip(row, keys) if a in k)
+            unanswered = sum(1 for a in row if a == 0)
+            assert result.correct[i] == correct and result.unanswered[i] == unanswered
+            assert result.wrong[i] == 75 - correct - unanswered
+            assert result.scores[i] == round(correct / 75 * 100 + 1e-9, 2)
+        assert grader.grade([[1] + [0] * 74]).correct[0] == int(keys[0] == [1])
+
+        empty = BatchGrader(b"\0" * 3)
+        assert empty.grade([[1, 2, 3]]).scores[0] == 0      # 채점할 문제 없음
+
+    @pytest.mark.unit
+    def test_be_unit_113_section_scores_and_cutoff(self):
+        """BE-UNIT-113: Section subscores follow the profile and the cut-off fails a low subject"""
+        key = AnswerKey()
+        key.add(19, "1교시", "A형", [[1]] * 50)
+        key.add(19, "3교시", "A형", [[2]] * 75)
+        grader = BatchGrader.from_answer_key(key, [{"round": 19, "subject": s, "type": "A형"}
+                                                   for s in ("1교시", "3교시")])
+        assert grader.sections[-3:] == [name for _, _, name in S3_SECTIONS]
+        assert grader.subjects == ["사회복지기초", "사회복지정책과 제도"]
+
+        strong = [1] * 50 + [2] * 75
+        weak_subject = [1] * 50 + [2] * 25 + [2] * 3 + [0] * 22 + [2] * 2 + [0] * 23   # 3교시 30/75 = 40%
+        failed_subject = [1] * 50 + [2] * 29 + [0] * 46                               # 3교시 29/75
+        result = grader.grade([strong, weak_subject, failed_subject])
+
+        assert result.section_scores[1, -3:].tolist() == [100.0, 12.0, 8.0]
+        assert result.subject_scores[:, 1].tolist() == [100.0, 40.0, 38.67]
+        assert result.passed.tolist() == [True, True, False]
+        alone = BatchGrader.from_answer_key(key, [{"round": 19, "subject": "3교시", "type": "A형"}],
+                                            cutoff=CutoffRule(total=60.0, subject=0.0))
+        assert not alone.grade(weak_subject[50:]).passed[0]                            # 3교시만: 40% < 60%
+
+        record = result.to_records(["a", "b", "c"])[2]
+        assert record["id"] == "c" and record["passed"] is False and record["correct_count"] == 79
+        assert record["section_stats"]["사회복지정책과 제도(사회복지행정론)"] == {"correct": 4, "accuracy": 16.0}
+
+        with pytest.raises(ValueError):
+            BatchGrader.from_answer_key(key, [{"round": 20, "subject": "1교시", "type": "A형"}])
+
+    @pytest.mark.unit
+    def test_be_unit_114_p_values_and_answer_validation(self):
+        """BE-UNIT-114: p-values are per-question proportions correct; ungraded keys and bad answers are handled"""
+        grader = BatchGrader([1, 2, 4, 0])                 # 4번: 정답 없음 -> 채점 제외
+        result = grader.grade([[1, 2, 3, 1], [1, 3, 3, 2], [2, 0, 3, 0], [1, 2, 1, 0]])
+
+        assert result.p_values[:3].tolist() == [0.75, 0.5, 0.75] and np.isnan(result.p_values[3])
+        assert result.scores.tolist() == [100.0, 66.67, 33.33, 66.67]
+        assert result.unanswered.tolist() == [0, 0, 1, 0] and result.wrong.tolist() == [0, 1, 1, 1]
+        assert result.item_stats()[3] == {"number": 4, "p_value": None}
+
+        for bad in ([[1, 2, 6, 0]], [[1, -1, 3, 0]], [[1, 2, 3]], [[1.5, 2, 3, 0]]):
+            with pytest.raises(ValueError):
+                grader.grade(bad)
+        with pytest.raises(ValueError):
+            BatchGrader([1, 2], sections=[(1, 3, "범위 밖")])
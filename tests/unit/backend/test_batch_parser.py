@@ -0,0 +1,100 @@
+"""
+P2 Group: Backend Service Tests - Batch Parsing
+Test IDs: BE-UNIT-117 to BE-UNIT-120
+
+Run with: pytest tests/unit/backend/test_batch_parser.py -n auto
+"""
+
+import sys
+import json
+import shutil
+import pytest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+PARSER_DIR = ROOT / "rails-api" / "lib" / "python_parsers"
+sys.path.insert(0, str(PARSER_DIR))
+
+pytest.importorskip("pdfplumber")
+
+from batch_parser import _output_stems, collect_inputs, run_batch  # noqa: E402
+from exam_pdf_parser_v2 import DOCUMENT_SUFFIXES  # noqa: E402
+
+DUMMY_PDF = ROOT / "sample-data" / "dummy_test.pdf"
+
+
+def quiet(*_):
+    pass
+
+
+class TestBatchParser:
+    """Tests for collecting inputs, the manifest and --resume"""
+
+    @pytest.mark.unit
+    def test_be_unit_117_collect_inputs(self, tmp_path):
+        """BE-UNIT-117: Files, directories and globs resolve to unique document paths in order"""
+        for name in ["b.pdf", "a.PDF", "c.hwp", "notes.txt"]:
+            (tmp_path / name).write_bytes(b"")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "d.pdf").write_bytes(b"")
+
+        assert collect_inputs([str(tmp_path)]) == [tmp_path / "a.PDF", tmp_path / "b.pdf"]
+        assert collect_inputs([str(tmp_path)], DOCUMENT_SUFFIXES) == [
+            tmp_path / "a.PDF", tmp_path / "b.pdf", tmp_path / "c.hwp"]
+        assert collect_inputs([str(tmp_path / "b.pdf"), str(tmp_path / "**" / "*.pdf")]) == [
+            tmp_path / "b.pdf", tmp_path / "sub" / "d.pdf"]
+        assert collect_inputs([str(tmp_path / "notes.txt"), str(tmp_path / "missing.pdf")]) == []
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not DUMMY_PDF.exists(), reason="sample-data PDF not available")
+    def test_be_unit_118_resume_skips_only_same_hash_and_options(self, tmp_path):
+        """BE-UNIT-118: --resume skips a finished file unless its content or parser options changed"""
+        inputs = tmp_path / "in"
+        inputs.mkdir()
+        shutil.copy(DUMMY_PDF, inputs / "exam.pdf")
+        out = str(tmp_path / "out")
+
+        first = run_batch([str(inputs)], out, workers=1, progress=quiet)
+        record = first["files"][str(inputs / "exam.pdf")]
+        assert record["status"] == "ok" and record["config"]["layout"] == "text"
+        assert sorted(p.name for p in Path(out).iterdir()) == ["exam.csv", "exam.json", "exam.md", "manifest.json"]
+
+        again = run_batch([str(inputs)], out, workers=1, resume=True, progress=quiet)
+        assert again["summary"]["skipped"] == 1 and again["summary"]["processed"] == 0
+
+        columns = run_batch([str(inputs)], out, workers=1, resume=True, options={"layout": "columns"}, progress=quiet)
+        assert columns["summary"]["processed"] == 1
+        assert columns["files"][str(inputs / "exam.pdf")]["config"]["layout"] == "columns"
+
+        with open(inputs / "exam.pdf", "ab") as f:
+            f.write(b"\n% edited\n")
+        edited = run_batch([str(inputs)], out, workers=1, resume=True, options={"layout": "columns"}, progress=quiet)
+        assert edited["summary"]["processed"] == 1
+
+    @pytest.mark.unit
+    def test_be_unit_119_failing_file_is_recorded(self, tmp_path):
+        """BE-UNIT-119: A file that cannot be parsed is recorded as failed and retried on resume"""
+        inputs = tmp_path / "in"
+        inputs.mkdir()
+        (inputs / "broken.pdf").write_bytes(b"not a pdf")
+        out = str(tmp_path / "out")
+
+        manifest = run_batch([str(inputs)], out, workers=1, progress=quiet)
+        record = manifest["files"][str(inputs / "broken.pdf")]
+        assert record["status"] == "failed" and record["error"] and record["outputs"] == {}
+        assert manifest["summary"]["failed"] == 1 and manifest["summary"]["ok"] == 0
+
+        with open(Path(out) / "manifest.json", encoding="utf-8") as f:
+            assert json.load(f)["files"][str(inputs / "broken.pdf")]["status"] == "failed"
+        assert run_batch([str(inputs)], out, workers=1, resume=True, progress=quiet)["summary"]["processed"] == 1
+
+    @pytest.mark.unit
+    def test_be_unit_120_output_stems_never_collide(self, tmp_path):
+        """BE-UNIT-120: Documents sharing a name get distinct output stems, even in the same directory"""
+        paths = [tmp_path / "foo.pdf", tmp_path / "foo.hwp", tmp_path / "sub" / "foo.pdf", tmp_path / "bar.pdf"]
+        stems = _output_stems(paths)
+
+        assert stems[tmp_path / "bar.pdf"] == "bar"
+        assert len({stems[p] for p in paths}) == 4
+        assert all(stems[p].startswith("foo-") for p in paths[:3])
+        assert _output_stems(paths) == stems
@@ -0,0 +1,125 @@
+"""
+P2 Group: Backend Service Tests - Embedding Cache
+Test IDs: BE-UNIT-109 to BE-UNIT-111, BE-UNIT-123
+
+Run with: pytest tests/unit/backend/test_embedding_cache.py -n auto
+"""
+
+import io
+import sys
+import json
+import pytest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+PARSER_DIR = ROOT / "rails-api" / "lib" / "python_parsers"
+sys.path.insert(0, str(PARSER_DIR))
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("pdfplumber")
+
+from embedding_cache import Embedder, EmbeddingCache, LocalBackend, OpenAIBackend  # noqa: E402
+from exam_pdf_parser_v2 import Choice, ExamPDFParser, PassageItem, Question  # noqa: E402
+from text_chunker import chunk_questions  # noqa: E402
+
+SAMPLE_PDF = ROOT / "sample-data" / "제19회 사회복지사 1급_3교시_A형.pdf"
+
+
+class CountingBackend(LocalBackend):
+    """백엔드에 보낸 배치 크기를 기록하는 로컬 백엔드"""
+
+    def __init__(self, dim=64):
+        super().__init__(dim=dim)
+        self.batches = []
+
+    def embed(self, texts):
+        self.batches.append(len(texts))
+        return super().embed(texts)
+
+
+class TestEmbeddingCache:
+    """Tests for the (model, text hash) float16 embedding cache"""
+
+    @pytest.mark.unit
+    def test_be_unit_109_local_backend_is_deterministic(self):
+        """BE-UNIT-109: The local backend gives stable unit vectors that rank reworded text above unrelated"""
+        backend = LocalBackend()
+        texts = ["국민연금법상 급여의 종류가 아닌 것은?", "국민연금법상 급여의 종류에 해당하지 않는 것은?",
+                 "사회복지행정의 기획에 관한 설명으로 옳은 것은?"]
+        vectors = backend.embed(texts)
+
+        assert vectors.shape == (3, 1536) and np.allclose(np.linalg.norm(vectors, axis=1), 1.0)
+        assert np.array_equal(LocalBackend().embed(texts), vectors)
+        assert vectors[0] @ vectors[1] > vectors[0] @ vectors[2]
+        assert backend.model == "local-hash-3gram-1536"
+
+    @pytest.mark.unit
+    def test_be_unit_110_only_misses_reach_backend(self, tmp_path):
+        """BE-UNIT-110: Duplicates are sent once, misses go in batches, and cached vectors match fresh ones"""
+        backend = CountingBackend()
+        embedder = Embedder(backend, str(tmp_path / "cache.sqlite3"), batch_size=2)
+        texts = ["가", "나", "다", "가", "라", "마"]
+
+        first = embedder.embed(texts)
+        assert backend.batches == [2, 2, 1]
+        assert first.dtype == np.float32 and np.array_equal(first[0], first[3])
+        assert embedder.stats == {"texts": 6, "hits": 0, "misses": 5, "calls": 3}
+
+        again = Embedder(backend, str(tmp_path / "cache.sqlite3"))
+        assert np.array_equal(again.embed(texts[::-1]), first[::-1])
+        assert backend.batches == [2, 2, 1] and again.stats["hits"] == 5
+        assert EmbeddingCache(str(tmp_path / "cache.sqlite3")).stats()["models"] == {
+            "local-hash-3gram-64": {"entries": 5, "dim": 64}}
+
+        wrong_size = CountingBackend()
+        wrong_size.embed = lambda batch: np.zeros((len(batch), 32))
+        with pytest.raises(RuntimeError):
+            Embedder(wrong_size, cache=None).embed(["가"])
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not SAMPLE_PDF.exists(), reason="sample-data PDF not available")
+    def test_be_unit_111_reingesting_a_round_costs_no_calls(self, tmp_path):
+        """BE-UNIT-111: Re-ingesting a parsed round hits the cache; only an edited question is re-embedded"""
+        questions = ExamPDFParser(str(SAMPLE_PDF)).parse_questions()
+        backend = CountingBackend()
+        cache = str(tmp_path / "cache.sqlite3")
+
+        chunks, vectors = Embedder(backend, cache).embed_questions(questions)
+        assert len(chunks) == len(vectors) == 75 and backend.batches == [75]
+
+        questions[10].question += " (개정)"
+        embedder = Embedder(backend, cache)
+        _, again = embedder.embed_questions(questions)
+        assert backend.batches == [75, 1] and embedder.stats["misses"] == 1
+        changed = np.any(again != vectors, axis=1)
+        assert np.flatnonzero(changed).tolist() == [10]
+
+    @pytest.mark.unit
+    def test_be_unit_123_dimensions_and_explicit_zero_overlap(self, tmp_path, monkeypatch):
+        """BE-UNIT-123: OpenAI requests send dimensions, the cache keys on them, and overlap=0 is kept"""
+        import urllib.request
+        requests = []
+
+        def fake_urlopen(request, timeout):
+            payload = json.loads(request.data)
+            requests.append(payload)
+            data = [{"index": i, "embedding": [0.5] * payload["dimensions"]} for i in range(len(payload["input"]))]
+            return io.BytesIO(json.dumps({"data": data}).encode("utf-8"))
+
+        monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+        cache = str(tmp_path / "cache.sqlite3")
+        small = Embedder(OpenAIBackend(dim=256, api_key="test"), cache)
+        assert small.embed(["가", "나"]).shape == (2, 256)
+        assert requests[0]["dimensions"] == 256 and requests[0]["model"] == "text-embedding-3-small"
+
+        full = Embedder(OpenAIBackend(api_key="test"), cache)
+        assert full.embed(["가"]).shape == (1, 1536) and full.stats["misses"] == 1
+        assert set(EmbeddingCache(cache).stats()["models"]) == {"text-embedding-3-small:256",
+                                                                 "text-embedding-3-small:1536"}
+
+        long_passage = [PassageItem("ㄱ", "국민기초생활보장제도의 급여는 생계급여와 주거급여를 포함한다. " * 30)]
+        question = Question(number=3, section="사회복지법제론", question="옳은 것은?", passage=long_passage,
+                            choices=[Choice(1, "ㄱ")])
+        chunks, _ = Embedder(LocalBackend(dim=64), cache=None).embed_questions([question], max_tokens=200, overlap=0)
+        assert [c.text for c in chunks] == [c.text for c in chunk_questions([question], 200, 0)]
+        assert all(a.end <= b.start for a, b in zip(chunks, chunks[1:]))
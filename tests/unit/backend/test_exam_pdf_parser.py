@@ -0,0 +1,79 @@
+"""
+P2 Group: Backend Service Tests - Exam PDF Parser
+Test IDs: BE-UNIT-056 to BE-UNIT-057, BE-UNIT-061 to BE-UNIT-062, BE-UNIT-121
+
+Run with: pytest tests/unit/backend/test_exam_pdf_parser.py -n auto
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+PARSER_DIR = ROOT / "rails-api" / "lib" / "python_parsers"
+sys.path.insert(0, str(PARSER_DIR))
+
+pytest.importorskip("pdfplumber")
+
+from exam_pdf_parser_v2 import ExamPDFParser  # noqa: E402
+
+SAMPLE_PDF = ROOT / "sample-data" / "제19회 사회복지사 1급_2교시_A형.pdf"
+
+pytestmark = pytest.mark.skipif(not SAMPLE_PDF.exists(), reason="sample-data PDF not available")
+
+
+class TestExamPDFParser:
+    """Tests for ExamPDFParser against a sample-data paper"""
+
+    @pytest.fixture(scope="class")
+    def parsed(self):
+        parser = ExamPDFParser(str(SAMPLE_PDF))
+        parser.parse_questions()
+        return parser
+
+    @pytest.mark.unit
+    def test_be_unit_056_iter_questions_matches_parse_questions(self, parsed):
+        """BE-UNIT-056: Streaming parse yields the same questions in the same order"""
+        streaming = ExamPDFParser(str(SAMPLE_PDF))
+        questions = list(streaming.iter_questions())
+
+        assert questions == parsed.questions
+        assert streaming.sections == parsed.sections
+
+    @pytest.mark.unit
+    def test_be_unit_057_iter_questions_does_not_accumulate(self):
+        """BE-UNIT-057: Streaming parse keeps neither raw_text nor the question list"""
+        streaming = ExamPDFParser(str(SAMPLE_PDF))
+        first = next(streaming.iter_questions())
+
+        assert first.number == 1
+        assert streaming.raw_text == ""
+        assert streaming.questions == []
+
+    @pytest.mark.unit
+    def test_be_unit_061_lazy_tables_match_eager(self, parsed):
+        """BE-UNIT-061: Lazy table strategy gives the same output without scanning every page"""
+        lazy = ExamPDFParser(str(SAMPLE_PDF), table_strategy="lazy")
+        lazy.parse_questions()
+
+        assert lazy.to_dict() == parsed.to_dict()
+        assert len(lazy._tables_loaded) < lazy._page_count()
+
+    @pytest.mark.unit
+    def test_be_unit_062_rejects_unknown_table_strategy(self):
+        """BE-UNIT-062: Unknown table strategy fails at construction"""
+        with pytest.raises(ValueError):
+            ExamPDFParser(str(SAMPLE_PDF), table_strategy="sometimes")
+
+    @pytest.mark.unit
+    def test_be_unit_121_parallel_extraction_matches_serial(self, parsed, tmp_path):
+        """BE-UNIT-121: workers>1 gives byte-identical output; a 0-page document extracts to empty text"""
+        parallel = ExamPDFParser(str(SAMPLE_PDF), workers=3)
+
+        assert parallel.to_json() == parsed.to_json()
+        assert parallel.raw_text == parsed.raw_text and parallel.page_offsets == parsed.page_offsets
+
+        pypdf = pytest.importorskip("pypdf")
+        empty = tmp_path / "empty.pdf"
+        pypdf.PdfWriter().write(str(empty))
+        assert ExamPDFParser(str(empty), workers=2).extract_text() == ExamPDFParser(str(empty)).extract_text() == ""
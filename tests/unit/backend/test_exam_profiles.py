@@ -0,0 +1,86 @@
+"""
+P2 Group: Backend Service Tests - Exam Profiles
+Test IDs: BE-UNIT-077 to BE-UNIT-079, BE-UNIT-132
+
+Run with: pytest tests/unit/backend/test_exam_profiles.py -n auto
+"""
+
+import sys
+import json
+import pytest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+PARSER_DIR = ROOT / "rails-api" / "lib" / "python_parsers"
+sys.path.insert(0, str(PARSER_DIR))
+
+pytest.importorskip("pdfplumber")
+
+from exam_pdf_parser_v2 import ExamPDFParser  # noqa: E402
+from exam_profiles import PROFILE_DIR, ExamProfile, ProfileRegistry, get_registry  # noqa: E402
+
+SAMPLE_PDF = ROOT / "sample-data" / "제19회 사회복지사 1급_1교시_B형.pdf"
+
+
+TEST_SPEC = {
+    "id": "test-exam", "certification": "테스트 자격", "subject": "1교시",
+    "detect": "테스트 자격 1교시", "page_header": r"- (?P<year>\d{4}) -",
+    "section_pattern": r"과목\d", "sections": [{"start": 1, "end": 10, "name": "과목1"}]
+}
+
+
+class TestExamProfiles:
+    """Tests for declarative exam profiles and first-page detection"""
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not SAMPLE_PDF.exists(), reason="sample-data PDF not available")
+    def test_be_unit_077_detects_session_from_first_page(self):
+        """BE-UNIT-077: A 1교시 paper gets its own sections, header values and title"""
+        parser = ExamPDFParser(str(SAMPLE_PDF))
+        parser.parse_questions()
+        info = parser.exam_info()
+
+        assert info["profile"] == "social-worker-1-s1"
+        assert (info["year"], info["round"], info["subject"], info["type"]) == (2021, 19, "1교시", "B형")
+        assert parser.sections == ["사회복지기초(인간행동과 사회환경)", "사회복지기초(사회복지조사론)"]
+        assert parser.questions[0].section == "사회복지기초(인간행동과 사회환경)"
+        assert not any("( 11 -" in c.text for q in parser.questions for c in q.choices)
+        assert parser.to_markdown().startswith("# 2021년도 제19회 사회복지사 1급 1교시 B형\n")
+
+    @pytest.mark.unit
+    def test_be_unit_078_registry_compiled_once_and_extendable(self, tmp_path, monkeypatch):
+        """BE-UNIT-078: The registry is reused until a profile file changes; extra dirs are loaded"""
+        assert get_registry() is get_registry()
+
+        (tmp_path / "test.json").write_text(json.dumps(TEST_SPEC, ensure_ascii=False), encoding="utf-8")
+        monkeypatch.setenv("EXAM_PROFILE_PATH", str(tmp_path))
+
+        registry = get_registry()
+        profile = registry.detect("테스트 자격 1교시\n1. 문제 - 2024 -")
+        assert profile.id == "test-exam"
+        assert profile.header_fields("- 2024 -") == {"year": 2024}
+        assert registry.detect("사회복지정책과 제도(사회복지정책론)").id == "social-worker-1-s3"
+        assert get_registry((str(PROFILE_DIR),)).fingerprint != registry.fingerprint
+
+    @pytest.mark.unit
+    def test_be_unit_079_sections_title_and_unknown_profile(self):
+        """BE-UNIT-079: Numbers map to section ranges, titles fall back, unknown ids are rejected"""
+        profile = get_registry().get("social-worker-1-s2")
+
+        assert profile.section_for(1) == "사회복지실천(사회복지실천론)"
+        assert profile.section_for(50) == "사회복지실천(사회복지실천기술론)"
+        assert profile.section_for(76) == "Unknown"
+        assert profile.title({}) == "사회복지사 1급 2교시"
+        with pytest.raises(ValueError):
+            ExamPDFParser("exam.pdf", profile="no-such-exam")
+
+    @pytest.mark.unit
+    def test_be_unit_132_missing_default_profile_is_rejected(self, tmp_path):
+        """BE-UNIT-132: A registry whose default profile id is not loaded fails with a clear ValueError"""
+        assert ProfileRegistry([ExamProfile(TEST_SPEC)], "test-exam").default.id == "test-exam"
+        with pytest.raises(ValueError, match="social-worker-1-s3"):
+            ProfileRegistry([ExamProfile(TEST_SPEC)], "social-worker-1-s3")
+
+        (tmp_path / "test.json").write_text(json.dumps(TEST_SPEC, ensure_ascii=False), encoding="utf-8")
+        with pytest.raises(ValueError, match="기본 시험 프로필"):
+            get_registry((str(tmp_path),))
@@ -0,0 +1,126 @@
+"""
+P2 Group: Backend Service Tests - HWP/HWPX Ingestion
+Test IDs: BE-UNIT-089 to BE-UNIT-091
+
+Run with: pytest tests/unit/backend/test_hwp_reader.py -n auto
+"""
+
+import io
+import sys
+import zlib
+import struct
+import zipfile
+import pytest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+PARSER_DIR = ROOT / "rails-api" / "lib" / "python_parsers"
+sys.path.insert(0, str(PARSER_DIR))
+
+pytest.importorskip("pdfplumber")
+
+import hwp_reader  # noqa: E402
+from exam_pdf_parser_v2 import ExamPDFParser  # noqa: E402
+
+SAMPLE_HWP = ROOT / "sample-data" / "제20회 사회복지사 1급 시험 1교시 A형.hwp"
+
+HWPX_SECTION = """<?xml version="1.0" encoding="UTF-8"?>
+<hs:sec xmlns:hs="http://www.hancom.co.kr/hwpml/2011/section"
+        xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph">
+  <hp:p><hp:run><hp:ctrl><hp:footer><hp:subList>
+    <hp:p><hp:run><hp:t>2024년도 제22회 사회복지사 1급 3교시 A형 ( 12 - </hp:t></hp:run><hp:run><hp:ctrl><hp:autoNum numType="PAGE"/></hp:ctrl><hp:t> )</hp:t></hp:run></hp:p>
+  </hp:subList></hp:footer></hp:ctrl></hp:run></hp:p>
+  <hp:p><hp:run><hp:t>사회복지정책과 제도(사회복지정책론)</hp:t></hp:run></hp:p>
+  <hp:p><hp:run><hp:tbl rowCnt="1" colCnt="2"><hp:tr>
+    <hp:tc><hp:subList><hp:p><hp:run><hp:t>1.</hp:t></hp:run></hp:p></hp:subList><hp:cellAddr colAddr="0" rowAddr="0"/></hp:tc>
+    <hp:tc><hp:subList><hp:p><hp:run><hp:t>다음 표에 관한 설명으로<hp:tab/>옳은 것은?</hp:t></hp:run></hp:p></hp:subList><hp:cellAddr colAddr="1" rowAddr="0"/></hp:tc>
+  </hp:tr></hp:tbl></hp:run></hp:p>
+  <hp:p><hp:run><hp:tbl rowCnt="2" colCnt="2">
+    <hp:tr><hp:tc><hp:subList><hp:p><hp:run><hp:t>대상자</hp:t></hp:run></hp:p></hp:subList><hp:cellAddr colAddr="0" rowAddr="0"/></hp:tc>
+           <hp:tc><hp:subList><hp:p><hp:run><hp:t>급여</hp:t></hp:run></hp:p></hp:subList><hp:cellAddr colAddr="1" rowAddr="0"/></hp:tc></hp:tr>
+    <hp:tr><hp:tc><hp:subList><hp:p><hp:run><hp:t>노인</hp:t></hp:run></hp:p></hp:subList><hp:cellAddr colAddr="0" rowAddr="1"/></hp:tc>
+           <hp:tc><hp:subList><hp:p><hp:run><hp:t>현금</hp:t></hp:run></hp:p></hp:subList><hp:cellAddr colAddr="1" rowAddr="1"/></hp:tc></hp:tr>
+  </hp:tbl></hp:run></hp:p>
+  {choices}
+</hs:sec>
+"""
+
+CHOICE_ROW = ('<hp:p><hp:run><hp:tbl rowCnt="1" colCnt="2"><hp:tr>'
+              '<hp:tc><hp:subList><hp:p><hp:run><hp:t> {symbol}</hp:t></hp:run></hp:p></hp:subList>'
+              '<hp:cellAddr colAddr="0" rowAddr="0"/></hp:tc>'
+              '<hp:tc><hp:subList><hp:p><hp:run><hp:t>보기 {n}</hp:t></hp:run></hp:p></hp:subList>'
+              '<hp:cellAddr colAddr="1" rowAddr="0"/></hp:tc>'
+              '</hp:tr></hp:tbl></hp:run></hp:p>')
+
+
+def record(tag, level, body):
+    """HWP 레코드 헤더 + 내용 (4095바이트 이상이면 확장 크기)"""
+    if len(body) >= 0xFFF:
+        return struct.pack('<II', tag | level << 10 | 0xFFF << 20, len(body)) + body
+    return struct.pack('<I', tag | level << 10 | len(body) << 20) + body
+
+
+class TestHwpReader:
+    """Tests for reading HWP/HWPX sections into the parser's page contract"""
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not SAMPLE_HWP.exists(), reason="sample-data HWP not available")
+    def test_be_unit_089_parse_sample_hwp(self):
+        """BE-UNIT-089: An HWP paper parses like a PDF - header, sections, questions, choices"""
+        parser = ExamPDFParser(str(SAMPLE_HWP))
+        questions = parser.parse_questions()
+
+        assert len(questions) == 50
+        assert all(len(q.choices) == 5 for q in questions)
+        assert parser.exam_info()["round"] == 20
+        assert parser.exam_info()["subject"] == "1교시"
+        assert len(parser.sections) == 2
+        assert "2022년도" not in parser.raw_text
+        assert questions[0].question == "인간발달의 원리에 관한 설명으로 옳지 않은 것은?"
+        assert [p.marker for p in questions[3].passage] == ["ㄱ", "ㄴ", "ㄷ", "ㄹ"]
+
+        streaming = ExamPDFParser(str(SAMPLE_HWP), table_strategy="lazy")
+        assert list(streaming.iter_questions()) == questions
+
+    @pytest.mark.unit
+    def test_be_unit_090_hwpx_layout_and_data_tables(self, tmp_path):
+        """BE-UNIT-090: HWPX layout tables become lines, data tables go to page_tables"""
+        choices = "".join(CHOICE_ROW.format(symbol=s, n=i + 1) for i, s in enumerate("①②③④⑤"))
+        path = tmp_path / "exam.hwpx"
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr("mimetype", "application/hwp+zip")
+            archive.writestr("Contents/section0.xml", HWPX_SECTION.format(choices=choices))
+
+        pages = list(hwp_reader.iter_hwp_pages(str(path)))
+        assert len(pages) == 1
+        page_num, text, tables, _ = pages[0]
+        assert text.splitlines()[:3] == [
+            "2024년도 제22회 사회복지사 1급 3교시 A형 ( 12 - 1 )",
+            "사회복지정책과 제도(사회복지정책론)",
+            "1. 다음 표에 관한 설명으로 옳은 것은?",
+        ]
+        assert tables == [[["대상자", "급여"], ["노인", "현금"]]]
+
+        parser = ExamPDFParser(str(path))
+        (question,) = parser.parse_questions()
+        assert parser.exam_info()["round"] == 22
+        assert question.question == "다음 표에 관한 설명으로 옳은 것은?"
+        assert [c.text for c in question.choices] == [f"보기 {n}" for n in range(1, 6)]
+
+    @pytest.mark.unit
+    def test_be_unit_091_records_stream_across_chunks(self, monkeypatch):
+        """BE-UNIT-091: Records split across decompression chunks (incl. extended size) read back intact"""
+        text = "가나\u0009" + "\u0000" * 7 + "다\u000d"
+        records = [
+            (hwp_reader.TAG_PARA_HEADER, 0, b"\x01" * 22),
+            (hwp_reader.TAG_PARA_TEXT, 1, text.encode("utf-16-le")),
+            (hwp_reader.TAG_CTRL_HEADER, 1, b"x" * 5000),
+        ]
+        raw = b"".join(record(*r) for r in records)
+        compressor = zlib.compressobj(wbits=-15)
+        compressed = compressor.compress(raw) + compressor.flush()
+
+        monkeypatch.setattr(hwp_reader, "CHUNK_SIZE", 7)
+        assert list(hwp_reader._iter_records(io.BytesIO(compressed), compressed=True)) == records
+        assert list(hwp_reader._iter_records(io.BytesIO(raw), compressed=False)) == records
+        assert hwp_reader._para_text(records[1][2]) == "가나 다"
@@ -0,0 +1,73 @@
+"""
+P2 Group: Backend Service Tests - Streaming NDJSON Output
+Test IDs: BE-UNIT-071 to BE-UNIT-073
+
+Run with: pytest tests/unit/backend/test_ndjson_output.py -n auto
+"""
+
+import io
+import sys
+import json
+import pytest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+PARSER_DIR = ROOT / "rails-api" / "lib" / "python_parsers"
+sys.path.insert(0, str(PARSER_DIR))
+
+pytest.importorskip("pdfplumber")
+
+from exam_pdf_parser_v2 import ExamPDFParser  # noqa: E402
+
+SAMPLE_PDF = ROOT / "sample-data" / "제19회 사회복지사 1급_3교시_A형.pdf"
+
+pytestmark = pytest.mark.skipif(not SAMPLE_PDF.exists(), reason="sample-data PDF not available")
+
+
+class FlushCountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+
+class TestNDJSONOutput:
+    """Tests for line-per-question streaming output"""
+
+    @pytest.fixture(scope="class")
+    def expected(self):
+        return json.loads(ExamPDFParser(str(SAMPLE_PDF)).to_json())
+
+    @pytest.mark.unit
+    def test_be_unit_071_ndjson_records_match_to_json(self, expected):
+        """BE-UNIT-071: exam_info, one line per question and an end record rebuild to_json()"""
+        stream = FlushCountingStream()
+        total = ExamPDFParser(str(SAMPLE_PDF)).write_ndjson(stream)
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+
+        assert total == len(expected["questions"])
+        assert records[0]["type"] == "exam_info"
+        assert [r["question"] for r in records[1:-1]] == expected["questions"]
+        assert records[-1] == {"type": "end", "total_questions": total,
+                               "sections": expected["exam_info"]["sections"]}
+        assert stream.flushes == len(records)
+
+    @pytest.mark.unit
+    def test_be_unit_072_compact_ndjson_has_no_padding(self):
+        """BE-UNIT-072: Compact NDJSON lines use no separator whitespace"""
+        stream = io.StringIO()
+        ExamPDFParser(str(SAMPLE_PDF)).write_ndjson(stream, compact=True)
+        first = stream.getvalue().splitlines()[0]
+
+        assert first.startswith('{"type":"exam_info","exam_info":{"year":')
+
+    @pytest.mark.unit
+    def test_be_unit_073_compact_json_equals_indented(self, expected):
+        """BE-UNIT-073: to_json(compact=True) decodes to the same data in one line"""
+        compact = ExamPDFParser(str(SAMPLE_PDF)).to_json(compact=True)
+
+        assert "\n" not in compact
+        assert json.loads(compact) == expected
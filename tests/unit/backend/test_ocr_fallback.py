@@ -0,0 +1,166 @@
+"""
+P2 Group: Backend Service Tests - Scanned Page OCR Fallback
+Test IDs: BE-UNIT-092 to BE-UNIT-094, BE-UNIT-122, BE-UNIT-131
+
+Run with: pytest tests/unit/backend/test_ocr_fallback.py -n auto
+"""
+
+import io
+import sys
+import pytest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+PARSER_DIR = ROOT / "rails-api" / "lib" / "python_parsers"
+sys.path.insert(0, str(PARSER_DIR))
+
+pdfplumber = pytest.importorskip("pdfplumber")
+
+from exam_pdf_parser_v2 import ExamPDFParser  # noqa: E402
+from ocr_fallback import OcrBackend, OcrRouter, TesseractBackend, get_backend, is_sparse  # noqa: E402
+from page_figures import find_figures  # noqa: E402
+
+SAMPLE_PDF = ROOT / "sample-data" / "제19회 사회복지사 1급_1교시_B형.pdf"
+SAMPLE_HWP = ROOT / "sample-data" / "제20회 사회복지사 1급 시험 1교시 A형.hwp"
+
+
+class FixedTextBackend(OcrBackend):
+    """렌더링된 이미지 대신 미리 알고 있는 페이지 텍스트를 돌려주는 백엔드"""
+
+    name = 'fixed'
+
+    def __init__(self, text):
+        self.text = text
+
+    def recognize(self, image) -> str:
+        assert image.width > 0
+        return self.text
+
+
+def scanned_copy(path, pages):
+    """pages 위치의 페이지를 이미지로만 바꾼 PDF (텍스트 레이어 없음) - 원래 텍스트 {페이지: 텍스트}도 반환"""
+    pypdf = pytest.importorskip("pypdf")
+    originals = {}
+    writer = pypdf.PdfWriter()
+    source = pypdf.PdfReader(str(SAMPLE_PDF))
+    with pdfplumber.open(str(SAMPLE_PDF)) as pdf:
+        for page_num, page in enumerate(pdf.pages):
+            if page_num in pages:
+                originals[page_num] = page.extract_text()
+                buffer = io.BytesIO()
+                page.to_image(resolution=72).original.convert("RGB").save(buffer, format="PDF", resolution=72)
+                writer.add_page(pypdf.PdfReader(buffer).pages[0])
+            else:
+                writer.add_page(source.pages[page_num])
+    writer.write(str(path))
+    return originals
+
+
+class TestOcrFallback:
+    """Tests for routing only sparse pages to OCR and merging them back in order"""
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not SAMPLE_PDF.exists(), reason="sample-data PDF not available")
+    def test_be_unit_092_scanned_page_recovered_with_one_call(self, tmp_path):
+        """BE-UNIT-092: One scanned page costs one OCR call and the parse matches the digital PDF"""
+        scanned = tmp_path / "scanned.pdf"
+        originals = scanned_copy(scanned, {2})
+        expected = ExamPDFParser(str(SAMPLE_PDF)).to_dict()
+
+        assert len(ExamPDFParser(str(scanned)).parse_questions()) < len(expected["questions"])
+
+        parser = ExamPDFParser(str(scanned), trace=True, ocr=FixedTextBackend(originals[2]))
+        data = parser.to_dict()
+        assert data["questions"] == expected["questions"]
+        assert data["metrics"]["counts"]["ocr_pages"] == 1
+        assert [p["page"] for p in data["metrics"]["pages"] if "ocr" in p] == [2]
+        assert parser.config_fingerprint()["ocr"] == "fixed"
+
+        streaming = ExamPDFParser(str(scanned), ocr=FixedTextBackend(originals[2]), table_strategy="lazy")
+        assert [q.number for q in streaming.iter_questions()] == [q["number"] for q in expected["questions"]]
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not SAMPLE_PDF.exists(), reason="sample-data PDF not available")
+    def test_be_unit_093_router_keeps_page_order(self, tmp_path):
+        """BE-UNIT-093: OCR results merge back in page order; blank pages without images are not sent"""
+        scanned = tmp_path / "scanned.pdf"
+        scanned_copy(scanned, {1, 3})
+        # 2쪽은 글자 페이지 그대로라 텍스트가 비어 있어도 이미지가 없어 OCR하지 않음
+        pages = [(0, "가" * 60, [], {}), (1, "", [], {}), (2, None, [], {}), (3, " 3 ", [], {}), (4, "나" * 60, [], {})]
+        counts = {}
+
+        def count(name, n):
+            counts[name] = counts.get(name, 0) + n
+
+        router = OcrRouter(FixedTextBackend("OCR"), workers=2, read_ahead=2)
+        routed = list(router.route(str(scanned), iter(pages), count=count))
+
+        assert [page[0] for page in routed] == [0, 1, 2, 3, 4]
+        assert [page[1] for page in routed] == ["가" * 60, "OCR", None, "OCR", "나" * 60]
+        assert counts == {"ocr_pages": 2, "ocr_skipped": 1}
+
+    @pytest.mark.unit
+    def test_be_unit_094_density_check_and_backend_lookup(self):
+        """BE-UNIT-094: Glyph counts ignore whitespace; backends resolve by name, path or instance"""
+        assert is_sparse(None) and is_sparse(" \n" * 100)
+        assert not is_sparse("가" * 50)
+        assert is_sparse("가" * 50, min_glyphs=51)
+
+        backend = FixedTextBackend("x")
+        assert get_backend(backend) is backend
+        assert get_backend("tesseract").name == "tesseract"
+        assert type(get_backend("ocr_fallback:TesseractBackend")).__name__ == "TesseractBackend"
+        with pytest.raises(ValueError):
+            get_backend("paid-cloud")
+
+        from PIL import Image
+        with pytest.raises(RuntimeError):
+            TesseractBackend(command="no-such-tesseract").recognize(Image.new("L", (8, 8)))
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not SAMPLE_PDF.exists(), reason="sample-data PDF not available")
+    def test_be_unit_122_page_store_pages_go_through_ocr(self, tmp_path):
+        """BE-UNIT-122: Stored pages are OCR-routed too; OCR is left out of the fingerprint where it cannot run"""
+        scanned = tmp_path / "scanned.pdf"
+        originals = scanned_copy(scanned, {2})
+        expected = ExamPDFParser(str(SAMPLE_PDF)).to_dict()["questions"]
+        store = str(tmp_path / "pages.sqlite3")
+
+        for _ in range(2):                              # 저장 후 재사용해도 OCR 적용
+            parser = ExamPDFParser(str(scanned), page_store=store, ocr=FixedTextBackend(originals[2]))
+            assert parser.to_dict()["questions"] == expected
+            assert parser.config_fingerprint()["ocr"] == "fixed"
+        streaming = ExamPDFParser(str(scanned), page_store=store, ocr=FixedTextBackend(originals[2]))
+        assert len(list(streaming.iter_questions())) == len(expected)
+
+        stored_only = ExamPDFParser.from_page_store(parser.file_hash, store, ocr=FixedTextBackend("x"))
+        assert "ocr" not in stored_only.config_fingerprint()
+        assert stored_only.config_fingerprint() == ExamPDFParser.from_page_store(parser.file_hash, store).config_fingerprint()
+        assert "ocr" not in ExamPDFParser(str(SAMPLE_HWP), ocr=FixedTextBackend("x")).config_fingerprint()
+
+    @pytest.mark.unit
+    def test_be_unit_131_image_is_either_figure_or_scan(self, tmp_path):
+        """BE-UNIT-131: A 40% image is a figure and not OCR'd; a 60% image is OCR'd and not a figure"""
+        pypdf = pytest.importorskip("pypdf")
+        from PIL import Image
+
+        writer = pypdf.PdfWriter()
+        for width, height in ((400, 500), (500, 600)):          # A4의 약 40% / 60%
+            buffer = io.BytesIO()
+            Image.new("RGB", (width, height), "gray").save(buffer, format="PDF", resolution=72)
+            page = writer.add_blank_page(595, 842)
+            page.merge_transformed_page(pypdf.PdfReader(buffer).pages[0], pypdf.Transformation().translate(50, 50))
+        path = tmp_path / "images.pdf"
+        writer.write(str(path))
+
+        with pdfplumber.open(str(path)) as pdf:
+            assert [len(find_figures(page)) for page in pdf.pages] == [1, 0]
+        router = OcrRouter(FixedTextBackend("OCR"))
+        assert [text for _, text, _, _ in router.route(str(path), iter([(0, "", [], {}), (1, "", [], {})]))] == [
+            "", "OCR"]
+
+        class MissingRecognize(OcrBackend):
+            name = "broken"
+
+        with pytest.raises(TypeError):
+            MissingRecognize()
@@ -0,0 +1,83 @@
+"""
+P2 Group: Backend Service Tests - Single-Pass Page Extraction
+Test IDs: BE-UNIT-098 to BE-UNIT-100
+
+Run with: pytest tests/unit/backend/test_page_engine.py -n auto
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+PARSER_DIR = ROOT / "rails-api" / "lib" / "python_parsers"
+sys.path.insert(0, str(PARSER_DIR))
+
+pdfplumber = pytest.importorskip("pdfplumber")
+
+from exam_pdf_parser_v2 import ExamPDFParser  # noqa: E402
+from page_engine import extract_page  # noqa: E402
+
+SAMPLE_PDF = ROOT / "sample-data" / "제19회 사회복지사 1급_1교시_B형.pdf"
+
+
+def has_cache(page):
+    return hasattr(page, "_layout") or hasattr(page, "_objects") or page.get_textmap.cache_info().currsize > 0
+
+
+@pytest.mark.skipif(not SAMPLE_PDF.exists(), reason="sample-data PDF not available")
+class TestPageEngine:
+    """Tests for deriving text, tables and words from one layout pass"""
+
+    @pytest.mark.unit
+    def test_be_unit_098_one_pass_matches_separate_calls(self):
+        """BE-UNIT-098: Text, tables and word boxes equal the separate pdfplumber calls; the cache is freed"""
+        with pdfplumber.open(str(SAMPLE_PDF)) as pdf:
+            for page in pdf.pages[:3]:
+                expected = (page.extract_text(), page.extract_tables(), page.extract_words())
+                page.close()
+
+                extracted = extract_page(page, with_words=True)
+                assert (extracted.text, extracted.tables, extracted.words) == expected
+                assert set(extracted.timings) == {"tables", "text", "words"}
+                assert not has_cache(page)
+
+            kept = extract_page(pdf.pages[3], with_tables=False, close=False)
+            assert kept.tables == [] and has_cache(pdf.pages[3])
+
+    @pytest.mark.unit
+    def test_be_unit_099_columns_from_shared_words(self, tmp_path):
+        """BE-UNIT-099: Column text built from the shared word boxes matches extract_columns"""
+        pytest.importorskip("numpy")
+        pytest.importorskip("pypdf")
+        from benchmark_layout import make_two_column
+        from page_layout import extract_columns
+
+        merged = tmp_path / "two-column.pdf"
+        make_two_column(str(SAMPLE_PDF), str(merged))
+        with pdfplumber.open(str(merged)) as pdf:
+            page = pdf.pages[0]
+            expected_text, expected_gutter = extract_columns(page)
+            page.close()
+
+            extracted = extract_page(page, layout="columns", with_columns=True)
+            assert (extracted.text, extracted.gutter) == (expected_text, expected_gutter)
+            assert extracted.columns == expected_text
+            assert "words" not in extracted.timings
+
+        with pdfplumber.open(str(SAMPLE_PDF)) as pdf:
+            single = extract_page(pdf.pages[0], layout="columns")
+            assert single.gutter is None and single.columns is None
+            assert single.text == pdf.pages[0].extract_text()
+
+    @pytest.mark.unit
+    def test_be_unit_100_pages_do_not_keep_layout(self):
+        """BE-UNIT-100: Streaming and lazy table loading leave no page holding its layout"""
+        parser = ExamPDFParser(str(SAMPLE_PDF), table_strategy="lazy")
+        with pdfplumber.open(str(SAMPLE_PDF)) as pdf:
+            parser._open_pdf = pdf
+            pages = list(parser._read_pages(pdf))
+            parser._load_tables(range(len(pdf.pages)))
+
+            assert len(pages) == len(pdf.pages)
+            assert not any(has_cache(page) for page in pdf.pages)
@@ -0,0 +1,156 @@
+"""
+P2 Group: Backend Service Tests - Question Figures
+Test IDs: BE-UNIT-095 to BE-UNIT-097, BE-UNIT-115, BE-UNIT-126, BE-UNIT-127
+
+Run with: pytest tests/unit/backend/test_page_figures.py -n auto
+"""
+
+import io
+import sys
+import json
+import pytest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+PARSER_DIR = ROOT / "rails-api" / "lib" / "python_parsers"
+sys.path.insert(0, str(PARSER_DIR))
+
+pdfplumber = pytest.importorskip("pdfplumber")
+
+from exam_pdf_parser_v2 import ExamPDFParser  # noqa: E402
+from page_figures import _merge_boxes, find_figures  # noqa: E402
+
+SAMPLE_PDF = ROOT / "sample-data" / "제19회 사회복지사 1급_1교시_B형.pdf"
+
+
+def with_images(path, stamps):
+    """샘플 PDF의 지정 페이지에 이미지를 얹은 사본 - stamps: {페이지: [(x0, top, 너비, 높이)]}"""
+    pypdf = pytest.importorskip("pypdf")
+    from PIL import Image, ImageDraw
+
+    def image_page(width, height):
+        image = Image.new("RGB", (width, height), "white")
+        ImageDraw.Draw(image).line([0, 0, width, height], fill="black", width=3)
+        buffer = io.BytesIO()
+        image.save(buffer, format="PDF", resolution=72)
+        return pypdf.PdfReader(buffer).pages[0]
+
+    writer = pypdf.PdfWriter()
+    for page_num, page in enumerate(pypdf.PdfReader(str(SAMPLE_PDF)).pages):
+        height = float(page.mediabox.height)
+        for x0, top, width, box_height in stamps.get(page_num, []):
+            transform = pypdf.Transformation().translate(x0, height - top - box_height)
+            page.merge_transformed_page(image_page(width, box_height), transform)
+        writer.add_page(page)
+    writer.write(str(path))
+
+
+@pytest.mark.skipif(not SAMPLE_PDF.exists(), reason="sample-data PDF not available")
+class TestPageFigures:
+    """Tests for collecting figure regions and attaching them to questions"""
+
+    @pytest.mark.unit
+    def test_be_unit_095_regions_anchor_to_question_above(self, tmp_path):
+        """BE-UNIT-095: Figures anchor to the question line above; tiny and full-page images are ignored"""
+        path = tmp_path / "figures.pdf"
+        with_images(path, {1: [(400, 400, 120, 60), (60, 600, 10, 10)], 3: [(0, 0, 595, 841)]})
+
+        with pdfplumber.open(str(path)) as pdf:
+            assert find_figures(pdf.pages[1]) == [{"kind": "image", "bbox": (400.0, 400.0, 520.0, 460.0),
+                                                   "anchor": 7}]
+            assert find_figures(pdf.pages[3]) == []
+            assert find_figures(pdf.pages[0]) == []
+
+        assert _merge_boxes([(0, 0, 10, 10), (14, 0, 30, 10), (100, 100, 120, 120)]) == [
+            (0, 0, 30, 10), (100, 100, 120, 120)]
+
+    @pytest.mark.unit
+    def test_be_unit_096_only_figure_questions_get_crops(self, tmp_path):
+        """BE-UNIT-096: Only the question with a figure gets a cropped PNG and has_image"""
+        path = tmp_path / "figures.pdf"
+        with_images(path, {1: [(400, 400, 120, 60)]})
+        expected = ExamPDFParser(str(SAMPLE_PDF)).to_dict()["questions"]
+
+        parser = ExamPDFParser(str(path), figures_dir=str(tmp_path / "crops"), figure_workers=2)
+        questions = parser.to_dict()["questions"]
+        with_figures = [q for q in questions if "figures" in q]
+
+        assert [q["number"] for q in with_figures] == [7]
+        figure = with_figures[0]["figures"][0]
+        assert figure["page"] == 2 and figure["kind"] == "image"
+        name = f"figures-{parser.file_hash[:8]}_q07_p2_1.png"
+        assert Path(figure["path"]).name == name
+        assert sorted(p.name for p in (tmp_path / "crops").iterdir()) == [name]
+
+        from PIL import Image
+        assert Image.open(figure["path"]).size == (250, 125)  # 120x60pt, 150dpi
+        for question, original in zip(questions, expected):
+            question.pop("figures", None)
+            assert question == original
+
+        from rails_interchange import rails_question
+        records = [rails_question(q) for q in parser.questions]
+        assert [r["question_number"] for r in records if r["has_image"]] == [7]
+
+        streaming = ExamPDFParser(str(path), figures_dir=str(tmp_path / "crops"), table_strategy="lazy")
+        assert list(streaming.iter_questions()) == parser.questions
+
+    @pytest.mark.unit
+    def test_be_unit_097_continued_question_owns_figure_above_first_line(self):
+        """BE-UNIT-097: A figure above a page's first question belongs to the question continuing onto it"""
+        parser = ExamPDFParser(str(SAMPLE_PDF))
+        parser.page_figures = {
+            4: [{"kind": "drawing", "bbox": (50.0, 20.0, 200.0, 40.0), "anchor": None},
+                {"kind": "image", "bbox": (50.0, 300.0, 200.0, 400.0), "anchor": 20}],
+        }
+
+        continued = parser._figures_for_question(18, range(3, 5))
+        assert [(f.page, f.kind) for f in continued] == [(5, "drawing")]
+        assert [f.kind for f in parser._figures_for_question(20, range(4, 5))] == ["image"]
+        assert parser._figures_for_question(19, range(4, 5)) == []
+
+    @pytest.mark.unit
+    def test_be_unit_115_question_bank_keeps_figures(self, tmp_path):
+        """BE-UNIT-115: The columnar bank round-trips figures and its JSON equals to_json() on a paper with figures"""
+        path = tmp_path / "figures.pdf"
+        with_images(path, {1: [(400, 400, 120, 60)]})
+        parser = ExamPDFParser(str(path), figures_dir=str(tmp_path / "crops"))
+        bank = parser.to_question_bank()
+
+        assert list(bank) == parser.questions
+        assert [q.number for q in bank if q.figures] == [7]
+        assert bank.to_json() == parser.to_json()
+        assert bank.to_json(indent=None) == json.dumps(parser.to_dict(), ensure_ascii=False)
+
+    @pytest.mark.unit
+    def test_be_unit_126_same_named_documents_keep_their_crops(self, tmp_path):
+        """BE-UNIT-126: Two PDFs with the same file name write distinct crops into a shared figures directory"""
+        from PIL import Image
+
+        crops = str(tmp_path / "crops")
+        sizes = {}
+        for folder, width in (("first", 120), ("second", 200)):
+            (tmp_path / folder).mkdir()
+            path = tmp_path / folder / "exam.pdf"
+            with_images(path, {1: [(300, 400, width, 60)]})
+            figure = ExamPDFParser(str(path), figures_dir=crops).to_dict()["questions"][6]["figures"][0]
+            sizes[figure["path"]] = Image.open(figure["path"]).size
+
+        assert len(sizes) == 2 and len(list(Path(crops).iterdir())) == 2
+        assert sorted(size[0] for size in sizes.values()) == [250, 416]   # 120pt / 200pt, 150dpi
+
+    @pytest.mark.unit
+    def test_be_unit_127_page_store_keeps_figures(self, tmp_path):
+        """BE-UNIT-127: Parsing through the page store (cold and warm) finds the same figures as direct extraction"""
+        path = tmp_path / "figures.pdf"
+        with_images(path, {1: [(400, 400, 120, 60)]})
+        crops = str(tmp_path / "crops")
+        expected = ExamPDFParser(str(path), figures_dir=crops).to_dict()["questions"]
+        assert [q["number"] for q in expected if "figures" in q] == [7]
+
+        store = str(tmp_path / "pages.db")
+        for _ in ("cold", "warm"):
+            parser = ExamPDFParser(str(path), figures_dir=crops, page_store=store)
+            assert parser.to_dict()["questions"] == expected
+            streamed = ExamPDFParser(str(path), figures_dir=crops, page_store=store)
+            assert list(streamed.iter_questions()) == parser.questions
@@ -0,0 +1,88 @@
+"""
+P2 Group: Backend Service Tests - Two-Column Page Layout
+Test IDs: BE-UNIT-083 to BE-UNIT-085
+
+Run with: pytest tests/unit/backend/test_page_layout.py -n auto
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+PARSER_DIR = ROOT / "rails-api" / "lib" / "python_parsers"
+sys.path.insert(0, str(PARSER_DIR))
+
+pdfplumber = pytest.importorskip("pdfplumber")
+np = pytest.importorskip("numpy")
+
+from exam_pdf_parser_v2 import ExamPDFParser  # noqa: E402
+from page_layout import extract_columns, find_gutter, reading_regions, spanning_bands  # noqa: E402
+
+SAMPLE_PDF = ROOT / "sample-data" / "제19회 사회복지사 1급_1교시_B형.pdf"
+
+
+def column_boxes(rows=20, crossing_top=None):
+    """왼쪽 단 x 50~250, 오른쪽 단 x 300~500에 한 줄씩 단어 박스 (crossing_top에 전체 폭 줄)"""
+    boxes = []
+    for i in range(rows):
+        top = 100 + i * 15
+        boxes += [(50, top, 140, top + 10), (150, top, 250, top + 10),
+                  (300, top, 400, top + 10), (410, top, 500, top + 10)]
+    if crossing_top is not None:
+        boxes.append((200, crossing_top, 350, crossing_top + 10))
+    return np.array(boxes, dtype=float)
+
+
+class TestPageLayout:
+    """Tests for gutter detection and column-ordered extraction"""
+
+    @pytest.mark.unit
+    def test_be_unit_083_gutter_bands_and_reading_order(self):
+        """BE-UNIT-083: The gutter is found, full-width lines become bands, columns read left first"""
+        boxes = column_boxes(crossing_top=60)
+        gutter = find_gutter(boxes)
+        assert gutter == (250.0, 300.0)
+
+        bands = spanning_bands(boxes, gutter)
+        assert bands == [(60.0, 70.0)]
+        assert reading_regions((0, 0, 600, 800), gutter, bands) == [
+            (0, 0, 275.0, 60.0), (275.0, 0, 600, 60.0),
+            (0, 60.0, 600, 70.0),
+            (0, 70.0, 275.0, 800), (275.0, 70.0, 600, 800),
+        ]
+
+        single = np.array([(50, 100 + i * 15, 500, 110 + i * 15) for i in range(20)], dtype=float)
+        assert find_gutter(single) is None
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not SAMPLE_PDF.exists(), reason="sample-data PDF not available")
+    def test_be_unit_084_single_column_output_unchanged(self):
+        """BE-UNIT-084: On single-column papers the columns layout gives identical output"""
+        text = ExamPDFParser(str(SAMPLE_PDF))
+        text.parse_questions()
+        columns = ExamPDFParser(str(SAMPLE_PDF), layout="columns")
+        columns.parse_questions()
+
+        assert columns.to_dict() == text.to_dict()
+        with pytest.raises(ValueError):
+            ExamPDFParser(str(SAMPLE_PDF), layout="ocr")
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not SAMPLE_PDF.exists(), reason="sample-data PDF not available")
+    def test_be_unit_085_two_column_page_reads_in_order(self, tmp_path):
+        """BE-UNIT-085: Two pages laid side by side read back as left page then right page"""
+        pytest.importorskip("pypdf")
+        from benchmark_layout import make_two_column
+
+        merged = tmp_path / "two-column.pdf"
+        make_two_column(str(SAMPLE_PDF), str(merged))
+
+        with pdfplumber.open(str(SAMPLE_PDF)) as source, pdfplumber.open(str(merged)) as pdf:
+            expected = source.pages[0].extract_text() + "\n" + source.pages[1].extract_text()
+            page = pdf.pages[0]
+            text, gutter = extract_columns(page)
+
+            assert gutter is not None
+            assert text == expected
+            assert page.extract_text() != expected
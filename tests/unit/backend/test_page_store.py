@@ -0,0 +1,86 @@
+"""
+P2 Group: Backend Service Tests - Page Extraction Store
+Test IDs: BE-UNIT-080 to BE-UNIT-082
+
+Run with: pytest tests/unit/backend/test_page_store.py -n auto
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+PARSER_DIR = ROOT / "rails-api" / "lib" / "python_parsers"
+sys.path.insert(0, str(PARSER_DIR))
+
+pytest.importorskip("pdfplumber")
+
+from exam_pdf_parser_v2 import ExamPDFParser  # noqa: E402
+from page_store import PageStore  # noqa: E402
+
+SAMPLE_PDF = ROOT / "sample-data" / "제19회 사회복지사 1급_1교시_B형.pdf"
+
+
+class TestPageStore:
+    """Tests for re-parsing from persisted per-page extraction"""
+
+    @pytest.fixture(scope="class")
+    def store_path(self, tmp_path_factory):
+        return tmp_path_factory.mktemp("pages") / "pages.sqlite3"
+
+    @pytest.fixture(scope="class")
+    def direct(self):
+        parser = ExamPDFParser(str(SAMPLE_PDF))
+        parser.parse_questions()
+        return parser
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not SAMPLE_PDF.exists(), reason="sample-data PDF not available")
+    def test_be_unit_080_reparse_from_store_without_pdf(self, store_path, direct):
+        """BE-UNIT-080: The first parse fills the store; later parses need only the file hash"""
+        first = ExamPDFParser(str(SAMPLE_PDF), page_store=str(store_path), trace=True)
+        first.parse_questions()
+        assert first.tracer.counts["page_store_misses"] == 1
+        assert first.questions == direct.questions
+
+        again = ExamPDFParser.from_page_store(first.file_hash, str(store_path), source="missing.pdf", trace=True)
+        again.parse_questions()
+        assert again.tracer.counts["page_store_hits"] == 1
+        assert "extract_tables" not in again.tracer.stages
+        assert again.questions == direct.questions
+        assert again.exam_info() == direct.exam_info()
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not SAMPLE_PDF.exists(), reason="sample-data PDF not available")
+    def test_be_unit_081_streaming_and_lazy_from_store(self, store_path, direct):
+        """BE-UNIT-081: iter_questions and the lazy table strategy also run from the store"""
+        store = PageStore(str(store_path))
+        file_hash = store.documents()[0]["file_hash"]
+
+        streaming = ExamPDFParser.from_page_store(file_hash, store, table_strategy="lazy")
+        assert list(streaming.iter_questions()) == direct.questions
+        assert streaming.sections == direct.sections
+
+        lazy = ExamPDFParser.from_page_store(file_hash, store, table_strategy="lazy")
+        assert lazy.to_dict() == direct.to_dict()
+
+    @pytest.mark.unit
+    def test_be_unit_082_store_round_trip_and_versioning(self, tmp_path):
+        """BE-UNIT-082: Pages round-trip with tables/words; stale or partial documents are misses"""
+        store = PageStore(str(tmp_path / "pages.sqlite3"))
+        pages = [
+            (0, "1. 옳은 것은?", [[["대상자", "급여"], ["노인", "현금"]]], [[10.0, 20.0, 30.5, 31.0, "1."]]),
+            (1, None, [], []),
+        ]
+        store.put("abc", pages, source="exam.pdf")
+
+        assert store.has("abc")
+        assert store.page("abc", 0) == pages[0]
+        assert list(store.iter_pages("abc")) == [(0, pages[0][1], pages[0][2], []), (1, None, [], [])]
+
+        store.conn.execute("DELETE FROM pages WHERE page_num = 1")
+        assert not store.has("abc")
+        store.put("abc", pages)
+        store.conn.execute("UPDATE documents SET extractor = 'old'")
+        assert not store.has("abc")
+        assert store.documents()[0]["current"] is False
@@ -0,0 +1,77 @@
+"""
+P2 Group: Backend Service Tests - Parse Result Cache
+Test IDs: BE-UNIT-049 to BE-UNIT-052
+
+Run with: pytest tests/unit/backend/test_parse_cache.py -n auto
+"""
+
+import os
+import sys
+import time
+import hashlib
+import pytest
+from pathlib import Path
+
+PARSER_DIR = Path(__file__).resolve().parents[3] / "rails-api" / "lib" / "python_parsers"
+sys.path.insert(0, str(PARSER_DIR))
+
+pytest.importorskip("pdfplumber")
+
+from parse_cache import ParseCache, cache_key, file_sha256  # noqa: E402
+
+
+class TestParseCache:
+    """Tests for the SHA-256 keyed parse cache"""
+
+    @pytest.mark.unit
+    def test_be_unit_049_file_hash_matches_whole_file_sha256(self, tmp_path):
+        """BE-UNIT-049: Chunked hash equals hashlib.sha256 over the whole file"""
+        pdf_file = tmp_path / "sample.pdf"
+        pdf_file.write_bytes(b"%PDF-1.4\n" + b"x" * 50000)
+
+        expected = hashlib.sha256(pdf_file.read_bytes()).hexdigest()
+
+        assert file_sha256(str(pdf_file), chunk_size=4096) == expected
+
+    @pytest.mark.unit
+    def test_be_unit_050_key_changes_with_parser_fingerprint(self):
+        """BE-UNIT-050: Same file under a different parser version gets a new key"""
+        file_hash = "a" * 64
+
+        key_v1 = cache_key(file_hash, {"parser_version": "2.1.0"})
+        key_v2 = cache_key(file_hash, {"parser_version": "2.2.0"})
+
+        assert key_v1.startswith(file_hash)
+        assert key_v1 != key_v2
+        assert key_v1 == cache_key(file_hash, {"parser_version": "2.1.0"})
+
+    @pytest.mark.unit
+    def test_be_unit_051_put_and_get_round_trip(self, tmp_path):
+        """BE-UNIT-051: Stored questions come back unchanged"""
+        cache = ParseCache(str(tmp_path))
+        data = {"exam_info": {"total_questions": 1}, "questions": [{"number": 1, "question": "옳은 것은?"}]}
+
+        cache.put("ab" + "0" * 62, data, source="exam.pdf")
+
+        assert cache.get("ab" + "0" * 62) == data
+        assert cache.get("cd" + "0" * 62) is None
+
+    @pytest.mark.unit
+    def test_be_unit_052_evicts_least_recently_used_over_size_limit(self, tmp_path):
+        """BE-UNIT-052: Oldest unused entry is dropped when the size limit is hit"""
+        cache = ParseCache(str(tmp_path), max_bytes=10 ** 9)
+        payload = {"questions": ["x" * 1000]}
+
+        for i, key in enumerate(["aa1", "bb2", "cc3"]):
+            cache.put(key, payload)
+            past = time.time() - 100 + i
+            os.utime(cache._path(key), (past, past))
+
+        cache.get("aa1")  # aa1을 최근 사용으로 갱신
+        cache.max_bytes = cache.stats()["total_bytes"] - 1
+        removed = cache.evict()
+
+        assert removed == 1
+        assert cache.get("bb2") is None
+        assert cache.get("aa1") is not None
+        assert cache.get("cc3") is not None
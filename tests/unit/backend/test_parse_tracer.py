@@ -0,0 +1,69 @@
+"""
+P2 Group: Backend Service Tests - Parser Instrumentation
+Test IDs: BE-UNIT-065 to BE-UNIT-067
+
+Run with: pytest tests/unit/backend/test_parse_tracer.py -n auto
+"""
+
+import sys
+import json
+import pytest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+PARSER_DIR = ROOT / "rails-api" / "lib" / "python_parsers"
+sys.path.insert(0, str(PARSER_DIR))
+
+pytest.importorskip("pdfplumber")
+
+from exam_pdf_parser_v2 import ExamPDFParser  # noqa: E402
+from parse_tracer import ParseTracer  # noqa: E402
+
+SAMPLE_PDF = ROOT / "sample-data" / "제19회 사회복지사 1급_3교시_A형.pdf"
+
+
+class TestParseTracer:
+    """Tests for opt-in per-stage parser instrumentation"""
+
+    @pytest.mark.unit
+    def test_be_unit_065_stages_accumulate_and_call_hooks(self):
+        """BE-UNIT-065: Repeated stages add up and every event reaches the hooks"""
+        events = []
+        tracer = ParseTracer(hooks=[lambda event, name, data: events.append((event, name))])
+
+        for _ in range(2):
+            with tracer.stage("table_lookup"):
+                pass
+        tracer.page(0, text=0.01, chars=120)
+        tracer.count("choices", 5)
+
+        metrics = tracer.to_dict()
+        assert metrics["stages"]["table_lookup"]["calls"] == 2
+        assert metrics["pages"] == [{"page": 0, "text": 0.01, "chars": 120}]
+        assert metrics["counts"] == {"choices": 5}
+        assert events == [("stage", "table_lookup"), ("stage", "table_lookup"),
+                          ("page", "0"), ("count", "choices")]
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not SAMPLE_PDF.exists(), reason="sample-data PDF not available")
+    def test_be_unit_066_to_json_includes_metrics_block(self):
+        """BE-UNIT-066: Traced to_json() appends a metrics block covering every stage"""
+        parser = ExamPDFParser(str(SAMPLE_PDF), trace=True)
+        output = parser.to_json()
+        data = json.loads(output)
+
+        stages = data["metrics"]["stages"]
+        for name in ("extract_text", "identify_sections", "parse_questions", "to_dict", "json_dumps"):
+            assert name in stages
+        assert data["metrics"]["counts"]["questions"] == len(data["questions"])
+        assert len(data["metrics"]["pages"]) > 0
+        assert output == json.dumps(data, ensure_ascii=False, indent=2)
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not SAMPLE_PDF.exists(), reason="sample-data PDF not available")
+    def test_be_unit_067_untraced_output_has_no_metrics(self):
+        """BE-UNIT-067: Without tracing the output is unchanged"""
+        parser = ExamPDFParser(str(SAMPLE_PDF))
+
+        assert parser.tracer is None
+        assert "metrics" not in parser.to_dict()
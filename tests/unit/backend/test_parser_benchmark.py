@@ -0,0 +1,58 @@
+"""
+P2 Group: Backend Service Tests - Parser Benchmark Suite
+Test IDs: BE-UNIT-063 to BE-UNIT-064
+
+Run with: pytest tests/unit/backend/test_parser_benchmark.py -n auto
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+PARSER_DIR = Path(__file__).resolve().parents[3] / "rails-api" / "lib" / "python_parsers"
+sys.path.insert(0, str(PARSER_DIR))
+
+pytest.importorskip("pdfplumber")
+
+from parser_benchmark import compare_results  # noqa: E402
+
+
+def _result(extract_wall, sections_wall, rss):
+    stages = {
+        "extract_text": {"wall": extract_wall, "cpu": extract_wall, "peak_rss_mb": rss},
+        "identify_sections": {"wall": sections_wall, "cpu": sections_wall, "peak_rss_mb": rss},
+    }
+    return {
+        "files": {
+            "exam.pdf": {
+                "questions": 75,
+                "stages": stages,
+                "total": {"wall": extract_wall + sections_wall, "cpu": extract_wall + sections_wall,
+                          "peak_rss_mb": rss},
+            }
+        }
+    }
+
+
+class TestParserBenchmark:
+    """Tests for comparing two benchmark runs"""
+
+    @pytest.mark.unit
+    def test_be_unit_063_flags_slowdown_over_threshold(self):
+        """BE-UNIT-063: A stage that got 30% slower is reported as a regression"""
+        report = compare_results(_result(2.0, 0.5, 70.0), _result(2.6, 0.5, 70.0), threshold=0.1)
+
+        flagged = {(r["stage"], r["metric"]) for r in report["regressions"]}
+        assert ("extract_text", "wall") in flagged
+        assert ("total", "wall") in flagged
+        assert ("identify_sections", "wall") not in flagged
+
+    @pytest.mark.unit
+    def test_be_unit_064_ignores_noise_and_improvements(self):
+        """BE-UNIT-064: Sub-threshold timings and speedups are not regressions"""
+        report = compare_results(_result(2.0, 0.0001, 70.0), _result(1.5, 0.0004, 72.0),
+                                 threshold=0.1, min_seconds=0.005)
+
+        assert report["regressions"] == []
+        assert not any(r["stage"] == "identify_sections" and r["metric"] != "peak_rss_mb"
+                       for r in report["rows"])
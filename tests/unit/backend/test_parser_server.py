@@ -0,0 +1,132 @@
+"""
+P2 Group: Backend Service Tests - Persistent Parser Server
+Test IDs: BE-UNIT-046 to BE-UNIT-048, BE-UNIT-124 to BE-UNIT-125
+
+Run with: pytest tests/unit/backend/test_parser_server.py -n auto
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import signal
+import pytest
+import threading
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+PARSER_DIR = ROOT / "rails-api" / "lib" / "python_parsers"
+sys.path.insert(0, str(PARSER_DIR))
+
+pytest.importorskip("pdfplumber")
+
+from exam_pdf_parser_v2 import ExamPDFParser  # noqa: E402
+from parser_server import ParserServer  # noqa: E402
+
+SAMPLE_PDF = ROOT / "sample-data" / "제19회 사회복지사 1급_3교시_A형.pdf"
+
+
+class Responses:
+    """handle_line 응답을 모으고 id별로 기다림 (응답은 워커 풀 스레드에서 옴)"""
+
+    def __init__(self):
+        self.items = {}
+        self.changed = threading.Condition()
+
+    def write(self, response):
+        with self.changed:
+            self.items[response["id"]] = response
+            self.changed.notify_all()
+
+    def wait(self, request_id, timeout=60):
+        with self.changed:
+            assert self.changed.wait_for(lambda: request_id in self.items, timeout), f"no response for {request_id}"
+            return self.items[request_id]
+
+
+class TestParserServer:
+    """Tests for the JSON-lines parser server protocol"""
+
+    @pytest.fixture
+    def server(self):
+        server = ParserServer(workers=1)
+        yield server
+        server.executor.shutdown(wait=True)
+
+    @pytest.mark.unit
+    def test_be_unit_046_ping_returns_worker_info(self, server):
+        """BE-UNIT-046: Ping command answers without touching the worker pool"""
+        responses = []
+        server.handle_line('{"id": 1, "command": "ping"}', responses.append)
+
+        assert responses[0]["id"] == 1
+        assert responses[0]["ok"] is True
+        assert responses[0]["workers"] == 1
+
+    @pytest.mark.unit
+    def test_be_unit_047_missing_pdf_and_bad_json_are_errors(self, server):
+        """BE-UNIT-047: Invalid requests get an error response, not a crash"""
+        responses = []
+        server.handle_line('{"id": 2, "pdf_path": "/nonexistent/exam.pdf"}', responses.append)
+        server.handle_line('not json', responses.append)
+
+        assert responses[0] == {"id": 2, "ok": False, "error": "PDF file not found: /nonexistent/exam.pdf"}
+        assert responses[1]["ok"] is False
+        assert responses[1]["error"].startswith("Invalid JSON")
+
+    @pytest.mark.unit
+    def test_be_unit_048_stdio_mode_answers_every_request(self, server):
+        """BE-UNIT-048: stdio mode writes one JSON line per request"""
+        stdin = io.StringIO('{"id": "a", "command": "ping"}\n\n{"id": "b", "pdf_path": ""}\n')
+        stdout = io.StringIO()
+
+        server.serve_stdio(stdin=stdin, stdout=stdout)
+
+        lines = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        assert [r["id"] for r in lines] == ["a", "b"]
+        assert lines[0]["ok"] is True
+        assert lines[1]["ok"] is False
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not SAMPLE_PDF.exists(), reason="sample-data PDF not available")
+    def test_be_unit_124_parse_request_matches_to_json(self, server):
+        """BE-UNIT-124: A parse request through the worker pool returns the same JSON as ExamPDFParser.to_json()"""
+        stdin = io.StringIO(json.dumps({"id": 7, "pdf_path": str(SAMPLE_PDF)}) + "\n")
+        stdout = io.StringIO()
+
+        server.serve_stdio(stdin=stdin, stdout=stdout)
+
+        response = json.loads(stdout.getvalue())
+        assert response["id"] == 7 and response["ok"] is True
+        assert response["result"] == json.loads(ExamPDFParser(str(SAMPLE_PDF)).to_json())
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not SAMPLE_PDF.exists(), reason="sample-data PDF not available")
+    def test_be_unit_125_crashed_worker_pool_is_replaced(self, server):
+        """BE-UNIT-125: A worker crash fails only the in-flight request; later requests get a new pool"""
+        responses = Responses()
+        request = {"pdf_path": str(SAMPLE_PDF)}
+        first_pool = server.executor
+
+        server.handle_line(json.dumps(dict(request, id=1)), responses.write)
+        deadline = time.monotonic() + 30
+        while not first_pool._processes and time.monotonic() < deadline:
+            time.sleep(0.01)
+        for pid in list(first_pool._processes):
+            os.kill(pid, signal.SIGKILL)
+
+        crashed = responses.wait(1)
+        assert crashed["ok"] is False and crashed["error"].startswith("BrokenProcessPool")
+        assert server.executor is not first_pool
+
+        server.handle_line(json.dumps(dict(request, id=2)), responses.write)
+        assert responses.wait(2)["ok"] is True
+
+        broken = server.executor                       # 응답 전에 이미 깨진 풀에 제출해도 새 풀에서 처리
+        broken.submit(os._exit, 1)
+        deadline = time.monotonic() + 30
+        while not broken._broken and time.monotonic() < deadline:
+            time.sleep(0.01)
+        server.handle_line(json.dumps(dict(request, id=3)), responses.write)
+        assert responses.wait(3)["ok"] is True and server.executor is not broken
@@ -0,0 +1,92 @@
+"""
+P2 Group: Backend Service Tests - Columnar Question Bank
+Test IDs: BE-UNIT-068 to BE-UNIT-070, BE-UNIT-130
+
+Run with: pytest tests/unit/backend/test_question_bank.py -n auto
+"""
+
+import sys
+import json
+import pytest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+PARSER_DIR = ROOT / "rails-api" / "lib" / "python_parsers"
+sys.path.insert(0, str(PARSER_DIR))
+
+pytest.importorskip("pdfplumber")
+
+from exam_pdf_parser_v2 import ExamPDFParser, Question, PassageItem, Choice, Table  # noqa: E402
+from question_bank import QuestionBank  # noqa: E402
+
+SAMPLE_PDF = ROOT / "sample-data" / "제19회 사회복지사 1급_2교시_A형.pdf"
+
+QUESTIONS = [
+    Question(number=1, section="사회복지정책과 제도(사회복지정책론)", question="옳은 것은?",
+             passage=[PassageItem(marker="○", text="보편주의"), PassageItem(marker="ㄱ", text="선별주의")],
+             choices=[Choice(number=1, text="ㄱ"), Choice(number=2, text="ㄴ, \"ㄷ\"")]),
+    Question(number=2, section="사회복지정책과 제도(사회복지정책론)", question="표에 관한 설명은?",
+             passage=[], choices=[],
+             table=Table(headers=["구분", "대상자"], rows=[["공공부조", "저소득\n가구"]])),
+]
+
+
+class TestQuestionBank:
+    """Tests for the shared-buffer question bank"""
+
+    @pytest.mark.unit
+    def test_be_unit_068_round_trips_questions(self):
+        """BE-UNIT-068: Questions come back equal, including tables and empty lists"""
+        bank = QuestionBank.from_questions(QUESTIONS)
+
+        assert len(bank) == 2
+        assert list(bank) == QUESTIONS
+        assert bank[-1] == QUESTIONS[1]
+        assert bank.sections == ["사회복지정책과 제도(사회복지정책론)"]
+        with pytest.raises(IndexError):
+            bank[2]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("indent", [2, None])
+    def test_be_unit_069_json_matches_json_dumps(self, indent):
+        """BE-UNIT-069: Direct JSON writer equals json.dumps of the dict structure"""
+        exam_info = {"year": 2025, "round": 23, "total_questions": 0, "sections": []}
+        bank = QuestionBank.from_questions(QUESTIONS, exam_info)
+        expected = {
+            "exam_info": dict(exam_info, total_questions=2),
+            "questions": [
+                {"number": q.number, "section": q.section, "question": q.question,
+                 "passage": [{"marker": p.marker, "text": p.text} for p in q.passage],
+                 "choices": [{"number": c.number, "text": c.text} for c in q.choices],
+                 "table": q.table.to_dict() if q.table else None}
+                for q in QUESTIONS
+            ],
+        }
+
+        assert bank.to_json(indent=indent) == json.dumps(expected, ensure_ascii=False, indent=indent)
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not SAMPLE_PDF.exists(), reason="sample-data PDF not available")
+    def test_be_unit_070_parser_outputs_match(self):
+        """BE-UNIT-070: Bank JSON/CSV equal ExamPDFParser.to_json()/to_csv() on a sample paper"""
+        parser = ExamPDFParser(str(SAMPLE_PDF))
+        bank = parser.to_question_bank()
+
+        assert bank.to_json() == parser.to_json()
+        assert bank.to_csv() == parser.to_csv()
+
+    @pytest.mark.unit
+    def test_be_unit_130_reads_between_adds(self):
+        """BE-UNIT-130: Reading after every add keeps each earlier chunk and returns the right text"""
+        empty = Question(number=3, section="사회복지정책과 제도(사회복지정책론)", question="",
+                         passage=[], choices=[Choice(number=1, text="")])
+        added = QUESTIONS + [empty] + QUESTIONS
+        bank = QuestionBank()
+        for i, question in enumerate(added):
+            bank.add(question)
+            assert bank[i] == question and bank[0] == added[0]
+
+        chunks = list(bank._chunks)
+        assert list(bank) == added
+        assert bank._chunks == chunks and "".join(chunks) == "".join(
+            t for q in added for t in [q.question] + [p.text for p in q.passage] + [c.text for c in q.choices])
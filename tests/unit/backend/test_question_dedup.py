@@ -0,0 +1,159 @@
+"""
+P2 Group: Backend Service Tests - Near-Duplicate Questions
+Test IDs: BE-UNIT-101 to BE-UNIT-103, BE-UNIT-116, BE-UNIT-129
+
+Run with: pytest tests/unit/backend/test_question_dedup.py -n auto
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+PARSER_DIR = ROOT / "rails-api" / "lib" / "python_parsers"
+sys.path.insert(0, str(PARSER_DIR))
+
+pytest.importorskip("numpy")
+pytest.importorskip("pdfplumber")
+
+from exam_pdf_parser_v2 import Choice, ExamPDFParser, PassageItem, Question  # noqa: E402
+from question_dedup import DuplicateIndex, normalize  # noqa: E402
+
+PAPER_A = ROOT / "sample-data" / "제19회 사회복지사 1급_3교시_A형.pdf"
+PAPER_B = ROOT / "sample-data" / "제19회 사회복지사 1급_3교시_B형.pdf"
+
+
+def question(number, text, choices, passage=()):
+    return Question(number=number, section="사회복지정책론", question=text,
+                    passage=[PassageItem(marker, item) for marker, item in passage],
+                    choices=[Choice(i, choice) for i, choice in enumerate(choices, 1)])
+
+
+ORIGINAL = question(1, "국민연금법상 급여의 종류에 해당하는 것을 모두 고른 것은?",
+                    ["노령연금", "장애연금", "유족연금", "반환일시금", "장애인연금"],
+                    [("ㄱ", "노령연금은 가입기간이 10년 이상인 가입자에게 지급한다."),
+                     ("ㄴ", "유족연금은 가입자가 사망하면 그 유족에게 지급한다.")])
+REWORDED = question(7, "국민연금법 상 급여의 종류로 해당하는 것을 모두 고른 것은 ?",
+                    ["유족연금", "노령연금", "반환일시금", "장애연금", "장애인 연금"],
+                    [("ㄱ", "노령연금은 가입기간이 10년 이상인 가입자에게 지급 한다."),
+                     ("ㄴ", "유족연금이 가입자가 사망하면 그 유족에게 지급한다.")])
+UNRELATED = question(2, "사회복지행정의 기획에 관한 설명으로 옳지 않은 것은?",
+                     ["기획은 미래지향적이다.", "기획은 목표지향적이다.", "기획은 과정지향적이다.",
+                      "기획은 효율성과 관계없다.", "기획은 불확실성을 줄인다."])
+
+
+@pytest.fixture(scope="module")
+def papers():
+    parsed = []
+    for path in (PAPER_A, PAPER_B):
+        parser = ExamPDFParser(str(path))
+        parsed.append((parser.parse_questions(), parser.exam_info()))
+    return parsed
+
+
+class TestQuestionDedup:
+    """Tests for MinHash/LSH near-duplicate clustering across exam papers"""
+
+    @pytest.mark.unit
+    def test_be_unit_101_reworded_question_clusters(self):
+        """BE-UNIT-101: Spacing, particle and choice-order changes still cluster; other questions do not"""
+        assert normalize("국민연금법 상 급여의 종류로,") == normalize("국민연금법상 급여의 종류에") == "국민연금법상급여종류"
+
+        index = DuplicateIndex()
+        assert index.add(ORIGINAL, ("19", 1)) == []
+        assert index.add(UNRELATED, ("19", 2)) == []
+        matches = index.add(REWORDED, ("20", 7))
+
+        assert [key for key, _ in matches] == [("19", 1)] and matches[0][1] >= 0.6
+        assert index.add(question(3, "", []), ("20", 8)) == []
+        assert index.add(question(4, "", []), ("20", 9)) == []
+        assert index.clusters() == [[("19", 1), ("20", 7)]]
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not (PAPER_A.exists() and PAPER_B.exists()), reason="sample-data PDF not available")
+    def test_be_unit_102_a_and_b_papers_pair_up(self, papers):
+        """BE-UNIT-102: Every question of the 19th-round B paper pairs with one shuffled A-paper question"""
+        index = DuplicateIndex()
+        (questions_a, info_a), (questions_b, info_b) = papers
+        assert index.add_exam(questions_a, info_a) == []
+        pairs = index.add_exam(questions_b, info_b)
+
+        clusters = index.clusters()
+        assert len(clusters) == len(questions_b) == 75
+        assert all([key[2] for key in cluster] == ["A형", "B형"] for cluster in clusters)
+        assert [cluster[1][3] for cluster in clusters] != [cluster[0][3] for cluster in clusters]
+        assert {(new, old) for new, old, _ in pairs} == {(b, a) for a, b in clusters}
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not (PAPER_A.exists() and PAPER_B.exists()), reason="sample-data PDF not available")
+    def test_be_unit_103_incremental_matches_batch(self, papers, tmp_path):
+        """BE-UNIT-103: Adding a paper to a saved index gives the same clusters as building at once"""
+        (questions_a, info_a), (questions_b, info_b) = papers
+        batch = DuplicateIndex()
+        batch.add_exam(questions_a, info_a)
+        batch.add_exam(questions_b, info_b)
+
+        first = DuplicateIndex()
+        first.add_exam(questions_a, info_a)
+        first.save(str(tmp_path / "dedup.npz"))
+        incremental = DuplicateIndex.load(str(tmp_path / "dedup.npz"))
+        assert incremental.query(questions_b[0]) and len(incremental) == len(questions_a)
+        incremental.add_exam(questions_b, info_b)
+
+        assert incremental.clusters() == batch.clusters()
+        assert incremental.keys == batch.keys
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not (PAPER_A.exists() and PAPER_B.exists()), reason="sample-data PDF not available")
+    def test_be_unit_116_reingesting_a_paper_is_idempotent(self, papers, tmp_path):
+        """BE-UNIT-116: Re-adding an indexed paper changes nothing; an edited question replaces its row"""
+        (questions_a, info_a), (questions_b, info_b) = papers
+        index = DuplicateIndex()
+        index.add_exam(questions_a, info_a)
+        index.add_exam(questions_b, info_b)
+        clusters = index.clusters()
+
+        assert index.add_exam(questions_a, info_a) == [] and len(index) == 150
+        index.save(str(tmp_path / "dedup.npz"))
+        reloaded = DuplicateIndex.load(str(tmp_path / "dedup.npz"))
+        assert reloaded.add_exam(questions_b, info_b) == []
+        assert len(reloaded) == 150 and reloaded.clusters() == clusters
+
+        edited = question(questions_a[9].number, "사회복지행정의 기획에 관한 설명으로 옳지 않은 것은?",
+                          ["목표 지향적", "미래 지향적", "과정 지향적", "계속적 과정", "일회성 활동"])
+        key = (info_a["round"], info_a["subject"], info_a["type"], edited.number)
+        assert reloaded.add(edited, key) == []
+        assert len(reloaded) == 150 and len(reloaded.clusters()) == 74
+        assert all(key not in cluster for cluster in reloaded.clusters())
+        assert reloaded.add(questions_a[9], key) == [
+            (other, score) for other, score in reloaded.query(questions_a[9]) if other != key]
+        assert reloaded.clusters() == clusters
+
+    @pytest.mark.unit
+    def test_be_unit_129_edit_moves_one_entry(self, monkeypatch):
+        """BE-UNIT-129: Editing a question regroups only its old and new clusters and matches a fresh build"""
+        welfare = question(5, "아동복지법상 아동학대 신고의무자에 해당하지 않는 사람은?",
+                           ["교사", "의사", "사회복지전담공무원", "아동의 부모", "보육교직원"])
+        index = DuplicateIndex()
+        for key, item in [(("19", 1), ORIGINAL), (("19", 2), UNRELATED), (("19", 5), welfare),
+                          (("20", 7), REWORDED), (("20", 2), UNRELATED), (("20", 5), welfare)]:
+            index.add(item, key)
+        assert index.clusters() == [[("19", 1), ("20", 7)], [("19", 2), ("20", 2)], [("19", 5), ("20", 5)]]
+        untouched = {i: index._parent[i] for i in (2, 5)}
+        visited = []
+        band_keys = index._band_keys
+        monkeypatch.setattr(index, "_band_keys", lambda signature: visited.append(signature) or band_keys(signature))
+
+        matches = index.add(question(7, UNRELATED.question, [c.text for c in UNRELATED.choices]), ("20", 7))
+        assert sorted(key for key, _ in matches) == [("19", 2), ("20", 2)]
+        assert index.clusters() == [[("19", 2), ("20", 7), ("20", 2)], [("19", 5), ("20", 5)]]
+        assert {i: index._parent[i] for i in (2, 5)} == untouched
+        assert not any(signature is index._signatures[i] for signature in visited for i in (2, 5))
+
+        fresh = DuplicateIndex()
+        for key, item in [(("19", 1), ORIGINAL), (("19", 2), UNRELATED), (("19", 5), welfare),
+                          (("20", 7), UNRELATED), (("20", 2), UNRELATED), (("20", 5), welfare)]:
+            fresh.add(item, key)
+        assert fresh.clusters() == index.clusters()
+        assert [key for key, _ in index.add(REWORDED, ("20", 7))] == [("19", 1)]
+        assert len(index.clusters()) == 3 and index.clusters()[0] == [("19", 1), ("20", 7)]
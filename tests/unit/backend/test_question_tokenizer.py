@@ -0,0 +1,110 @@
+"""
+P2 Group: Backend Service Tests - Question Block Tokenizer
+Test IDs: BE-UNIT-053 to BE-UNIT-055
+
+Run with: pytest tests/unit/backend/test_question_tokenizer.py -n auto
+"""
+
+import re
+import sys
+import pytest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+PARSER_DIR = ROOT / "rails-api" / "lib" / "python_parsers"
+sys.path.insert(0, str(PARSER_DIR))
+
+pytest.importorskip("pdfplumber")
+
+from exam_pdf_parser_v2 import ExamPDFParser, Patterns, _tokenize_block  # noqa: E402
+
+GOLDEN_PDF = ROOT / "sample-data" / "제19회 사회복지사 1급_3교시_A형.pdf"
+
+
+def _clean(text):
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def reference_split(text):
+    """정규식을 여러 번 적용하던 기존 추출 로직 (비교 기준)"""
+    question = ""
+    passage = []
+    remaining = text
+
+    for pattern in [r'^(.+?것은\s*\?)', r'^(.+?[가-힣]+은\s*\?)',
+                    r'^(.+?[가-힣]+를\s*\?)', r'^(.+?\?\s*)']:
+        match = re.match(pattern, text, re.DOTALL)
+        if match:
+            question = _clean(match.group(1))
+            remaining = text[match.end():]
+            break
+
+    if not question:
+        first_marker = re.search(r'(○|[ㄱ-ㅎ]\.)', remaining)
+        first_choice = re.search(r'[①②③④⑤]', remaining)
+        cut = first_marker or first_choice
+        if cut:
+            question = _clean(remaining[:cut.start()])
+            remaining = remaining[cut.start():]
+
+    circle = r'○\s*([^○①②③④⑤]+?)(?=○|[①②③④⑤]|$)'
+    passage += [('○', _clean(c)) for c in re.findall(circle, remaining, re.DOTALL) if _clean(c)]
+    remaining = re.sub(circle, '', remaining, flags=re.DOTALL)
+
+    jamo = r'([ㄱ-ㅎ])\.\s*([^ㄱ-ㅎ①②③④⑤]+?)(?=[ㄱ-ㅎ]\.|[①②③④⑤]|$)'
+    passage += [(m, _clean(c)) for m, c in re.findall(jamo, remaining, re.DOTALL) if _clean(c)]
+    remaining = re.sub(jamo, '', remaining, flags=re.DOTALL)
+
+    choice = r'([①②③④⑤])\s*([^①②③④⑤]+?)(?=[①②③④⑤]|$)'
+    choices = [('①②③④⑤'.index(s) + 1, _clean(c)) for s, c in re.findall(choice, remaining, re.DOTALL)]
+
+    return question, passage, choices, remaining
+
+
+def tokenized(text):
+    question, passage, choices, remaining = _tokenize_block(text)
+    return (question, [(p.marker, p.text) for p in passage],
+            [(c.number, c.text) for c in choices], remaining)
+
+
+class TestQuestionTokenizer:
+    """Tests for the single-pass question/passage/choice tokenizer"""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("block", [
+        "다음 설명에 해당하는 것은?\n○ 자기규제를 통해 보호한다.\n○ 행동기준이다.\n① 윤리강령 ② 전문직 문화",
+        "옳은 것을 모두 고른 것은?\nㄱ. 인도주의 ㄴ. 민주주의 ㄷ. 개인주의\n① ㄱ, ㄴ ② ㄴ, ㄷ ③ ㄱ, ㄴ, ㄷ",
+        "정책결정모형은 무엇인가? 설명을 고른 것은 ?\n① 가 ② 나\n",
+        "물음표 없는 질문\nㄱ. 항목 ㄴ 마침표 없음 ㄷ. 다음\n① 하나",
+        "○ ① 빈 지문 ○\n",
+        "보기만 있음 ① ②  ③\t④ ⑤",
+        "",
+    ])
+    def test_be_unit_053_matches_regex_pipeline_on_edge_cases(self, block):
+        """BE-UNIT-053: Tokenizer output equals the multi-pass regex extraction"""
+        assert tokenized(block) == reference_split(block)
+
+    @pytest.mark.unit
+    def test_be_unit_054_choice_numbers_follow_circle_symbols(self):
+        """BE-UNIT-054: Choices keep their ①~⑤ numbers and cleaned text"""
+        question, passage, choices, _ = tokenized(
+            "해당하지 않는 것은?\n① 재가복지센터 ② 아동상담소\n③ 주간보호센터"
+        )
+
+        assert question == "해당하지 않는 것은?"
+        assert passage == []
+        assert choices == [(1, "재가복지센터"), (2, "아동상담소"), (3, "주간보호센터")]
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not GOLDEN_PDF.exists(), reason="sample-data PDF not available")
+    def test_be_unit_055_golden_corpus_blocks_match(self):
+        """BE-UNIT-055: Every question block of a sample paper tokenizes identically"""
+        parser = ExamPDFParser(str(GOLDEN_PDF))
+        raw_text = parser.extract_text()
+        matches = list(Patterns.QUESTION_START.finditer(raw_text))
+
+        assert len(matches) >= 75
+        for i, match in enumerate(matches):
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(raw_text)
+            block = raw_text[match.end():end]
+            assert tokenized(block) == reference_split(block), f"question {match.group(1)}"
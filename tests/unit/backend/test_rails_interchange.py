@@ -0,0 +1,73 @@
+"""
+P2 Group: Backend Service Tests - MessagePack Interchange
+Test IDs: BE-UNIT-074 to BE-UNIT-076
+
+Run with: pytest tests/unit/backend/test_rails_interchange.py -n auto
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+PARSER_DIR = ROOT / "rails-api" / "lib" / "python_parsers"
+sys.path.insert(0, str(PARSER_DIR))
+
+pytest.importorskip("pdfplumber")
+msgpack = pytest.importorskip("msgpack")
+
+from exam_pdf_parser_v2 import ExamPDFParser, Question, PassageItem, Choice  # noqa: E402
+from rails_interchange import (  # noqa: E402
+    SCHEMA_VERSION, decode_msgpack, encode_msgpack, rails_question
+)
+
+SAMPLE_PDF = ROOT / "sample-data" / "제19회 사회복지사 1급_3교시_A형.pdf"
+
+
+class TestRailsInterchange:
+    """Tests for the Rails-shaped MessagePack payload"""
+
+    @pytest.mark.unit
+    def test_be_unit_074_record_matches_bridge_transform(self):
+        """BE-UNIT-074: Records carry the same fields transform_questions used to build"""
+        question = Question(
+            number=7, section="사회복지정책과 제도(사회복지행정론)", question="옳은 것을 모두 고른 것은?",
+            passage=[PassageItem(marker="ㄱ", text="기획"), PassageItem(marker="ㄴ", text="조직")],
+            choices=[Choice(number=1, text="ㄱ"), Choice(number=3, text="ㄱ, ㄴ")],
+        )
+
+        assert rails_question(question) == {
+            "question_number": 7,
+            "content": "옳은 것을 모두 고른 것은?",
+            "options": {"①": "ㄱ", "③": "ㄱ, ㄴ"},
+            "answer": None,
+            "explanation": None,
+            "passage": "ㄱ 기획\nㄴ 조직",
+            "topic": "사회복지정책과 제도(사회복지행정론)",
+            "difficulty": None,
+            "has_table": False,
+            "has_image": False,
+            "metadata": {"section": "사회복지정책과 제도(사회복지행정론)", "table": None,
+                         "passage_items": 2, "choices_count": 2},
+        }
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not SAMPLE_PDF.exists(), reason="sample-data PDF not available")
+    def test_be_unit_075_payload_round_trip(self):
+        """BE-UNIT-075: Encoded sample paper decodes to versioned schema with every question"""
+        parser = ExamPDFParser(str(SAMPLE_PDF))
+        payload = decode_msgpack(encode_msgpack(parser))
+
+        assert payload["version"] == SCHEMA_VERSION
+        assert payload["exam_info"]["total_questions"] == len(parser.questions)
+        assert [q["question_number"] for q in payload["questions"]] == [q.number for q in parser.questions]
+        assert all(set(q["options"]) <= set("①②③④⑤") for q in payload["questions"])
+
+    @pytest.mark.unit
+    def test_be_unit_076_rejects_unknown_schema_version(self):
+        """BE-UNIT-076: A payload from a newer schema version is refused"""
+        data = msgpack.packb({"schema": "certigraph.exam_questions", "version": SCHEMA_VERSION + 1,
+                              "questions": []})
+
+        with pytest.raises(ValueError):
+            decode_msgpack(data)
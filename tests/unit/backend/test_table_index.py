@@ -0,0 +1,80 @@
+"""
+P2 Group: Backend Service Tests - Table to Question Index
+Test IDs: BE-UNIT-058 to BE-UNIT-060, BE-UNIT-128
+
+Run with: pytest tests/unit/backend/test_table_index.py -n auto
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+PARSER_DIR = Path(__file__).resolve().parents[3] / "rails-api" / "lib" / "python_parsers"
+sys.path.insert(0, str(PARSER_DIR))
+
+pytest.importorskip("pdfplumber")
+
+from exam_pdf_parser_v2 import ExamPDFParser, TableIndex  # noqa: E402
+from page_store import PageStore  # noqa: E402
+
+TABLE_QUESTION = "대상자별 사회복지 주체와 권리수준을 나타낸 표로 옳은 것은?\n① 가 ② 나 ③ 다 ④ 라 ⑤ 마"
+WELFARE_TABLE = [
+    ["구분", "대상자", "권리 수준"],
+    ["공공부조", "저소득층", "높음"],
+]
+POLICY_TABLE = [
+    ["정책", "주체", "재원"],
+    ["사회보험", "국가", "보험료"],
+]
+
+
+class TestTableIndex:
+    """Tests for the per-document table index used to attach tables to questions"""
+
+    @pytest.mark.unit
+    def test_be_unit_058_matches_headers_ignoring_whitespace(self):
+        """BE-UNIT-058: Header cells split by PDF line breaks still match the question"""
+        index = TableIndex.from_page_tables({3: [WELFARE_TABLE]})
+
+        assert index.find("다음 표의 대상자와 권리수준에 관한 설명으로 옳은 것은?", range(3, 4)) == WELFARE_TABLE
+        assert index.find("대상자에 관한 설명으로 옳은 것은?", range(3, 4)) is None
+
+    @pytest.mark.unit
+    def test_be_unit_059_prefers_tables_on_question_pages(self):
+        """BE-UNIT-059: Only tables on the question's own pages match, never one from an earlier page"""
+        other = [["대상자", "권리 수준"], ["아동", "낮음"]]
+        index = TableIndex.from_page_tables({1: [other], 5: [WELFARE_TABLE, POLICY_TABLE]})
+        question = "대상자별 권리 수준을 비교한 것은?"
+
+        assert index.find(question, range(5, 6)) == WELFARE_TABLE
+        assert index.find(question, range(1, 2)) == other
+        assert index.find(question, range(8, 9)) is None
+
+    @pytest.mark.unit
+    def test_be_unit_060_parser_attaches_table_from_index(self):
+        """BE-UNIT-060: A table-indicator question gets its table without per-question keywords"""
+        parser = ExamPDFParser("unused.pdf")
+        parser.page_tables = {2: [[], [["헤더만"]], POLICY_TABLE, WELFARE_TABLE]}
+
+        question = parser._build_question(
+            9, "대상자별 사회복지 주체와 권리수준을 나타낸 표로 옳은 것은?\n① 가 ② 나", range(2, 3)
+        )
+
+        assert question.table is not None
+        assert question.table.headers == WELFARE_TABLE[0]
+        assert question.table.rows == WELFARE_TABLE[1:]
+
+    @pytest.mark.unit
+    def test_be_unit_128_streaming_tables_match_batch(self, tmp_path):
+        """BE-UNIT-128: iter_questions attaches the same tables as parse_questions across pages"""
+        store = PageStore(str(tmp_path / "pages.sqlite3"))
+        store.put("abc", [
+            (0, "1. " + TABLE_QUESTION, [WELFARE_TABLE], []),
+            (1, "2. 사회보험에 관한 설명으로 옳은 것은?\n① 가 ② 나 ③ 다 ④ 라 ⑤ 마", [POLICY_TABLE], []),
+            (2, "3. " + TABLE_QUESTION, [], []),
+            (3, "4. " + TABLE_QUESTION, [WELFARE_TABLE], []),
+        ])
+
+        batch = ExamPDFParser.from_page_store("abc", store).parse_questions()
+        assert [q.table is not None for q in batch] == [True, False, False, True]
+        assert list(ExamPDFParser.from_page_store("abc", store).iter_questions()) == batch
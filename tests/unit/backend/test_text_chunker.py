@@ -0,0 +1,59 @@
+"""
+P2 Group: Backend Service Tests - Token-Aware Chunking
+Test IDs: BE-UNIT-107 to BE-UNIT-108
+
+Run with: pytest tests/unit/backend/test_text_chunker.py -n auto
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+PARSER_DIR = ROOT / "rails-api" / "lib" / "python_parsers"
+sys.path.insert(0, str(PARSER_DIR))
+
+pytest.importorskip("numpy")
+pytest.importorskip("pdfplumber")
+
+from exam_pdf_parser_v2 import Choice, ExamPDFParser, PassageItem, Question  # noqa: E402
+from text_chunker import chunk_text, count_tokens, question_chunks, chunk_questions  # noqa: E402
+
+SAMPLE_PDF = ROOT / "sample-data" / "제19회 사회복지사 1급_3교시_A형.pdf"
+
+
+class TestTextChunker:
+    """Tests for token-count chunking of question and passage text"""
+
+    @pytest.mark.unit
+    def test_be_unit_107_chunks_respect_token_budget(self):
+        """BE-UNIT-107: Chunks stay within the token budget, overlap, cover the text and end at sentences"""
+        assert count_tokens("사회복지") == 4 and count_tokens("welfare state") == 3
+
+        text = "".join(f"{i}번째 문장은 사회보장기본법의 목적을 설명한다. " for i in range(80))
+        chunks = chunk_text(text, max_tokens=100, overlap=20)
+
+        assert len(chunks) > 5 and all(chunk.tokens <= 100 for chunk in chunks)
+        assert chunks[0].start == 0 and chunks[-1].end == len(text.rstrip())
+        assert all(chunk.text == text[chunk.start:chunk.end] for chunk in chunks)
+        assert all(b.start < a.end for a, b in zip(chunks, chunks[1:]))
+        assert all(chunk.text.endswith("다.") for chunk in chunks[:-1])
+
+        with pytest.raises(ValueError):
+            chunk_text(text, max_tokens=64, overlap=64)
+
+    @pytest.mark.unit
+    def test_be_unit_108_question_chunks_keep_source(self):
+        """BE-UNIT-108: A question becomes one chunk unless it is long; every chunk keeps its number"""
+        long_passage = [PassageItem("ㄱ", "국민기초생활보장제도의 급여는 생계급여와 주거급여를 포함한다. " * 30)]
+        question = Question(number=12, section="사회복지법제론", question="옳은 것은?", passage=long_passage,
+                            choices=[Choice(1, "ㄱ"), Choice(2, "ㄴ")])
+        chunks = question_chunks(question, max_tokens=200, overlap=32)
+        assert len(chunks) > 1 and {chunk.source for chunk in chunks} == {12}
+        assert chunks[0].text.startswith("옳은 것은?\nㄱ. ") and chunks[-1].text.endswith("① ㄱ\n② ㄴ")
+
+        if SAMPLE_PDF.exists():
+            questions = ExamPDFParser(str(SAMPLE_PDF)).parse_questions()
+            sample = chunk_questions(questions)
+            assert [chunk.source for chunk in sample] == [q.number for q in questions]
+            assert all("①" in chunk.text and chunk.tokens <= 512 for chunk in sample)
@@ -0,0 +1,97 @@
+"""
+P2 Group: Backend Service Tests - Local Vector Index
+Test IDs: BE-UNIT-104 to BE-UNIT-106
+
+Run with: pytest tests/unit/backend/test_vector_index.py -n auto
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+PARSER_DIR = ROOT / "rails-api" / "lib" / "python_parsers"
+sys.path.insert(0, str(PARSER_DIR))
+
+np = pytest.importorskip("numpy")
+
+from vector_index import VectorIndex  # noqa: E402
+
+DIM = 64
+
+
+def clustered(count, seed=0, clusters=20):
+    """군집이 있는 단위 벡터 (실제 문제 임베딩처럼 주제별로 모임)"""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, DIM))
+    vectors = centers[rng.integers(0, clusters, count)] + 0.3 * rng.normal(size=(count, DIM))
+    return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+
+def brute_force(vectors, queries, k):
+    return np.argsort(-(queries @ vectors.T), axis=1, kind="stable")[:, :k]
+
+
+class TestVectorIndex:
+    """Tests for the memory-mapped IVF/PQ dot-product index"""
+
+    @pytest.mark.unit
+    def test_be_unit_104_exact_search_matches_dot_product(self, tmp_path):
+        """BE-UNIT-104: Before training, batched top-k equals brute-force dot product in query order"""
+        vectors = clustered(300)
+        queries = clustered(5, seed=1)
+        index = VectorIndex(str(tmp_path / "index"), dim=DIM)
+        index.add([f"q-{i}" for i in range(300)], vectors)
+
+        results = index.search(queries, k=5)
+        expected = brute_force(vectors, queries, 5)
+        assert not index.trained and len(results) == 5
+        for found, rows, query in zip(results, expected, queries):
+            assert [key for key, _ in found] == [f"q-{row}" for row in rows]
+            assert [score for _, score in found] == pytest.approx((vectors[rows] @ query).tolist(), rel=1e-5)
+
+        with pytest.raises(ValueError):
+            index.search(np.zeros((1, DIM + 1)))
+
+    @pytest.mark.unit
+    def test_be_unit_105_ivf_pq_recall_and_reopen(self, tmp_path):
+        """BE-UNIT-105: A float16 IVF+PQ build keeps high recall and reopens from disk unchanged"""
+        vectors = clustered(4000)
+        queries = vectors[:40] + 0.01
+        ids = [f"q-{i}" for i in range(4000)]
+        index = VectorIndex(str(tmp_path / "index"), dim=DIM, dtype="float16", pq_subspaces=16)
+        index.build(ids, vectors)
+
+        assert index.trained and index.stats()["nlist"] == 63
+        results = index.search(queries, k=10)
+        expected = brute_force(vectors, queries, 10)
+        recall = np.mean([len({key for key, _ in found} & {f"q-{row}" for row in rows}) / 10
+                          for found, rows in zip(results, expected)])
+        assert recall >= 0.9
+        assert all(found[0][0] == f"q-{i}" for i, found in enumerate(results))
+
+        reopened = VectorIndex(str(tmp_path / "index"))
+        assert (reopened.dtype, reopened.pq_subspaces, len(reopened)) == ("float16", 16, 4000)
+        assert reopened.search(queries, k=10) == results
+
+    @pytest.mark.unit
+    def test_be_unit_106_incremental_add_delete(self, tmp_path):
+        """BE-UNIT-106: Added rows are found, deleted ids never return, and re-adding an id replaces it"""
+        vectors = clustered(1000)
+        path = str(tmp_path / "index")
+        index = VectorIndex(path, dim=DIM, pq_subspaces=8)
+        index.build([f"q-{i}" for i in range(900)], vectors[:900])
+
+        index.add([f"q-{i}" for i in range(900, 1000)], vectors[900:])
+        assert index.search(vectors[950], k=1)[0][0][0] == "q-950"
+
+        assert index.delete(["q-3", "q-950", "missing"]) == 2
+        index.add(["q-7"], vectors[3])
+        found = index.search(vectors[[3, 950]], k=3)
+        assert found[0][0][0] == "q-7" and all(key not in ("q-3", "q-950") for key, _ in found[0] + found[1])
+        assert len(index) == 998
+
+        index.compact()
+        reopened = VectorIndex(path)
+        assert reopened.stats()["rows"] == len(reopened) == 998
+        assert reopened.search(vectors[[3, 950]], k=3) == found